@@ -1,6 +1,7 @@
 """Application use cases (Phase 5)."""
 
 from anivault.application.use_cases.build_groups_use_case import BuildGroupsUseCase
+from anivault.application.use_cases.match_cache_use_case import MatchCacheUseCase
 from anivault.application.use_cases.match_use_case import MatchUseCase
 from anivault.application.use_cases.organize_use_case import OrganizeUseCase
 from anivault.application.use_cases.run_use_case import RunResult, RunStepResult, RunUseCase
@@ -9,6 +10,7 @@ from anivault.application.use_cases.verify_use_case import VerifyUseCase
 
 __all__ = [
     "BuildGroupsUseCase",
+    "MatchCacheUseCase",
     "MatchUseCase",
     "OrganizeUseCase",
     "RunResult",
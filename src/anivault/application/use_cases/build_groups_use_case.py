@@ -1,8 +1,9 @@
 """Build groups use case (Phase R3).
 
 Builds series-based group display data from FileMetadata for GroupsView.
-Full build and fast path (metadata-only update) are both handled here so that
-grouping rules, tmdb_id merge, and fallback conditions live in one place.
+Full build, incremental build (re-group only files that changed since the
+previous build) and fast path (metadata-only update) are all handled here so
+that grouping rules, tmdb_id merge, and fallback conditions live in one place.
 """
 
 from __future__ import annotations
@@ -10,13 +11,14 @@ from __future__ import annotations
 import logging
 from collections import Counter
 from collections.abc import Callable
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
 from anivault.core import normalize_series_title
 from anivault.core.file_grouper import FileGrouper
 from anivault.core.file_grouper.grouper import TitleExtractor
-from anivault.core.models import ScannedFile
+from anivault.core.models import GroupingState, ScannedFile
 from anivault.domain.entities.parser import ParsingAdditionalInfo, ParsingResult
 from anivault.core.resolution_detector import ResolutionDetector
 from anivault.domain.entities.metadata import FileMetadata
@@ -33,6 +35,21 @@ LANG_PATTERNS_JA = ("japanese", "jap", "ja")
 LANG_PATTERNS_EN = ("english", "eng", "en")
 
 
+@dataclass(frozen=True)
+class GroupsBuildState:
+    """State of a previous build, input to ``BuildGroupsUseCase.execute_incremental``.
+
+    Attributes:
+        grouping: FileGrouper state (engine groups per hash key)
+        scanned_files: ScannedFile per file path with the FileMetadata fields it was built from
+        view_models: Group dicts by (series name, ids of their FileMetadata objects)
+    """
+
+    grouping: GroupingState | None = None
+    scanned_files: dict[Path, tuple[tuple[Any, ...], ScannedFile]] = field(default_factory=dict)
+    view_models: dict[tuple[str, tuple[int, ...]], GroupViewModel] = field(default_factory=dict)
+
+
 def _path_resolved(p: Path) -> Path:
     """Resolve path; return original on OSError."""
     try:
@@ -72,6 +89,11 @@ def _scanned_file_from_metadata(
     )
 
 
+def _scanned_file_inputs(fm: FileMetadata) -> tuple[Any, ...]:
+    """FileMetadata fields _scanned_file_from_metadata depends on (besides the file itself)."""
+    return (fm.title, fm.episode, fm.season, fm.year)
+
+
 def _normalize_series_name(group_title: str) -> str:
     """Strip episode/season from group title so one series = one key."""
     return normalize_series_title(group_title)
@@ -287,6 +309,24 @@ def _needs_merge_by_tmdb_id(
     return any(len(indices) > 1 for indices in tmdb_id_to_group_indices.values())
 
 
+def _series_groups_for_files(
+    files: list[FileMetadata],
+    file_groups: list[Any],
+) -> dict[str, list[FileMetadata]]:
+    """Series name -> files: FileGrouper groups merged by tmdb_id, plus '미분류' for ungrouped files."""
+    files_by_path = {_path_resolved(fm.file_path): fm for fm in files}
+    series_groups = _file_groups_to_series_groups(file_groups, files_by_path)
+
+    _merge_groups_by_tmdb_id(series_groups)
+
+    grouped_resolved = {_path_resolved(fm.file_path) for files_list in series_groups.values() for fm in files_list}
+    ungrouped = [fm for fm in files if _path_resolved(fm.file_path) not in grouped_resolved]
+    if ungrouped:
+        logger.info("Adding %d ungrouped file(s) to '미분류' group", len(ungrouped))
+        series_groups["미분류"] = series_groups.get("미분류", []) + ungrouped
+    return series_groups
+
+
 class BuildGroupsUseCase:
     """Use case for building group display data from FileMetadata."""
 
@@ -313,21 +353,78 @@ class BuildGroupsUseCase:
                 progress_callback(i + 1, total)
         file_groups = file_grouper.group_files(scanned_files)
 
-        files_by_path = {_path_resolved(fm.file_path): fm for fm in files}
-        series_groups = _file_groups_to_series_groups(file_groups, files_by_path)
+        if progress_callback and total > 0:
+            progress_callback(total, total)
 
-        _merge_groups_by_tmdb_id(series_groups)
+        series_groups = _series_groups_for_files(files, file_groups)
+        return [_build_group_dict(index, series_name, all_files) for index, (series_name, all_files) in enumerate(series_groups.items(), start=1)]
+
+    def execute_incremental(
+        self,
+        files: list[FileMetadata],
+        state: GroupsBuildState | None = None,
+        progress_callback: Callable[[int, int], None] | None = None,
+    ) -> tuple[list[GroupViewModel], GroupsBuildState]:
+        """Build group display data, reusing the work of a previous build.
+
+        Only files that are new, gone or whose grouping inputs changed are
+        converted and re-grouped (FileGrouper.group_files_incremental); the
+        tmdb_id merge runs over the updated groups and group dicts are rebuilt
+        only for groups whose series name or files changed. The result equals
+        ``execute(files)``.
+
+        Args:
+            files: All files (not only the changed ones)
+            state: State returned by the previous call (None: full build)
+            progress_callback: Called with (current, total) during conversion
+
+        Returns:
+            Tuple of (group dicts, state for the next call)
+        """
+        if not files:
+            return [], GroupsBuildState()
+
+        previous = state or GroupsBuildState()
+        title_extractor = TitleExtractor()
+        total = len(files)
+        scanned_files: list[ScannedFile] = []
+        scanned_by_path: dict[Path, tuple[tuple[Any, ...], ScannedFile]] = {}
+        converted = 0
+        for i, fm in enumerate(files):
+            inputs = _scanned_file_inputs(fm)
+            cached = previous.scanned_files.get(fm.file_path)
+            if cached is not None and cached[0] == inputs:
+                scanned = cached[1]
+            else:
+                scanned = _scanned_file_from_metadata(fm, title_extractor)
+                converted += 1
+            scanned_files.append(scanned)
+            scanned_by_path[fm.file_path] = (inputs, scanned)
+            if progress_callback and (i + 1) % 50 == 0:
+                progress_callback(i + 1, total)
+        file_groups, grouping_state = FileGrouper().group_files_incremental(scanned_files, previous.grouping)
 
         if progress_callback and total > 0:
             progress_callback(total, total)
 
-        grouped_resolved = {_path_resolved(fm.file_path) for files_list in series_groups.values() for fm in files_list}
-        ungrouped = [fm for fm in files if _path_resolved(fm.file_path) not in grouped_resolved]
-        if ungrouped:
-            logger.info("Adding %d ungrouped file(s) to '미분류' group", len(ungrouped))
-            series_groups["미분류"] = series_groups.get("미분류", []) + ungrouped
-
-        return [_build_group_dict(index, series_name, all_files) for index, (series_name, all_files) in enumerate(series_groups.items(), start=1)]
+        series_groups = _series_groups_for_files(files, file_groups)
+        view_models: dict[tuple[str, tuple[int, ...]], GroupViewModel] = {}
+        groups: list[GroupViewModel] = []
+        for index, (series_name, all_files) in enumerate(series_groups.items(), start=1):
+            key = (series_name, tuple(id(fm) for fm in all_files))
+            cached_group = previous.view_models.get(key)
+            group = {**cached_group, "id": index} if cached_group is not None else _build_group_dict(index, series_name, all_files)
+            view_models[key] = group
+            groups.append(group)
+
+        logger.info(
+            "Incremental group build: converted %d of %d file(s), rebuilt %d of %d group(s)",
+            converted,
+            total,
+            sum(1 for key in view_models if key not in previous.view_models),
+            len(groups),
+        )
+        return groups, GroupsBuildState(grouping=grouping_state, scanned_files=scanned_by_path, view_models=view_models)
 
     def apply_metadata_update(
         self,
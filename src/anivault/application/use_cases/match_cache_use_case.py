@@ -0,0 +1,71 @@
+"""Match decision cache use case.
+
+Inspection and maintenance of the persistent match decision cache for the
+CLI ``match-cache`` command. The CLI handler calls this use case and renders
+the returned dicts.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from anivault.config.loader import get_settings_snapshot
+from anivault.core.matching.engine import default_fallback_strategies
+from anivault.core.matching.services.decision_cache import MatchDecisionCache, compute_decision_version
+from anivault.infrastructure import SQLiteCacheDB
+from anivault.shared.utils.dataclass_serialization import to_dict
+
+logger = logging.getLogger(__name__)
+
+
+class MatchCacheUseCase:
+    """Inspect and clear cached match decisions.
+
+    The current decision version is computed from the configured matching
+    weights and the engine's default fallback strategies, i.e. the version
+    a MatchingEngine built from the same settings would read and write.
+    """
+
+    def __init__(self, cache_db: SQLiteCacheDB) -> None:
+        self._cache = MatchDecisionCache(cache_db)
+        self._current_version = compute_decision_version(
+            get_settings_snapshot().settings.matching_weights,
+            default_fallback_strategies(),
+        )
+
+    @property
+    def current_version(self) -> str:
+        """Decision version produced by the current configuration."""
+        return self._current_version
+
+    def info(self) -> dict[str, Any]:
+        """Summarize the cache (entries per version, current vs. stale)."""
+        return self._cache.get_cache_info(current_version=self._current_version)
+
+    def list_entries(self, limit: int) -> list[dict[str, Any]]:
+        """List cached decisions, newest first.
+
+        Args:
+            limit: Maximum number of entries
+
+        Returns:
+            Serialized decisions with a ``stale`` flag each
+        """
+        entries = []
+        for decision in self._cache.list_entries(limit):
+            entry = to_dict(decision)
+            entry["stale"] = decision.decision_version != self._current_version
+            entries.append(entry)
+        return entries
+
+    def clear(self) -> int:
+        """Remove all cached decisions; returns the number removed."""
+        return self._cache.clear()
+
+    def purge_stale(self) -> int:
+        """Remove decisions made under outdated weights/strategies; returns the number removed."""
+        return self._cache.purge_stale(self._current_version)
+
+
+__all__ = ["MatchCacheUseCase"]
@@ -2,18 +2,27 @@
 
 Orchestrates file matching pipeline: find files → parse → match → return FileMetadata list.
 GUI path: execute_from_files (grouped by series, one TMDB search per series).
+Incremental mode: per-file match state (MatchStateStore) is persisted and only
+new, modified or previously unmatched files are matched again.
+
+Files are discovered in a single DirectoryScanner walk filtered by the
+extension set and streamed into matching, so matching starts before the walk
+finishes.
 """
 
 from __future__ import annotations
 
 import asyncio
+import itertools
 import logging
+import time
 from collections import defaultdict
-from collections.abc import Callable, Sequence
+from collections.abc import Callable, Iterable, Iterator, Sequence
 from dataclasses import replace
 from pathlib import Path
 
 from anivault.application.models.match_services import MatchServices
+from anivault.config.loader import get_settings_snapshot
 from anivault.core import normalize_series_title
 from anivault.core.matching.pipeline import (
     MatchOptions,
@@ -21,12 +30,19 @@ from anivault.core.matching.pipeline import (
     match_result_to_file_metadata,
     process_file_for_matching,
 )
+from anivault.core.pipeline.components import DirectoryCacheManager, DirectoryScanner
+from anivault.core.pipeline.utils import BoundedQueue, ScanStatistics
 from anivault.domain.entities.parser import ParsingAdditionalInfo, ParsingResult
+from anivault.infrastructure.match_state_store import MatchStateStore
 from anivault.shared.constants import FileSystem
+from anivault.shared.errors import InfrastructureError
 from anivault.domain.entities.metadata import FileMetadata
 
 logger = logging.getLogger(__name__)
 
+# Paths pulled from the directory walk per executor call
+_DISCOVERY_BATCH_SIZE = 64
+
 
 def _series_key(fm: FileMetadata) -> tuple[str, int | None]:
     """Key for deduplicating TMDB searches: (series_title, year)."""
@@ -37,15 +53,36 @@ def _series_key(fm: FileMetadata) -> tuple[str, int | None]:
 class MatchUseCase:
     """Use case for matching anime files against TMDB."""
 
-    def __init__(self, services: MatchServices) -> None:
-        """Initialize with injected services."""
+    def __init__(
+        self,
+        services: MatchServices,
+        match_state_file: Path | None = None,
+        scan_cache_file: Path | None = None,
+    ) -> None:
+        """Initialize with injected services.
+
+        Args:
+            services: Match services bundle
+            match_state_file: JSON file for per-file match state (incremental mode);
+                default: cache/match_state.json under the working directory
+            scan_cache_file: JSON directory cache (DirectoryCacheManager) for file
+                discovery; default: cache/match_scan_cache.json under the working directory
+        """
         self._services = services
+        self._match_state_file = match_state_file or Path(FileSystem.CACHE_DIRECTORY) / FileSystem.MATCH_STATE_FILE
+        self._scan_cache_file = scan_cache_file or Path(FileSystem.CACHE_DIRECTORY) / FileSystem.MATCH_SCAN_CACHE_FILE
+        # Per-group match latency (seconds) of the last execute_from_files run
+        self._group_latencies: list[float] = []
+        # Reused/re-matched/pruned file counts of the last incremental run
+        self._incremental_stats: dict[str, int] = {}
 
     async def execute(
         self,
         directory: Path,
         extensions: tuple[str, ...] | None = None,
         concurrency: int = 4,
+        *,
+        incremental: bool = False,
     ) -> list[FileMetadata]:
         """Match anime files in directory.
 
@@ -53,44 +90,129 @@ class MatchUseCase:
             directory: Root directory to scan
             extensions: File extensions to include (default: CLI_VIDEO_EXTENSIONS)
             concurrency: Max concurrent file processing
+            incremental: Reuse stored results of unchanged, previously matched files
+                and only match new, modified or unmatched ones
 
         Returns:
             List of FileMetadata (includes error-placeholder entries for failed files)
         """
         exts = extensions or tuple(FileSystem.CLI_VIDEO_EXTENSIONS)
-        anime_files = self._find_anime_files(directory, exts)
 
-        if not anime_files:
-            return []
+        if not incremental:
+            return await self._process_files(self._iter_anime_files(directory, exts), concurrency)
 
-        return await self._process_files(anime_files, concurrency)
+        store = MatchStateStore(self._match_state_file)
+        anime_files: list[Path] = []
+        stored: list[FileMetadata | None] = []
+
+        def pending_files() -> Iterator[Path]:
+            # Runs on the discovery thread: only new/modified/unmatched files go to matching
+            for path in self._iter_anime_files(directory, exts):
+                previous = store.lookup(path)
+                anime_files.append(path)
+                stored.append(previous)
+                if previous is None:
+                    yield path
+
+        parsed_titles: dict[Path, str] = {}
+        matched = await self._process_files(pending_files(), concurrency, parsed_titles)
+        store.update(matched, parsed_titles)
+        removed = store.prune(directory, set(anime_files))
+        self._save_match_state(store, reused=len(anime_files) - len(matched), rematched=len(matched), removed=removed)
+
+        fresh = iter(matched)
+        return [previous if previous is not None else next(fresh) for previous in stored]
 
     async def execute_from_files(
         self,
         files: Sequence[FileMetadata],
         progress_callback: Callable[[int, int, str | None], None] | None = None,
         cancel_check: Callable[[], bool] | None = None,
+        concurrency: int | None = None,
+        *,
+        incremental: bool = False,
     ) -> list[FileMetadata]:
         """Match files from GUI scan result (grouped by series, one TMDB search per series).
 
         Preserves input order and length. On cancel, returns results for processed
         series and original FileMetadata for unprocessed files.
+
+        Args:
+            files: Scanned FileMetadata
+            progress_callback: Called with (completed groups, total groups, stage)
+            cancel_check: Returns True to stop starting new groups
+            concurrency: Max series groups in flight (default: api.tmdb.match_concurrency)
+            incremental: Reuse stored results of unchanged, previously matched files
+                and only match new, modified or unmatched ones
         """
         if not files:
             return []
-        return await self._process_grouped_files(
-            list(files),
-            progress_callback=progress_callback,
-            cancel_check=cancel_check,
+        if concurrency is None:
+            concurrency = get_settings_snapshot().settings.api.tmdb.match_concurrency
+        if not incremental:
+            return await self._process_grouped_files(
+                list(files),
+                progress_callback=progress_callback,
+                cancel_check=cancel_check,
+                concurrency=concurrency,
+            )
+
+        store = MatchStateStore(self._match_state_file)
+        stored = [store.lookup(fm.file_path) if fm.file_path else None for fm in files]
+        pending = [fm for fm, previous in zip(files, stored) if previous is None]
+
+        matched: list[FileMetadata] = []
+        if pending:
+            matched = await self._process_grouped_files(
+                pending,
+                progress_callback=progress_callback,
+                cancel_check=cancel_check,
+                concurrency=concurrency,
+            )
+            # Scanned titles are the parsed titles
+            store.update(matched, {fm.file_path: fm.title for fm in pending if fm.file_path})
+        self._save_match_state(store, reused=len(files) - len(pending), rematched=len(pending), removed=0)
+
+        fresh = iter(matched)
+        return [previous if previous is not None else next(fresh) for previous in stored]
+
+    def _save_match_state(self, store: MatchStateStore, *, reused: int, rematched: int, removed: int) -> None:
+        """Persist incremental match state; a failed save only costs re-matching next time."""
+        self._incremental_stats = {"reused": reused, "rematched": rematched, "removed": removed}
+        logger.info(
+            "MatchUseCase (incremental): reused %d stored results, matched %d new/modified/unmatched files, dropped %d stale entries",
+            reused,
+            rematched,
+            removed,
         )
+        try:
+            store.save()
+        except OSError:
+            logger.warning("Could not save match state to %s; next run re-matches these files", store.state_file)
+
+    def get_incremental_stats(self) -> dict[str, int]:
+        """File counts of the last incremental run.
+
+        Returns:
+            Dictionary with ``reused``, ``rematched`` and ``removed`` counts
+            (empty if no incremental run happened)
+        """
+        return dict(self._incremental_stats)
 
-    async def _process_grouped_files(
+    async def _process_grouped_files(  # pylint: disable=too-many-locals
         self,
         files: list[FileMetadata],
         progress_callback: Callable[[int, int, str | None], None] | None = None,
         cancel_check: Callable[[], bool] | None = None,
+        concurrency: int = 1,
     ) -> list[FileMetadata]:
-        """Group by (series_title, year), one TMDB search per group, remap to original order."""
+        """Group by (series_title, year), one TMDB search per group, remap to original order.
+
+        Groups are matched by up to ``concurrency`` workers; TMDB requests still
+        go through the client's rate limiter and semaphore. ``cancel_check`` is
+        polled before each group starts, so on cancel in-flight groups finish and
+        pending ones are skipped.
+        """
         groups: dict[tuple[str, int | None], list[FileMetadata]] = defaultdict(list)
         for fm in files:
             groups[_series_key(fm)].append(fm)
@@ -109,23 +231,56 @@ class MatchUseCase:
         options = MatchOptions()
 
         key_to_bundle: dict[tuple[str, int | None], MatchResultBundle] = {}
-        for idx, (key, group_files) in enumerate(groups.items(), start=1):
-            if cancel_check and cancel_check():
-                break
-            if progress_callback is not None:
-                progress_callback(idx - 1, unique_count, "matching")
-
-            series_title, _ = key
-            representative = group_files[0]
-            bundle = await process_file_for_matching(
-                representative.file_path,
-                engine=engine,
-                parser=parser,
-                options=options,
-                search_title=series_title,
-            )
-            if bundle is not None:
-                key_to_bundle[key] = bundle
+        pending = iter(groups.items())
+        latencies: list[float] = []
+        self._group_latencies = latencies
+
+        if progress_callback is not None:
+            progress_callback(0, unique_count, "matching")
+
+        async def worker() -> None:
+            # Single event loop: pulling from the shared iterator needs no lock
+            for key, group_files in pending:
+                if cancel_check and cancel_check():
+                    return
+
+                series_title, _ = key
+                started = time.perf_counter()
+                bundle = await process_file_for_matching(
+                    group_files[0].file_path,
+                    engine=engine,
+                    parser=parser,
+                    options=options,
+                    search_title=series_title,
+                )
+                latency = time.perf_counter() - started
+                latencies.append(latency)
+                logger.debug("Matched series %r (%d files) in %.3fs", series_title, len(group_files), latency)
+
+                if bundle is not None:
+                    key_to_bundle[key] = bundle
+                if progress_callback is not None:
+                    progress_callback(len(latencies), unique_count, "matching")
+
+        workers = [asyncio.ensure_future(worker()) for _ in range(max(1, min(concurrency, unique_count)))]
+        try:
+            await asyncio.gather(*workers)
+        except BaseException:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            raise
+
+        stats = self.get_group_latency_stats()
+        logger.info(
+            "MatchUseCase: matched %d/%d series (concurrency %d): avg %.0fms, p95 %.0fms, max %.0fms",
+            stats["groups"],
+            unique_count,
+            concurrency,
+            stats["avg_ms"],
+            stats["p95_ms"],
+            stats["max_ms"],
+        )
 
         # Build results in original file order; re-inject original FileMetadata fields.
         results: list[FileMetadata] = []
@@ -148,19 +303,75 @@ class MatchUseCase:
 
         return results
 
-    def _find_anime_files(self, directory: Path, extensions: tuple[str, ...]) -> list[Path]:
-        """Find anime files in directory."""
-        anime_files: list[Path] = []
-        for ext in extensions:
-            anime_files.extend(directory.rglob(f"*{ext}"))
-        return anime_files
+    def get_group_latency_stats(self) -> dict[str, float]:
+        """Per-group match latency of the last execute_from_files run.
+
+        Use together with the concurrency limit: if latency grows with the
+        limit, requests are queueing on the TMDB client limits instead of
+        overlapping network waits.
+
+        Returns:
+            Dictionary with groups count and avg/p50/p95/max latency in ms
+        """
+        ordered = sorted(self._group_latencies)
+        if not ordered:
+            return {"groups": 0, "avg_ms": 0.0, "p50_ms": 0.0, "p95_ms": 0.0, "max_ms": 0.0}
+        return {
+            "groups": len(ordered),
+            "avg_ms": sum(ordered) / len(ordered) * 1000,
+            "p50_ms": ordered[len(ordered) // 2] * 1000,
+            "p95_ms": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000,
+            "max_ms": ordered[-1] * 1000,
+        }
+
+    def _iter_anime_files(self, directory: Path, extensions: tuple[str, ...]) -> Iterator[Path]:
+        """Lazily yield anime files in directory.
+
+        One DirectoryScanner walk checks every file against the (lowercased)
+        extension set instead of one ``rglob`` walk per extension. Directory
+        listings go through DirectoryCacheManager, so unchanged directories are
+        not listed again on the next run.
+
+        Args:
+            directory: Root directory to scan
+            extensions: File extensions to include (with or without leading dot)
+
+        Yields:
+            Absolute path of each matching file, in walk order
+        """
+        directory_cache = DirectoryCacheManager(cache_file=self._scan_cache_file)
+        scanner = DirectoryScanner(
+            root_path=directory,
+            extensions=[ext if ext.startswith(".") else f".{ext}" for ext in extensions],
+            input_queue=BoundedQueue(),
+            stats=ScanStatistics(),
+            directory_cache=directory_cache,
+        )
+        yield from scanner.scan_files()
+
+        try:
+            self._scan_cache_file.parent.mkdir(parents=True, exist_ok=True)
+            directory_cache.save_cache()
+        except (OSError, InfrastructureError):
+            logger.warning("Could not save directory scan cache to %s", self._scan_cache_file)
 
     async def _process_files(
         self,
-        anime_files: list[Path],
+        anime_files: Iterable[Path],
         concurrency: int,
+        parsed_titles: dict[Path, str] | None = None,
     ) -> list[FileMetadata]:
-        """Process files concurrently and return FileMetadata list."""
+        """Process files concurrently and return FileMetadata list.
+
+        ``anime_files`` may be a lazy iterator (e.g. a directory walk): it is
+        advanced in batches on the default executor and each file is scheduled
+        as soon as it is discovered, so matching overlaps discovery.
+
+        Args:
+            anime_files: Files to match (results keep this order)
+            concurrency: Max concurrent file processing
+            parsed_titles: Filled with the parsed title per file (optional)
+        """
         parser = self._services.parser
         engine = self._services.matching_engine
         semaphore = asyncio.Semaphore(concurrency)
@@ -174,17 +385,33 @@ class MatchUseCase:
                         parser=parser,
                     )
                     if isinstance(bundle, MatchResultBundle):
+                        if parsed_titles is not None and bundle.parsing is not None:
+                            parsed_titles[file_path] = bundle.parsing.title
                         return bundle.metadata
                     return bundle  # type: ignore[unreachable]
                 except (OSError, ValueError, TypeError):
                     return None
 
-        results = await asyncio.gather(
-            *[process_one(fp) for fp in anime_files],
-            return_exceptions=True,
-        )
-
-        return self._convert_results(results, anime_files)
+        loop = asyncio.get_running_loop()
+        paths = iter(anime_files)
+        discovered: list[Path] = []
+        tasks: list[asyncio.Future[FileMetadata | MatchResultBundle | None]] = []
+        try:
+            while True:
+                # Walk on a worker thread while scheduled files are matched on the loop
+                batch = await loop.run_in_executor(None, list, itertools.islice(paths, _DISCOVERY_BATCH_SIZE))
+                if not batch:
+                    break
+                discovered.extend(batch)
+                tasks.extend(asyncio.ensure_future(process_one(fp)) for fp in batch)
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+        return self._convert_results(results, discovered)
 
     def _convert_results(
         self,
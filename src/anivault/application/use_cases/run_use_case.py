@@ -162,6 +162,7 @@ class RunUseCase:
                 directory,
                 stats_collector,
                 scanned_files=scanned,
+                incremental=options.incremental,
             )
             if not _append_step(result, step, stats_collector):
                 return result
@@ -230,22 +231,29 @@ class RunUseCase:
         stats_collector: StatisticsCollector | None,
         *,
         scanned_files: list[FileMetadata] | None,
+        incremental: bool = False,
     ) -> tuple[RunStepResult, list[FileMetadata] | None]:
         """Execute the match step (async; no internal asyncio.run)."""
         _timing_start(stats_collector, "match")
         try:
             matched_files: list[FileMetadata]
             if scanned_files is not None:
-                matched_files = await self._match.execute_from_files(scanned_files)
+                matched_files = await self._match.execute_from_files(scanned_files, incremental=incremental)
             else:
                 matched_files = await self._match.execute(
                     directory,
                     extensions=tuple(FileSystem.CLI_VIDEO_EXTENSIONS),
                     concurrency=4,
+                    incremental=incremental,
                 )
             _timing_end(stats_collector, "match")
             return (
-                RunStepResult(step="match", status=StepStatus.SUCCESS, message="Files matched successfully"),
+                RunStepResult(
+                    step="match",
+                    status=StepStatus.SUCCESS,
+                    message="Files matched successfully",
+                    extra={"incremental": self._match.get_incremental_stats()} if incremental else {},
+                ),
                 matched_files,
             )
         except Exception as exc:  # pylint: disable=broad-exception-caught
@@ -6,6 +6,7 @@ management for the AniVault application.
 All configuration components are available through this package:
 - Settings: Main configuration facade
 - Loader functions: get_config, load_settings, reload_config, update_and_save_config
+- Settings snapshot for hot paths: get_settings_snapshot, invalidate_settings_snapshot
 - Domain models: App, API, Scan, Cache, Performance, Folders, Security settings
 - Backward-compatible aliases: *Config classes for gradual migration
 """
@@ -14,7 +15,10 @@ from __future__ import annotations
 
 # Import loader functions directly from loader module to avoid circular dependency
 from .loader import (
+    SettingsSnapshot,
     get_config,
+    get_settings_snapshot,
+    invalidate_settings_snapshot,
     load_settings,
     load_weights,
     reload_config,
@@ -67,10 +71,13 @@ __all__ = [
     "SecuritySettings",
     "Settings",
     "SettingsProvider",
+    "SettingsSnapshot",
     "TMDBConfig",
     "TMDBSettings",
     "get_config",
     "get_settings_provider",
+    "get_settings_snapshot",
+    "invalidate_settings_snapshot",
     "load_settings",
     "load_weights",
     "reload_config",
@@ -4,6 +4,7 @@ This module handles:
 - Environment variable loading from .env files
 - Configuration file loading from TOML
 - Thread-safe singleton pattern for Settings instance
+- Settings snapshot reloaded only when the config file changes (hot paths)
 - Configuration update and save operations
 
 Refactored from monolithic settings.py for better modularity.
@@ -16,6 +17,8 @@ import logging
 import os
 import sys
 import threading
+import time
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Callable
 
@@ -33,6 +36,9 @@ from anivault.shared.errors import (
 # Default path for the main TOML config file (single source for S1192)
 DEFAULT_CONFIG_PATH = Path("config/config.toml")
 
+# Minimum seconds between config file mtime checks of the settings snapshot
+SETTINGS_SNAPSHOT_CHECK_INTERVAL = 1.0
+
 
 class SettingsLoader:
     """Thread-safe singleton manager for Settings.
@@ -77,6 +83,7 @@ class SettingsLoader:
             # Load .env file before loading settings
             _load_env_file()
             self._instance = load_settings()
+            invalidate_settings_snapshot()
 
         return self._instance
 
@@ -124,6 +131,7 @@ class SettingsLoader:
 
                 # 6. Update global cache
                 self._instance = updated
+                invalidate_settings_snapshot()
 
                 logger.info("Configuration updated and saved successfully to %s", config_path)
 
@@ -321,6 +329,16 @@ def load_settings(config_path: str | Path | None = None) -> Settings:
         return Settings.from_toml_file(config_path)
 
     # Try to load from default configuration file
+    default_path = _find_default_config_path()
+    if default_path is not None:
+        return Settings.from_toml_file(default_path)
+
+    # Fall back to environment variables (no need to reload .env file)
+    return Settings()
+
+
+def _find_default_config_path() -> Path | None:
+    """Return the first existing default configuration file (None if none exists)."""
     default_config_paths = [
         DEFAULT_CONFIG_PATH,
         Path("config.toml"),
@@ -329,10 +347,124 @@ def load_settings(config_path: str | Path | None = None) -> Settings:
 
     for config_path in default_config_paths:
         if config_path.exists():
-            return Settings.from_toml_file(config_path)
+            return config_path
+    return None
 
-    # Fall back to environment variables (no need to reload .env file)
-    return Settings()
+
+def _config_file_state() -> tuple[Path | None, int | None]:
+    """(path, mtime_ns) of the default configuration file, (None, None) if there is none."""
+    config_path = _find_default_config_path()
+    if config_path is None:
+        return None, None
+    try:
+        return config_path, config_path.stat().st_mtime_ns
+    except OSError:
+        return None, None
+
+
+@dataclass(frozen=True)
+class SettingsSnapshot:
+    """Immutable settings snapshot tied to one state of the configuration file.
+
+    The same Settings instance is shared by every reader of the snapshot, so
+    it must be treated as read-only; use ``update_and_save_config`` to change
+    configuration.
+
+    Attributes:
+        settings: Loaded settings
+        config_path: Configuration file the settings were loaded from
+            (None: environment variables and defaults)
+        mtime_ns: Modification time of ``config_path`` when it was loaded
+    """
+
+    settings: Settings
+    config_path: Path | None
+    mtime_ns: int | None
+
+
+class SettingsSnapshotManager:
+    """Process-wide settings snapshot, reloaded only when the config file changes.
+
+    ``load_settings`` reads and validates the TOML file on every call. Hot
+    paths (per file, per group, per score) read this snapshot instead: the
+    file's mtime is checked at most once per ``check_interval`` seconds and
+    the file is parsed again only if the mtime (or the file) changed.
+
+    Readers never take the lock once a snapshot exists; reloads are serialized.
+
+    Attributes:
+        check_interval: Minimum seconds between config file mtime checks
+        reloads: Number of times settings were (re)loaded
+    """
+
+    def __init__(self, check_interval: float = SETTINGS_SNAPSHOT_CHECK_INTERVAL) -> None:
+        """Initialize the snapshot manager.
+
+        Args:
+            check_interval: Minimum seconds between config file mtime checks
+        """
+        self.check_interval = check_interval
+        self.reloads = 0
+        self._snapshot: SettingsSnapshot | None = None
+        self._next_check = 0.0
+        self._lock = threading.Lock()
+
+    def get(self) -> SettingsSnapshot:
+        """Return the current snapshot, reloading it if the config file changed.
+
+        Returns:
+            Current SettingsSnapshot
+
+        Raises:
+            Errors of ``load_settings`` if no snapshot could ever be loaded
+        """
+        snapshot = self._snapshot
+        if snapshot is not None and time.monotonic() < self._next_check:
+            return snapshot
+
+        with self._lock:
+            snapshot = self._snapshot
+            now = time.monotonic()
+            if snapshot is not None and now < self._next_check:
+                return snapshot
+
+            config_path, mtime_ns = _config_file_state()
+            if snapshot is None or (config_path, mtime_ns) != (snapshot.config_path, snapshot.mtime_ns):
+                snapshot = self._reload(snapshot, config_path, mtime_ns)
+            self._next_check = now + self.check_interval
+            return snapshot
+
+    def _reload(
+        self,
+        previous: SettingsSnapshot | None,
+        config_path: Path | None,
+        mtime_ns: int | None,
+    ) -> SettingsSnapshot:
+        """Load a new snapshot; keep the previous one if the changed file is invalid."""
+        logger = logging.getLogger(__name__)
+        try:
+            settings = load_settings(config_path)
+        except Exception:  # pylint: disable=broad-exception-caught
+            if previous is None:
+                raise
+            logger.warning(
+                "Failed to reload changed configuration %s, keeping previous settings",
+                config_path,
+                exc_info=True,
+            )
+            return previous
+
+        snapshot = SettingsSnapshot(settings=settings, config_path=config_path, mtime_ns=mtime_ns)
+        self._snapshot = snapshot
+        self.reloads += 1
+        logger.debug("Settings snapshot loaded from %s", config_path or "environment")
+        return snapshot
+
+    def invalidate(self) -> None:
+        """Drop the snapshot so the next ``get`` loads settings again."""
+        with self._lock:
+            self._snapshot = None
+            self._next_check = 0.0
 
 
 def load_weights(config_path: str | Path | None = None) -> MatchingWeights:
@@ -368,6 +500,9 @@ def load_weights(config_path: str | Path | None = None) -> MatchingWeights:
 # Global loader instance
 _loader = SettingsLoader()
 
+# Global settings snapshot
+_snapshot_manager = SettingsSnapshotManager()
+
 
 # Public API (backward compatibility wrappers)
 def get_config() -> Settings:
@@ -379,6 +514,26 @@ def get_config() -> Settings:
     return _loader.get_config()
 
 
+def get_settings_snapshot() -> SettingsSnapshot:
+    """Get the process-wide settings snapshot (thread-safe).
+
+    Use this instead of ``load_settings()`` on hot paths: the configuration
+    file is only read again after its modification time changes.
+
+    Returns:
+        Current SettingsSnapshot
+
+    Example:
+        >>> strategy = get_settings_snapshot().settings.grouping.subtitle_matching_strategy
+    """
+    return _snapshot_manager.get()
+
+
+def invalidate_settings_snapshot() -> None:
+    """Force the next ``get_settings_snapshot`` call to load settings again."""
+    _snapshot_manager.invalidate()
+
+
 def reload_config() -> Settings:
     """Reload the global settings instance from configuration files.
 
@@ -403,8 +558,13 @@ def update_and_save_config(
 
 __all__ = [
     "DEFAULT_CONFIG_PATH",
+    "SETTINGS_SNAPSHOT_CHECK_INTERVAL",
     "SettingsLoader",
+    "SettingsSnapshot",
+    "SettingsSnapshotManager",
     "get_config",
+    "get_settings_snapshot",
+    "invalidate_settings_snapshot",
     "load_settings",
     "reload_config",
     "update_and_save_config",
@@ -6,12 +6,14 @@ primarily TMDB (The Movie Database) API settings.
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Literal
 
 from pydantic import BaseModel, Field
 
 from anivault.shared.constants import (
     APIConfig,
+    LocalTitleIndexConfig,
+    PrefixFallbackMode,
     Timeout,
 )
 from anivault.shared.constants import TMDBConfig as TMDBConstants
@@ -77,6 +79,49 @@ class TMDBSettings(BaseModel):
         description="Maximum number of concurrent requests",
     )
 
+    # Title prefix fallback settings (search_media)
+    prefix_fallback_mode: Literal["sequential", "parallel", "binary"] = Field(
+        default=PrefixFallbackMode.PARALLEL,
+        description=(
+            "Title prefix fallback when the full title has no results: "
+            "'sequential' queries one prefix at a time, "
+            "'parallel' queries a speculative window of prefixes concurrently (same result as sequential), "
+            "'binary' binary-searches the prefix length (fewest requests, assumes results shrink as words are added)"
+        ),
+    )
+    prefix_fallback_concurrency: int = Field(
+        default=TMDBConstants.PREFIX_FALLBACK_CONCURRENCY,
+        gt=0,
+        description="Number of prefix queries kept in flight in 'parallel' prefix fallback mode",
+    )
+
+    # Series matching settings (MatchUseCase)
+    match_concurrency: int = Field(
+        default=TMDBConstants.MATCH_GROUP_CONCURRENCY,
+        gt=0,
+        description="Maximum number of series groups matched concurrently",
+    )
+
+    # Offline title index settings (TMDB daily ID exports)
+    local_index_dir: str = Field(
+        default="",
+        description=(
+            "Directory containing TMDB daily ID export files (tv_series_ids_*.json.gz, movie_ids_*.json.gz); "
+            "empty disables the offline title index"
+        ),
+    )
+    local_index_min_score: float = Field(
+        default=LocalTitleIndexConfig.MIN_SCORE,
+        ge=0,
+        le=100,
+        description="Minimum rapidfuzz score (0-100) for an offline index hit to skip the search API",
+    )
+    local_index_max_candidates: int = Field(
+        default=LocalTitleIndexConfig.MAX_CANDIDATES,
+        gt=0,
+        description="Maximum offline index hits resolved via details calls per search",
+    )
+
     def __repr__(self) -> str:
         """Custom repr that masks sensitive api_key.
 
@@ -33,6 +33,10 @@ class CacheSettings(BaseModel):
         default=FileSystem.CACHE_BACKEND,
         description="Cache backend (memory, redis, sqlite)",
     )
+    match_decisions: bool = Field(
+        default=True,
+        description="Cache final match decisions per normalized query (invalidated when matching weights/strategies change)",
+    )
 
 
 # Backward compatibility alias
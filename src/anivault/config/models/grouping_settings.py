@@ -31,6 +31,26 @@ class GroupingSettings(BaseModel):
                         Default: 10000 (DoS protection)
         title_similarity_threshold: Minimum similarity score (0.0-1.0) for
                                    Title matcher grouping. Default: 0.85
+        matcher_workers: Number of threads for running independent matchers
+                        and for Title refinement of Hash groups. Default: 4
+        matcher_process_pool: Run matchers declaring ``gil_bound = True`` in a
+                             process pool instead of a thread. Default: False
+        title_matcher_backend: Title matcher implementation: "rapidfuzz"
+                              (pairwise fuzzy matching) or "tfidf" (sparse
+                              TF-IDF nearest neighbours, for huge libraries).
+                              Default: "rapidfuzz"
+        tfidf_similarity_threshold: Minimum TF-IDF cosine similarity for the
+                                   "tfidf" backend. Default: 0.75
+        tfidf_top_k: Neighbours per unique title for the "tfidf" backend. Default: 10
+        persist_title_signatures: Keep MinHash signatures of the "rapidfuzz"
+                                 backend in the cache directory across runs. Default: True
+        sharded_grouping_min_files: Libraries with at least this many files are
+                                   grouped in shards (by hash key) in a process
+                                   pool; 0 disables sharding. Default: 200000
+        grouping_shards: Number of shards (0 = one per CPU core; raised if
+                        needed to respect the memory ceiling). Default: 0
+        shard_memory_limit_mb: Ceiling on the estimated memory of the shard
+                              worker processes running at once. Default: 4096
 
     Example:
         >>> settings = GroupingSettings(
@@ -70,6 +90,66 @@ class GroupingSettings(BaseModel):
         description="Minimum similarity score (0.0-1.0) for Title matcher grouping",
     )
 
+    matcher_workers: int = Field(
+        default=4,
+        ge=1,
+        le=64,
+        description="Number of threads for running independent matchers and for Title refinement of Hash groups (1 = sequential)",
+    )
+
+    matcher_process_pool: bool = Field(
+        default=False,
+        description="Run pure-Python (gil_bound) matchers in a process pool instead of a thread",
+    )
+
+    title_matcher_backend: Literal["rapidfuzz", "tfidf"] = Field(
+        default="rapidfuzz",
+        description=(
+            "Title matcher implementation: 'rapidfuzz' compares titles pairwise (default), "
+            "'tfidf' groups by character n-gram TF-IDF cosine nearest neighbours (scales to huge libraries)"
+        ),
+    )
+
+    tfidf_similarity_threshold: float = Field(
+        default=0.75,
+        ge=0.0,
+        le=1.0,
+        description="Minimum TF-IDF cosine similarity (0.0-1.0) for the 'tfidf' title matcher backend",
+    )
+
+    tfidf_top_k: int = Field(
+        default=10,
+        ge=1,
+        le=1000,
+        description="Number of nearest neighbours kept per unique title for the 'tfidf' title matcher backend",
+    )
+
+    persist_title_signatures: bool = Field(
+        default=True,
+        description="Persist MinHash title signatures in the cache directory so later runs only hash new titles",
+    )
+
+    sharded_grouping_min_files: int = Field(
+        default=200_000,
+        ge=0,
+        le=100_000_000,
+        description="Group libraries with at least this many files in hash-key shards on a process pool (0 = never shard)",
+    )
+
+    grouping_shards: int = Field(
+        default=0,
+        ge=0,
+        le=1024,
+        description="Number of shards for sharded grouping (0 = one per CPU core)",
+    )
+
+    shard_memory_limit_mb: int = Field(
+        default=4096,
+        ge=64,
+        le=1_048_576,
+        description="Ceiling (MiB) on the estimated memory of concurrently running shard worker processes",
+    )
+
     subtitle_matching_strategy: Literal["indexed", "fallback", "legacy"] = Field(
         default=SubtitleMatchingStrategy.INDEXED,
         description=(
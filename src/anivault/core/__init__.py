@@ -12,7 +12,7 @@ from .log_manager import (
     OperationLogManager,
 )
 from .models import FileOperation, OperationType, ScannedFile
-from .normalization import normalize_query, normalize_query_from_anitopy
+from .normalization import NormalizationCache, get_normalization_cache, normalize_query, normalize_query_from_anitopy, normalize_title
 from .normalize_series_title import normalize_series_title
 from .organizer import FileOrganizer
 from .statistics import StatisticsCollector, get_statistics_collector
@@ -23,12 +23,15 @@ __all__ = [
     "FileOrganizer",
     "LogFileCorruptedError",
     "LogFileNotFoundError",
+    "NormalizationCache",
     "OperationLogManager",
     "OperationType",
     "ScannedFile",
     "StatisticsCollector",
+    "get_normalization_cache",
     "get_statistics_collector",
     "normalize_query",
     "normalize_query_from_anitopy",
     "normalize_series_title",
+    "normalize_title",
 ]
@@ -14,7 +14,7 @@ import time
 from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from anivault.core.matching.engine import MatchingEngine
 from anivault.core.statistics import StatisticsCollector
@@ -26,6 +26,9 @@ from anivault.shared.constants import (
 )
 from anivault.shared.protocols.services import TMDBClientProtocol
 
+if TYPE_CHECKING:
+    from anivault.infrastructure.tmdb.tmdb_transport import TMDBTransport
+
 logger = logging.getLogger(__name__)
 
 
@@ -93,6 +96,7 @@ class BenchmarkSummary:
         average_processing_time: Average processing time per test
         total_processing_time: Total processing time
         cache_hit_ratio: Cache hit ratio during benchmark
+        fast_path_rate: Share of lookups resolved by the exact-match fast path
         api_calls: Number of API calls made
         api_errors: Number of API errors
     """
@@ -106,6 +110,7 @@ class BenchmarkSummary:
     average_processing_time: float
     total_processing_time: float
     cache_hit_ratio: float
+    fast_path_rate: float
     api_calls: int
     api_errors: int
     timestamp: str
@@ -117,6 +122,15 @@ class BenchmarkRunner:
     This class provides comprehensive benchmarking capabilities including
     ground truth dataset management, performance evaluation, and detailed
     reporting of matching system performance.
+
+    Pass a ``ReplayTransport`` to run offline against a recorded fixture
+    (with synthetic latency/429s), or a ``RecordingTransport`` to capture
+    such a fixture from a live run. Use a fresh ``cache_dir`` per replay run,
+    otherwise the SQLite cache answers most requests before the transport.
+
+    Example:
+        >>> transport = ReplayTransport("tmdb.json.gz", latency=0.05, jitter=0.02, rate_429=0.01)
+        >>> runner = BenchmarkRunner(tmp_dir, tmdb_api_key="", transport=transport)
     """
 
     def __init__(
@@ -124,6 +138,7 @@ class BenchmarkRunner:
         cache_dir: Path | str,
         tmdb_api_key: str,
         statistics: StatisticsCollector | None = None,
+        transport: TMDBTransport | None = None,
     ):
         """Initialize the benchmark runner.
 
@@ -131,9 +146,11 @@ class BenchmarkRunner:
             cache_dir: Directory for cache storage
             tmdb_api_key: TMDB API key for testing
             statistics: Optional statistics collector for performance tracking
+            transport: Optional TMDB transport (record/replay) for the client
         """
         self.cache_dir = Path(cache_dir)
         self.tmdb_api_key = tmdb_api_key
+        self.transport = transport
         self.statistics = statistics or StatisticsCollector()
 
         # Initialize components (SQLite cache)
@@ -150,6 +167,7 @@ class BenchmarkRunner:
             rate_limiter=None,
             semaphore_manager=None,
             state_machine=None,
+            transport=transport,
         )
         self.matching_engine = MatchingEngine(
             cache_adapter=cache_adapter,
@@ -465,6 +483,7 @@ class BenchmarkRunner:
             average_processing_time=(total_processing_time / len(results) if results else 0.0),
             total_processing_time=total_processing_time,
             cache_hit_ratio=self.statistics.get_cache_hit_ratio(),
+            fast_path_rate=self.statistics.get_fast_path_rate(),
             api_calls=self.statistics.metrics.api_calls,
             api_errors=self.statistics.metrics.api_errors,
             timestamp=datetime.now(timezone.utc).isoformat(),
@@ -500,6 +519,10 @@ class BenchmarkRunner:
             "results": [asdict(result) for result in results],
             "statistics": self.statistics.get_summary(),
         }
+        client_stats = getattr(self.tmdb_client, "get_stats", None)
+        if callable(client_stats):
+            # Rate limiter / state machine / transport counters for offline runs
+            data["tmdb_client"] = client_stats()
 
         with open(output_path, "w", encoding=Encoding.DEFAULT) as f:
             json.dump(data, f, indent=2, ensure_ascii=False)
@@ -524,6 +547,7 @@ class BenchmarkRunner:
         print(f"Average Processing:    {summary.average_processing_time:.3f}s")
         print(f"Total Processing:      {summary.total_processing_time:.3f}s")
         print(f"Cache Hit Ratio:       {summary.cache_hit_ratio:.1f}%")
+        print(f"Fast Path Rate:        {summary.fast_path_rate:.1f}%")
         print(f"API Calls:             {summary.api_calls}")
         print(f"API Errors:            {summary.api_errors}")
         print("=" * CLIFormatting.SEPARATOR_LENGTH)
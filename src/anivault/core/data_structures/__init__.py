@@ -3,6 +3,6 @@
 This module contains custom data structures used throughout the application.
 """
 
-from .linked_hash_table import HashNode, LinkedHashTable
+from .linked_hash_table import ChainedLinkedHashTable, DictLinkedHashTable, HashNode, LinkedHashTable
 
-__all__ = ["HashNode", "LinkedHashTable"]
+__all__ = ["ChainedLinkedHashTable", "DictLinkedHashTable", "HashNode", "LinkedHashTable"]
@@ -1,16 +1,22 @@
 """LinkedHashTable implementation for O(1) file organization operations.
 
-This module provides a high-performance hash table implementation that maintains
-insertion order using a doubly linked list overlay on top of a chaining hash table.
-It is specifically optimized for file organization workloads with memory efficiency
-and polynomial hash functions for better distribution.
+This module provides an insertion-ordered hash table with a small, explicit
+API (put/get/remove returning ``None`` for missing keys). Two implementations
+share that API:
+
+- ``DictLinkedHashTable`` (default): backed by the built-in dict, which is
+  insertion-ordered and implemented in C
+- ``ChainedLinkedHashTable`` (legacy): chaining hash table with a polynomial
+  hash function and a doubly linked list overlay, in pure Python
+
+``LinkedHashTable`` is the default implementation; set the environment
+variable ``ANIVAULT_LEGACY_LINKED_HASH_TABLE=1`` before importing to use the
+legacy one (see ``anivault.core.linked_hash_table_benchmark`` for a comparison).
 
 Key Features:
 - O(1) average time complexity for put, get, and remove operations
 - Maintains insertion order for deterministic iteration
-- Memory-optimized using __slots__ for reduced memory footprint
-- Polynomial hash function with ReDoS prevention
-- Automatic rehashing with 1.5x growth factor
+- Capacity/load factor bookkeeping with 1.5x growth (identical in both)
 - Type-safe generic implementation
 
 Example:
@@ -25,13 +31,17 @@ Example:
 
 from __future__ import annotations
 
+import os
 from collections.abc import Iterator
 from dataclasses import dataclass
-from typing import Generic, TypeVar
+from typing import TYPE_CHECKING, Generic, TypeVar
 
 K = TypeVar("K")
 V = TypeVar("V")
 
+# Environment variable selecting the legacy ChainedLinkedHashTable
+LEGACY_IMPLEMENTATION_ENV = "ANIVAULT_LEGACY_LINKED_HASH_TABLE"
+
 
 @dataclass(slots=True)  # type: ignore[call-overload]
 class HashNode(Generic[K, V]):
@@ -55,10 +65,11 @@ class HashNode(Generic[K, V]):
         return f"HashNode(key={self.key!r}, value={self.value!r})"
 
 
-class LinkedHashTable(Generic[K, V]):
+class ChainedLinkedHashTable(Generic[K, V]):
     """Hash table that maintains insertion order with O(1) operations.
 
-    This implementation uses chaining for collision resolution and maintains
+    Legacy pure-Python implementation (select it with
+    ``ANIVAULT_LEGACY_LINKED_HASH_TABLE=1``). This implementation uses chaining for collision resolution and maintains
     insertion order using a doubly linked list overlay. It is specifically
     optimized for file organization workloads with memory efficiency and
     polynomial hash functions for better distribution.
@@ -76,7 +87,7 @@ class LinkedHashTable(Generic[K, V]):
         load_factor: Maximum load factor before rehashing (default: 0.8)
 
     Example:
-        >>> table = LinkedHashTable()
+        >>> table = ChainedLinkedHashTable()
         >>> table.put("file1", {"size": 1024, "type": "video"})
         >>> table.put("file2", {"size": 2048, "type": "audio"})
         >>> table.get("file1")
@@ -94,7 +105,7 @@ class LinkedHashTable(Generic[K, V]):
     """
 
     def __init__(self, initial_capacity: int = 64, load_factor: float = 0.8):
-        """Initialize the LinkedHashTable.
+        """Initialize the ChainedLinkedHashTable.
 
         Args:
             initial_capacity: Initial number of buckets in the hash table
@@ -346,3 +357,157 @@ class LinkedHashTable(Generic[K, V]):
     def load_factor(self) -> float:
         """Get the current load factor of the table."""
         return self._load_factor
+
+
+class DictLinkedHashTable(Generic[K, V]):
+    """Hash table that maintains insertion order, backed by the built-in dict.
+
+    Drop-in replacement for ChainedLinkedHashTable: same constructor,
+    methods, iteration order and string representations. The dict already
+    keeps insertion order with O(1) operations, so every call is a single C
+    dict operation. ``capacity`` is kept for compatibility and grows exactly
+    like the chained table's bucket count; it does not size the dict.
+
+    Args:
+        initial_capacity: Initial capacity (default: 64)
+        load_factor: Size/capacity ratio that grows the capacity (default: 0.8)
+
+    Example:
+        >>> table = DictLinkedHashTable()
+        >>> table.put("file1", {"size": 1024, "type": "video"})
+        >>> table.put("file1", {"size": 2048, "type": "video"})
+        {'size': 1024, 'type': 'video'}
+        >>> list(table)
+        [('file1', {'size': 2048, 'type': 'video'})]
+    """
+
+    __slots__ = ("_capacity", "_data", "_grow_at", "_load_factor")
+
+    def __init__(self, initial_capacity: int = 64, load_factor: float = 0.8):
+        """Initialize the DictLinkedHashTable.
+
+        Args:
+            initial_capacity: Initial capacity of the table
+            load_factor: Threshold for capacity growth (0.0 to 1.0)
+        """
+        if initial_capacity <= 0:
+            raise ValueError("Initial capacity must be positive")
+        if not 0.0 < load_factor <= 1.0:
+            raise ValueError("Load factor must be between 0.0 and 1.0")
+
+        self._capacity = initial_capacity
+        self._load_factor = load_factor
+        self._grow_at = initial_capacity * load_factor
+        self._data: dict[K, V] = {}
+
+    def put(self, key: K, value: V) -> V | None:
+        """Insert or update a key-value pair.
+
+        Args:
+            key: The key to insert/update
+            value: The value to associate with the key
+
+        Returns:
+            Previous value if key existed, None otherwise
+        """
+        data = self._data
+        if key in data:
+            old_value = data[key]
+            data[key] = value
+            return old_value
+
+        data[key] = value
+        if len(data) >= self._grow_at:
+            # Same 1.5x growth as ChainedLinkedHashTable._rehash
+            self._capacity = int(self._capacity * 1.5)
+            self._grow_at = self._capacity * self._load_factor
+        return None
+
+    def get(self, key: K) -> V | None:
+        """Retrieve value for the given key.
+
+        Args:
+            key: The key to look up
+
+        Returns:
+            Value associated with the key, or None if not found
+        """
+        return self._data.get(key)
+
+    def remove(self, key: K) -> V | None:
+        """Remove the key-value pair for the given key.
+
+        Args:
+            key: The key to remove
+
+        Returns:
+            Value that was removed, or None if key not found
+        """
+        return self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Clear all key-value pairs from the table (capacity is kept)."""
+        self._data.clear()
+
+    def __iter__(self) -> Iterator[tuple[K, V]]:
+        """Iterate over key-value pairs in insertion order.
+
+        Yields:
+            Tuple of (key, value) pairs in insertion order
+        """
+        return iter(self._data.items())
+
+    def __len__(self) -> int:
+        """Return the number of key-value pairs in the table."""
+        return len(self._data)
+
+    def __contains__(self, key: K) -> bool:
+        """Check if the key exists in the table (keys mapped to None count as absent)."""
+        return self._data.get(key) is not None
+
+    def __str__(self) -> str:
+        """Return string representation of the table."""
+        if not self._data:
+            return "LinkedHashTable({})"
+        items = ", ".join(f"({key!r}, {value!r})" for key, value in self._data.items())
+        return f"LinkedHashTable([{items}])"
+
+    def __repr__(self) -> str:
+        """Return detailed string representation of the table."""
+        return f"LinkedHashTable(capacity={self._capacity}, size={len(self._data)}, load_factor={self._load_factor})"
+
+    @property
+    def size(self) -> int:
+        """Get the current number of elements in the table."""
+        return len(self._data)
+
+    @property
+    def capacity(self) -> int:
+        """Get the current capacity of the table."""
+        return self._capacity
+
+    @property
+    def load_factor(self) -> float:
+        """Get the current load factor of the table."""
+        return self._load_factor
+
+
+def use_legacy_implementation() -> bool:
+    """Whether ``ANIVAULT_LEGACY_LINKED_HASH_TABLE`` selects ChainedLinkedHashTable."""
+    return os.environ.get(LEGACY_IMPLEMENTATION_ENV, "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+if TYPE_CHECKING:
+    LinkedHashTable = DictLinkedHashTable
+else:
+    LinkedHashTable = ChainedLinkedHashTable if use_legacy_implementation() else DictLinkedHashTable
+
+
+__all__ = [
+    "LEGACY_IMPLEMENTATION_ENV",
+    "ChainedLinkedHashTable",
+    "DictLinkedHashTable",
+    "HashNode",
+    "LinkedHashTable",
+    "use_legacy_implementation",
+]
@@ -0,0 +1,173 @@
+"""Benchmark of duplicate resolution on a group with many release variants.
+
+Builds one group of ``--episodes`` episodes with ``--variants`` releases each
+(release groups, qualities, versions, codecs, sizes) and keeps the best file
+per episode three ways:
+
+- ``per_episode``: the previous implementation, as a baseline: files bucketed
+  by episode, one ``resolve_duplicates`` call per bucket, and version/quality
+  extracted with per-call ``re.search`` loops for every comparison key
+- ``batch``: ``DuplicateResolver.resolve_duplicates_by_episode`` on files
+  without cached features (precompiled patterns, one pass)
+- ``batch_cached``: the same call again, with the features cached on the files
+
+Run:
+    python -m anivault.core.duplicate_resolution_benchmark [--episodes 24] [--variants 250]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import re
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from anivault.core.file_grouper.duplicate_resolver import DuplicateResolver
+from anivault.core.models import ScannedFile
+from anivault.domain.entities.parser import ParsingResult
+
+_RELEASE_GROUPS = ("SubsPlease", "Erai-raws", "HorribleSubs", "Judas", "ASW", "EMBER", "Anime Time", "DKB")
+_QUALITIES = ("1080p", "720p", "480p", "2160p", "4K", "FHD", "HD", "SD", "")
+_VERSIONS = ("", "", "", "v2", "v3", "[v2]", "version2")
+_EXTRAS = ("HEVC", "x265", "x264", "WEB-DL", "BluRay", "10bit", "AAC", "Multi-Subs", "")
+
+
+def generate_release_variants(episodes: int, variants: int, seed: int = 42) -> list[ScannedFile]:
+    """One series' files with many releases of every episode.
+
+    Args:
+        episodes: Number of episodes
+        variants: Releases per episode
+        seed: Random seed
+
+    Returns:
+        ScannedFiles in interleaved (scan-like) order; paths are not created on disk
+    """
+    rng = random.Random(seed)
+    files = []
+    for index in range(episodes * variants):
+        episode = rng.randint(1, episodes)
+        quality = rng.choice(_QUALITIES)
+        tags = " ".join(f"[{tag}]" for tag in (quality, rng.choice(_EXTRAS), rng.choice(_EXTRAS)) if tag)
+        version = rng.choice(_VERSIONS)
+        name = f"[{rng.choice(_RELEASE_GROUPS)}] Sousou no Frieren - {episode:02d}{version} {tags} [{index:06X}].mkv"
+        files.append(
+            ScannedFile(
+                file_path=Path("/library/Frieren") / name,
+                metadata=ParsingResult(title="Sousou no Frieren", episode=episode),
+                file_size=rng.randint(200, 2000) * 1024 * 1024,
+            ),
+        )
+    return files
+
+
+def _legacy_extract_version(filename: str) -> int | None:
+    """Version extraction of the previous implementation (patterns compiled per call)."""
+    name_without_ext = Path(filename).stem
+    for pattern in (r"[_.\-\s]v(\d+)", r"[\[\(\{]v(\d+)[\]\)\}]", r"version[_.\-\s]?(\d+)", r"ver[_.\-\s]?(\d+)"):
+        match = re.search(pattern, name_without_ext, re.IGNORECASE)
+        if match:
+            return int(match.group(1))
+    return None
+
+
+def _legacy_extract_quality(sorted_quality_scores: list[tuple[str, int]], filename: str) -> int:
+    """Quality extraction of the previous implementation (one search per tag)."""
+    for quality_tag, score in sorted_quality_scores:
+        pattern = rf"(?:^|[_.\-\s\[]){re.escape(quality_tag)}(?:[_.\-\s\]]|$)"
+        if re.search(pattern, filename, re.IGNORECASE):
+            return score
+    return 0
+
+
+def _legacy_resolve_by_episode(resolver: DuplicateResolver, files: list[ScannedFile]) -> list[ScannedFile]:
+    """Best file per episode as the previous FileGrouper/DuplicateResolver pair computed it."""
+    sorted_quality_scores = resolver._sorted_quality_scores  # pylint: disable=protected-access
+
+    def comparison_key(file: ScannedFile) -> tuple[int, int, int]:
+        filename = file.file_path.name
+        return (
+            _legacy_extract_version(filename) or 0,
+            _legacy_extract_quality(sorted_quality_scores, filename),
+            file.file_size or 0,
+        )
+
+    by_episode: dict[Any, list[ScannedFile]] = {}
+    for file in files:
+        by_episode.setdefault(file.metadata.episode, []).append(file)
+    resolved: list[ScannedFile] = []
+    for episode, episode_files in by_episode.items():
+        if episode is None or len(episode_files) == 1:
+            resolved.extend(episode_files)
+        else:
+            resolved.append(sorted(episode_files, key=comparison_key, reverse=True)[0])
+    return resolved
+
+
+def _best_seconds(func: Callable[[], list[ScannedFile]], repeat: int, setup: Callable[[], None] | None = None) -> tuple[float, list[ScannedFile]]:
+    """Fastest of ``repeat`` runs of func (setup runs untimed before each); returns seconds and last result."""
+    best = float("inf")
+    result: list[ScannedFile] = []
+    for _ in range(max(1, repeat)):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def run_duplicate_resolution_benchmark(episodes: int = 24, variants: int = 250, repeat: int = 3, seed: int = 42) -> dict[str, Any]:
+    """Time per-episode and batch duplicate resolution on one group.
+
+    Args:
+        episodes: Number of episodes
+        variants: Releases per episode
+        repeat: Runs per method (fastest is reported)
+        seed: Random seed
+
+    Returns:
+        Seconds per method, speedups over ``per_episode`` and whether all
+        methods selected the same files
+    """
+    files = generate_release_variants(episodes, variants, seed)
+    resolver = DuplicateResolver()
+
+    def clear_features() -> None:
+        for file in files:
+            file.duplicate_features = None
+
+    legacy_seconds, legacy = _best_seconds(lambda: _legacy_resolve_by_episode(resolver, files), repeat)
+    batch_seconds, batch = _best_seconds(lambda: resolver.resolve_duplicates_by_episode(files), repeat, clear_features)
+    cached_seconds, cached = _best_seconds(lambda: resolver.resolve_duplicates_by_episode(files), repeat)
+
+    return {
+        "files": len(files),
+        "episodes": episodes,
+        "per_episode": {"seconds": legacy_seconds},
+        "batch": {"seconds": batch_seconds, "speedup": legacy_seconds / batch_seconds if batch_seconds else 0.0},
+        "batch_cached": {"seconds": cached_seconds, "speedup": legacy_seconds / cached_seconds if cached_seconds else 0.0},
+        "identical": [id(file) for file in legacy] == [id(file) for file in batch] == [id(file) for file in cached],
+    }
+
+
+def main() -> None:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark per-episode vs batch duplicate resolution")
+    parser.add_argument("--episodes", type=int, default=24)
+    parser.add_argument("--variants", type=int, default=250, help="Releases per episode")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    print(json.dumps(run_duplicate_resolution_benchmark(args.episodes, args.variants, args.repeat, args.seed), indent=2))
+
+
+__all__ = ["generate_release_variants", "run_duplicate_resolution_benchmark"]
+
+
+if __name__ == "__main__":
+    main()
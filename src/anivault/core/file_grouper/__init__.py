@@ -6,7 +6,7 @@ filename similarity, season/episode patterns, and other matching strategies.
 Public API (Stable):
     - FileGrouper: Main facade for file grouping operations
     - group_similar_files: Convenience function for simple grouping
-    - Group, GroupingEvidence: Data models
+    - Group, GroupingEvidence, GroupingState: Data models
 
 Advanced API (For custom implementations):
     - GroupingEngine: Orchestrates multiple matching strategies
@@ -43,6 +43,7 @@ from anivault.core.file_grouper.matchers.base import BaseMatcher
 from anivault.core.file_grouper.models import (
     Group,
     GroupingEvidence,
+    GroupingState,
 )
 
 # Advanced API - Grouping strategies
@@ -63,6 +64,7 @@ __all__ = [
     "GroupNameManager",
     "GroupingEngine",
     "GroupingEvidence",
+    "GroupingState",
     "GroupingStrategy",
     "ResolutionConfig",
     "TitleExtractor",
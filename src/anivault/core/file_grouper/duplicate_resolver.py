@@ -2,19 +2,64 @@
 
 This module provides functionality to resolve duplicate files by selecting
 the best version based on version number, quality, and file size.
+
+Version and quality patterns are compiled once: the version patterns behind a
+single pre-filter, the quality tags as one alternation per resolver. The
+(version, quality, size) features of a file are cached on the ScannedFile, and
+``resolve_duplicates_by_episode`` picks the best file of every episode of a
+group in one pass.
 """
 
 from __future__ import annotations
 
 import logging
 import re
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any
 
 from anivault.core.models import ScannedFile
 
 logger = logging.getLogger(__name__)
 
+# Version patterns in order of precedence (the first pattern that matches wins)
+_VERSION_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"[_.\-\s]v(\d+)",  # _v1, .v2, -v3, v4
+        r"[\[\(\{]v(\d+)[\]\)\}]",  # [v1], (v2), {v3}
+        r"version[_.\-\s]?(\d+)",  # version1, version_2, version.3
+        r"ver[_.\-\s]?(\d+)",  # ver1, ver_2, ver.3
+    )
+)
+# Matches wherever any version pattern could: names without it skip the patterns
+_VERSION_HINT = re.compile(r"v(?:er(?:sion)?)?[_.\-\s]?\d", re.IGNORECASE)
+
+# Delimiters around quality tags (before / after the tag)
+_QUALITY_DELIMITERS_BEFORE = r"_.\-\s\["
+_QUALITY_DELIMITERS_AFTER = r"_.\-\s\]"
+_QUALITY_DELIMITER_CHARS = re.compile(r"[_.\-\s\[\]]")
+
+
+@dataclass(frozen=True)
+class DuplicateFeatures:
+    """Duplicate resolution features of a file, cached on its ScannedFile.
+
+    Attributes:
+        file_name: File name the features were extracted from
+        file_size: File size at extraction time (0 if unknown)
+        quality_table: Quality tags/scores of the resolver that extracted them
+        version: Version number (0 if none)
+        quality: Quality score (0 if no quality tag)
+    """
+
+    file_name: str
+    file_size: int
+    quality_table: tuple[tuple[str, int], ...] = field(repr=False)
+    version: int
+    quality: int
+
 
 @dataclass
 class ResolutionConfig:
@@ -94,6 +139,38 @@ class DuplicateResolver:
             key=lambda x: x[1],
             reverse=True,
         )
+        self._quality_table = tuple(self._sorted_quality_scores)
+        self._compile_quality_patterns()
+
+    def _compile_quality_patterns(self) -> None:
+        """Compile the quality tags into one alternation (plus per-tag patterns where needed).
+
+        Tags without delimiter characters always match a whole delimited
+        token, so one ``finditer`` pass finds every tag in a name. Tags that
+        contain delimiters (or are empty) may overlap other matches and keep
+        an individual pattern.
+        """
+        simple = [(tag, score) for tag, score in self._sorted_quality_scores if tag and not _QUALITY_DELIMITER_CHARS.search(tag)]
+        self._quality_lookup: dict[str, int] = {}
+        for tag, score in simple:
+            self._quality_lookup[tag.lower()] = max(score, self._quality_lookup.get(tag.lower(), score))
+        self._quality_pattern = (
+            re.compile(
+                rf"(?<![^{_QUALITY_DELIMITERS_BEFORE}])"
+                rf"(?:{'|'.join(re.escape(tag) for tag, _ in sorted(simple, key=lambda item: len(item[0]), reverse=True))})"
+                rf"(?![^{_QUALITY_DELIMITERS_AFTER}])",
+                re.IGNORECASE,
+            )
+            if simple
+            else None
+        )
+        self._simple_quality_tags = simple
+        # Highest score first, like _sorted_quality_scores
+        self._delimited_quality_patterns = [
+            (re.compile(rf"(?:^|[{_QUALITY_DELIMITERS_BEFORE}]){re.escape(tag)}(?:[{_QUALITY_DELIMITERS_AFTER}]|$)", re.IGNORECASE), score)
+            for tag, score in self._sorted_quality_scores
+            if (tag, score) not in simple
+        ]
 
     def resolve_duplicates(self, files: list[ScannedFile]) -> ScannedFile:
         """Select the best file from a list of duplicates.
@@ -127,32 +204,131 @@ class DuplicateResolver:
         if len(files) == 1:
             return files[0]
 
-        # Sort files by all criteria
-        def comparison_key(file: ScannedFile) -> tuple[int, int, int]:
-            """Generate comparison key for sorting.
-
-            Returns:
-                Tuple of (version, quality_score, file_size) for sorting.
-                Higher values are considered better.
-            """
-            filename = file.file_path.name
-            version = self._extract_version(filename) or 0
-            quality_score = self._extract_quality(filename)
-            file_size = file.file_size or 0
-
-            # Apply configuration preferences
-            if not self.config.prefer_higher_version:
-                version = -version
-            if not self.config.prefer_higher_quality:
-                quality_score = -quality_score
-            if not self.config.prefer_larger_size:
-                file_size = -file_size
-
-            return (version, quality_score, file_size)
-
-        # Sort in descending order (best first)
-        sorted_files = sorted(files, key=comparison_key, reverse=True)
-        return sorted_files[0]
+        # Best first; ties keep the earliest file
+        signs = self._preference_signs()
+        return max(files, key=lambda file: self._comparison_key(file, signs))
+
+    def resolve_duplicates_by_episode(self, files: list[ScannedFile]) -> list[ScannedFile]:
+        """Keep the best file of every episode of a group, in one pass.
+
+        Files are bucketed by ``metadata.episode``; the best file of each
+        episode is selected as by ``resolve_duplicates``. Features are only
+        extracted for episodes with more than one file (and cached on the
+        files). Files without an episode number are all kept.
+
+        Args:
+            files: Files of one group.
+
+        Returns:
+            One file per episode plus all files without an episode, in order
+            of each episode's first file (files without an episode at the
+            position of the first of them).
+
+        Example:
+            >>> files = [
+            ...     ScannedFile(file_path=Path("anime_01_720p.mkv"), metadata=ParsingResult(title="Anime", episode=1)),
+            ...     ScannedFile(file_path=Path("anime_01_1080p.mkv"), metadata=ParsingResult(title="Anime", episode=1)),
+            ... ]
+            >>> [file.file_path.name for file in resolver.resolve_duplicates_by_episode(files)]
+            ['anime_01_1080p.mkv']
+        """
+        signs = self._preference_signs()
+        # Episode -> [best file, its comparison key (None while the episode has one file)]
+        best: dict[Any, list[Any]] = {}
+        unnumbered: list[ScannedFile] = []
+        for file in files:
+            metadata = getattr(file, "metadata", None)
+            episode = getattr(metadata, "episode", None) if metadata else None
+            if episode is None:
+                best.setdefault(None, [])
+                unnumbered.append(file)
+                continue
+            entry = best.get(episode)
+            if entry is None:
+                best[episode] = [file, None]
+                continue
+            if entry[1] is None:
+                entry[1] = self._comparison_key(entry[0], signs)
+            key = self._comparison_key(file, signs)
+            if key > entry[1]:
+                entry[0], entry[1] = file, key
+
+        return [file for episode, entry in best.items() for file in (unnumbered if episode is None else entry[:1])]
+
+    def extract_features(self, files: Iterable[ScannedFile]) -> list[DuplicateFeatures]:
+        """(version, quality, size) features of files, cached on the files.
+
+        Args:
+            files: Files to extract features from.
+
+        Returns:
+            Features in input order.
+        """
+        return [self._features(file) for file in files]
+
+    def _preference_signs(self) -> tuple[int, int, int]:
+        """Sign applied to (version, quality, size): 1 to prefer higher values, -1 for lower."""
+        return (
+            1 if self.config.prefer_higher_version else -1,
+            1 if self.config.prefer_higher_quality else -1,
+            1 if self.config.prefer_larger_size else -1,
+        )
+
+    def _comparison_key(self, file: ScannedFile, signs: tuple[int, int, int]) -> tuple[int, int, int]:
+        """Comparison key of a file: higher is better."""
+        features = self._features(file)
+        return (signs[0] * features.version, signs[1] * features.quality, signs[2] * features.file_size)
+
+    def _features(self, file: ScannedFile) -> DuplicateFeatures:
+        """Cached features of a file (re-extracted if its name, size or the quality table changed)."""
+        file_name = file.file_path.name
+        file_size = file.file_size or 0
+        cached = file.duplicate_features
+        if (
+            isinstance(cached, DuplicateFeatures)
+            and cached.file_name == file_name
+            and cached.file_size == file_size
+            and (cached.quality_table is self._quality_table or cached.quality_table == self._quality_table)
+        ):
+            return cached
+
+        features = DuplicateFeatures(
+            file_name=file_name,
+            file_size=file_size,
+            quality_table=self._quality_table,
+            version=self._match_version(file.file_path.stem) or 0,
+            quality=self._match_quality(file_name),
+        )
+        file.duplicate_features = features
+        return features
+
+    @staticmethod
+    def _match_version(name_without_ext: str) -> int | None:
+        """Version number in a file name without extension (see _extract_version)."""
+        if not _VERSION_HINT.search(name_without_ext):
+            return None
+        for pattern in _VERSION_PATTERNS:
+            match = pattern.search(name_without_ext)
+            if match:
+                return int(match.group(1))
+        return None
+
+    def _match_quality(self, filename: str) -> int:
+        """Highest quality score of the tags in a file name (see _extract_quality)."""
+        score = 0
+        if self._quality_pattern is not None:
+            for match in self._quality_pattern.finditer(filename):
+                tag_score = self._quality_lookup.get(match.group(0).lower())
+                if tag_score is None:
+                    # Case-insensitive match whose lowercase differs from the tag's
+                    tag_score = max(s for tag, s in self._simple_quality_tags if re.fullmatch(re.escape(tag), match.group(0), re.IGNORECASE))
+                score = max(score, tag_score)
+        for pattern, tag_score in self._delimited_quality_patterns:
+            if tag_score <= score:
+                break
+            if pattern.search(filename):
+                score = tag_score
+        return score
 
     def _extract_version(self, filename: str) -> int | None:
         """Extract version number from filename.
@@ -179,33 +355,12 @@ class DuplicateResolver:
             >>> resolver._extract_version("anime_no_version.mkv")
             None
         """
-        # Remove file extension
-        name_without_ext = Path(filename).stem
-
-        # Version patterns (in order of specificity)
-        version_patterns = [
-            r"[_.\-\s]v(\d+)",  # _v1, .v2, -v3, v4
-            r"[\[\(\{]v(\d+)[\]\)\}]",  # [v1], (v2), {v3}
-            r"version[_.\-\s]?(\d+)",  # version1, version_2, version.3
-            r"ver[_.\-\s]?(\d+)",  # ver1, ver_2, ver.3
-        ]
-
-        for pattern in version_patterns:
-            match = re.search(pattern, name_without_ext, re.IGNORECASE)
-            if match:
-                try:
-                    version = int(match.group(1))
-                    logger.debug(
-                        "Extracted version %d from filename: %s",
-                        version,
-                        filename,
-                    )
-                    return version
-                except (ValueError, IndexError):
-                    continue
-
-        logger.debug("No version found in filename: %s", filename)
-        return None
+        version = self._match_version(Path(filename).stem)
+        if version is None:
+            logger.debug("No version found in filename: %s", filename)
+        else:
+            logger.debug("Extracted version %d from filename: %s", version, filename)
+        return version
 
     def _extract_quality(self, filename: str) -> int:
         """Extract quality score from filename.
@@ -237,24 +392,12 @@ class DuplicateResolver:
             >>> resolver._extract_quality("anime.mkv")
             0
         """
-        # Use cached sorted quality (built once in __init__)
-        for quality_tag, score in self._sorted_quality_scores:
-            # Build pattern that matches the quality tag (case-insensitive)
-            # Match tag surrounded by delimiters or at boundaries
-            escaped_tag = re.escape(quality_tag)
-            # Match tag with word boundaries (considering underscore, dot, space as delimiters)
-            pattern = rf"(?:^|[_.\-\s\[]){escaped_tag}(?:[_.\-\s\]]|$)"
-            if re.search(pattern, filename, re.IGNORECASE):
-                logger.debug(
-                    "Extracted quality %s (score=%d) from filename: %s",
-                    quality_tag,
-                    score,
-                    filename,
-                )
-                return score
-
-        logger.debug("No quality tag found in filename: %s", filename)
-        return 0
+        score = self._match_quality(filename)
+        if score:
+            logger.debug("Extracted quality score %d from filename: %s", score, filename)
+        else:
+            logger.debug("No quality tag found in filename: %s", filename)
+        return score
 
 
 def resolve_duplicates(
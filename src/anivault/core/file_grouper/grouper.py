@@ -10,18 +10,23 @@ from __future__ import annotations
 import logging
 import re
 from collections import defaultdict
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Any
 
+from anivault.config.models.grouping_settings import GroupingSettings
 from anivault.core.file_grouper.duplicate_resolver import DuplicateResolver
 from anivault.core.file_grouper.grouping_engine import GroupingEngine
+from anivault.core.file_grouper.matchers.base import BaseMatcher
 from anivault.core.file_grouper.matchers.hash_matcher import HashSimilarityMatcher
 from anivault.core.file_grouper.matchers.season_matcher import SeasonEpisodeMatcher
 from anivault.core.file_grouper.matchers.title_matcher import TitleSimilarityMatcher
-from anivault.core.file_grouper.models import Group
+from anivault.core.file_grouper.matchers.title_signature_store import TitleSignatureStore
+from anivault.core.file_grouper.models import Group, GroupingState
 from anivault.core.models import ScannedFile
+from anivault.core.normalization import get_normalization_cache
 from anivault.core.parser.anitopy_parser import AnitopyParser
-from anivault.shared.constants import BusinessRules
+from anivault.shared.constants import BusinessRules, FileSystem
 from anivault.shared.constants.core import SimilarityConfig
 from anivault.shared.constants.filename_patterns import (
     ADDITIONAL_CLEANUP_PATTERNS,
@@ -40,6 +45,7 @@ from anivault.shared.errors import (
     InfrastructureError,
 )
 from anivault.shared.logging import log_operation_error
+from anivault.utils.resource_path import get_project_root
 
 logger = logging.getLogger(__name__)
 
@@ -52,7 +58,11 @@ class TitleExtractor:
         self.parser = AnitopyParser()
 
     def extract_base_title(self, filename: str) -> str:
-        """Extract base title from filename."""
+        """Extract base title from filename (memoized in the normalization cache)."""
+        return get_normalization_cache().get_or_compute("base_title", filename, self._extract_base_title)
+
+    def _extract_base_title(self, filename: str) -> str:
+        """Uncached ``extract_base_title``."""
         try:
             name_without_ext = Path(filename).stem
             patterns_to_remove = ALL_CLEANING_PATTERNS
@@ -83,7 +93,11 @@ class TitleExtractor:
             return "unknown"
 
     def extract_title_with_parser(self, filename: str) -> str:
-        """Extract title using anitopy parser."""
+        """Extract title using anitopy parser (memoized in the normalization cache)."""
+        return get_normalization_cache().get_or_compute("parser_title", filename, self._extract_title_with_parser)
+
+    def _extract_title_with_parser(self, filename: str) -> str:
+        """Uncached ``extract_title_with_parser``."""
         try:
             parsed = self.parser.parse(filename)
             # parser.parse() returns ParsingResult (dataclass) in production,
@@ -300,16 +314,18 @@ class FileGrouper:
         Returns:
             Configured GroupingEngine instance
         """
-        # Load matching weights from config
+        # Load matching weights and grouping settings from config
         try:
-            from anivault.config import load_settings
+            from anivault.config import get_settings_snapshot
 
-            settings = load_settings()
+            settings = get_settings_snapshot().settings
             weights = settings.matching_weights
+            grouping_settings = settings.grouping or GroupingSettings()
         except (ImportError, AttributeError):
             from anivault.config.models.matching_weights import MatchingWeights
 
             weights = MatchingWeights()
+            grouping_settings = GroupingSettings()
 
         # Create helper instances for matchers
         title_extractor = TitleExtractor()
@@ -320,12 +336,25 @@ class FileGrouper:
         # otherwise use weights.title_similarity_threshold
         threshold = similarity_threshold if similarity_threshold != BusinessRules.FUZZY_MATCH_THRESHOLD else None
 
-        title_matcher = TitleSimilarityMatcher(
-            title_extractor=title_extractor,
-            quality_evaluator=quality_evaluator,
-            threshold=threshold,
-            weights=weights,
-        )
+        title_matcher: BaseMatcher
+        if grouping_settings.title_matcher_backend == "tfidf":
+            # Deferred import: scikit-learn is only loaded when the backend is selected
+            from anivault.core.file_grouper.matchers.tfidf_title_matcher import TfidfTitleMatcher
+
+            title_matcher = TfidfTitleMatcher(
+                title_extractor=title_extractor,
+                quality_evaluator=quality_evaluator,
+                threshold=grouping_settings.tfidf_similarity_threshold,
+                top_k=grouping_settings.tfidf_top_k,
+            )
+        else:
+            title_matcher = TitleSimilarityMatcher(
+                title_extractor=title_extractor,
+                quality_evaluator=quality_evaluator,
+                threshold=threshold,
+                weights=weights,
+                signature_store=self._create_signature_store(grouping_settings),
+            )
         hash_matcher = HashSimilarityMatcher(
             title_extractor=title_extractor,
             weights=weights,
@@ -337,6 +366,21 @@ class FileGrouper:
             matchers=[title_matcher, hash_matcher, season_matcher],
         )
 
+    def _create_signature_store(self, grouping_settings: GroupingSettings) -> TitleSignatureStore:
+        """Create the MinHash signature store for TitleSimilarityMatcher.
+
+        Signatures are persisted in the cache directory when
+        ``grouping.persist_title_signatures`` is set (in memory otherwise, or
+        if the project root cannot be determined).
+        """
+        cache_file = None
+        if grouping_settings.persist_title_signatures:
+            try:
+                cache_file = get_project_root() / FileSystem.CACHE_DIRECTORY / FileSystem.TITLE_SIGNATURE_CACHE_FILE
+            except RuntimeError as e:
+                logger.debug("Title signatures kept in memory only: %s", e)
+        return TitleSignatureStore(cache_file)
+
     def _create_default_resolver(self) -> DuplicateResolver:
         """Create default DuplicateResolver.
 
@@ -437,6 +481,134 @@ class FileGrouper:
             self._handle_grouping_error(e, context)
             raise
 
+    def group_files_incremental(
+        self,
+        scanned_files: list[ScannedFile],
+        state: GroupingState | None = None,
+        resolve_duplicates: bool = False,
+    ) -> tuple[list[Group], GroupingState]:
+        """Group files, re-grouping only what changed since a previous run.
+
+        Files are routed to hash keys (the Hash matcher's normalized title).
+        Keys whose files were added, removed, modified or reordered since
+        ``state`` are re-grouped by the engine; the stored groups of all other
+        keys are reused. Duplicate resolution and group name normalization run
+        over the combined groups as in ``group_files``, so the result equals
+        ``group_files(scanned_files, resolve_duplicates)``.
+
+        Args:
+            scanned_files: All files to group (not only the changed ones)
+            state: State returned by a previous call (None: group everything)
+            resolve_duplicates: See ``group_files``
+
+        Returns:
+            Tuple of (groups, state for the next call)
+
+        Raises:
+            InfrastructureError: If grouping fails
+
+        Example:
+            >>> groups, state = grouper.group_files_incremental(scanned_files)
+            >>> groups, state = grouper.group_files_incremental(scanned_files + new_files, state)
+        """
+        context = ErrorContextModel(
+            operation="group_files_incremental",
+            additional_data={"file_count": len(scanned_files)},
+        )
+
+        try:
+            engine_groups, new_state = self._run_grouping_engine_incremental(scanned_files, state)
+            # Copies: later steps replace file lists, stored groups must stay intact
+            groups = [Group(title=group.title, files=list(group.files), evidence=group.evidence) for group in engine_groups]
+
+            if resolve_duplicates:
+                groups = self._resolve_duplicates_in_groups(groups)
+
+            final_groups = self._normalize_and_reconstruct_groups(groups)
+            return final_groups, new_state
+
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            self._handle_grouping_error(e, context)
+            raise
+
+    def update_groups(
+        self,
+        state: GroupingState,
+        added: Iterable[ScannedFile] = (),
+        removed: Iterable[Path] = (),
+        resolve_duplicates: bool = False,
+    ) -> tuple[list[Group], GroupingState]:
+        """Apply a delta of added/removed files to a previous grouping.
+
+        The new file list is the previous one without ``removed`` followed by
+        ``added`` (an added file replaces a previous file with the same path).
+
+        Args:
+            state: State returned by a previous incremental call
+            added: New or modified files
+            removed: Paths of files that are gone
+            resolve_duplicates: See ``group_files``
+
+        Returns:
+            Tuple of (groups, state for the next call)
+        """
+        added_files = list(added)
+        dropped = set(removed) | {file.file_path for file in added_files}
+        files = [file for path, file in state.files.items() if path not in dropped]
+        return self.group_files_incremental(files + added_files, state, resolve_duplicates)
+
+    def _run_grouping_engine_incremental(
+        self,
+        scanned_files: list[ScannedFile],
+        state: GroupingState | None,
+    ) -> tuple[list[Group], GroupingState]:
+        """Engine groups for scanned_files, re-running the engine only on affected hash keys."""
+        hash_matcher = self.engine.key_local_hash_matcher()
+        if hash_matcher is None:
+            logger.debug("Engine results are not partitioned by hash key, grouping all files")
+            all_files = {file.file_path: file for file in scanned_files}
+            return self._run_grouping_engine(scanned_files), GroupingState(files=all_files, incremental=False)
+
+        previous = state if state is not None and state.incremental else GroupingState()
+        files: dict[Path, ScannedFile] = {}
+        file_keys: dict[Path, str | None] = {}
+        key_paths: dict[str | None, list[Path]] = {}
+        affected: set[str | None] = set()
+        for file in scanned_files:
+            path = file.file_path
+            old = previous.files.get(path)
+            if old is not None and (old is file or old == file):
+                key = previous.file_keys[path]
+            else:
+                key = self.engine.hash_key(hash_matcher, file)
+                affected.add(key)
+            files[path] = file
+            file_keys[path] = key
+            key_paths.setdefault(key, []).append(path)
+
+        frozen_paths = {key: tuple(paths) for key, paths in key_paths.items()}
+        affected.update(key for key, paths in frozen_paths.items() if previous.key_paths.get(key) != paths)
+        affected &= frozen_paths.keys()
+
+        affected_files = [file for file in scanned_files if file_keys[file.file_path] in affected]
+        fresh: dict[str | None, list[Group]] = {}
+        for group in self._run_grouping_engine(affected_files) if affected_files else []:
+            if group.files:
+                fresh.setdefault(file_keys[group.files[0].file_path], []).append(group)
+
+        key_groups = {key: tuple(fresh.get(key, ())) if key in affected else previous.key_groups.get(key, ()) for key in frozen_paths}
+        logger.info(
+            "Incremental grouping: re-grouped %d of %d hash key(s) (%d of %d files)",
+            len(affected),
+            len(frozen_paths),
+            len(affected_files),
+            len(scanned_files),
+        )
+
+        new_state = GroupingState(files=files, file_keys=file_keys, key_paths=frozen_paths, key_groups=key_groups)
+        # Keys in order of first appearance: the engine's (Hash group) output order
+        return [group for groups in key_groups.values() for group in groups], new_state
+
     def _run_grouping_engine(self, scanned_files: list[ScannedFile]) -> list[Group]:
         """Run GroupingEngine to create initial groups.
 
@@ -464,13 +636,7 @@ class FileGrouper:
         """Resolve duplicates within a single group (one file per episode)."""
         if not group.has_duplicates():
             return
-        by_episode = self._group_files_by_episode(group.files)
-        resolved: list[ScannedFile] = []
-        for ep, files_for_ep in by_episode.items():
-            if ep is None or len(files_for_ep) == 1:
-                resolved.extend(files_for_ep)
-            else:
-                resolved.append(self.resolver.resolve_duplicates(files_for_ep))
+        resolved = self.resolver.resolve_duplicates_by_episode(group.files)
         group.files = resolved
         logger.debug(
             "Group '%s': resolved duplicates to %d file(s) (one per episode)",
@@ -478,15 +644,6 @@ class FileGrouper:
             len(resolved),
         )
 
-    @staticmethod
-    def _group_files_by_episode(files: list[ScannedFile]) -> dict[int | None, list[ScannedFile]]:
-        """Group files by episode key (None for unparseable)."""
-        by_episode: dict[int | None, list[ScannedFile]] = {}
-        for f in files:
-            ep = getattr(f.metadata, "episode", None) if hasattr(f, "metadata") and f.metadata else None
-            by_episode.setdefault(ep, []).append(f)
-        return by_episode
-
     def _normalize_and_reconstruct_groups(self, groups: list[Group]) -> list[Group]:
         """Normalize group names and reconstruct Group objects with evidence.
 
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from anivault.config import load_settings
+from anivault.config import get_settings_snapshot
 from anivault.config.models.matching_weights import MatchingWeights
 
 
@@ -13,7 +13,7 @@ def get_default_weights_from_config() -> dict[str, float]:
         Dictionary mapping matcher component_name to weight.
     """
     try:
-        settings = load_settings()
+        settings = get_settings_snapshot().settings
         weights = settings.matching_weights
         return {
             "title": weights.grouping_title_weight,
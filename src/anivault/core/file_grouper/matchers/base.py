@@ -31,6 +31,17 @@ class BaseMatcher(Protocol):
         component_name: Unique identifier for this matcher (e.g., "title", "hash", "season").
                        Used for logging, evidence tracking, and weighted scoring.
 
+    Optional attributes (not part of the Protocol check):
+        gil_bound: True for pure-Python matchers that hold the GIL while
+                   matching. GroupingEngine runs them in a process pool when
+                   ``grouping.matcher_process_pool`` is enabled (the matcher and
+                   its inputs must be picklable); other matchers run on threads.
+        export_shard_state / merge_shard_states: Called by GroupingEngine in
+                   sharded mode. Each shard worker's (pickled) copy of the
+                   matcher exports state it built (e.g. caches) after
+                   grouping its shard; the original matcher merges the list
+                   of exported states.
+
     Example:
         >>> class CustomMatcher:
         ...     component_name = "custom"
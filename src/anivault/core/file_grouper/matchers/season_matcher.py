@@ -28,6 +28,7 @@ class SeasonEpisodeMatcher:
 
     Attributes:
         component_name: Identifier for this matcher ("season").
+        gil_bound: Pure-Python matching (eligible for GroupingEngine's process pool).
 
     Example:
         >>> matcher = SeasonEpisodeMatcher()
@@ -38,6 +39,8 @@ class SeasonEpisodeMatcher:
         12
     """
 
+    gil_bound = True
+
     def __init__(self, weights: MatchingWeights | None = None) -> None:
         """Initialize the season/episode matcher.
 
@@ -48,9 +51,9 @@ class SeasonEpisodeMatcher:
         # Load weights if not provided
         if weights is None:
             try:
-                from anivault.config import load_settings
+                from anivault.config import get_settings_snapshot
 
-                settings = load_settings()
+                settings = get_settings_snapshot().settings
                 weights = settings.matching_weights
             except (ImportError, AttributeError):
                 weights = MatchingWeights()
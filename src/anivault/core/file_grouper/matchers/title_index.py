@@ -1,15 +1,17 @@
 """Title index for efficient matching using keyword indexing and LSH.
 
 Extracted from title_matcher.py for better code organization.
-Provides O(1) lookup for exact matches and LSH-based similarity search.
+Provides O(1) lookup for exact matches and LSH-based similarity search
+(signatures and LSH index live in a shared TitleSignatureStore).
 """
 
 from __future__ import annotations
 
 import logging
 import re
+from collections.abc import Iterable
 
-from datasketch import MinHash, MinHashLSH
+from .title_signature_store import DEFAULT_LSH_THRESHOLD, DEFAULT_NUM_PERM, TitleSignatureStore
 
 logger = logging.getLogger(__name__)
 
@@ -40,11 +42,15 @@ class TitleIndex:
     """Index for efficient title matching using keyword indexing and normalized hashing.
 
     This class provides O(1) lookup for exact matches and efficient filtering
-    for similar titles using keyword-based indexing.
+    for similar titles using keyword-based indexing. Similarity candidates come
+    from a MinHash LSH index keyed by normalized title, held by a
+    TitleSignatureStore that can be shared (and persisted) across indexes and
+    runs, so each distinct title is hashed once.
 
     Attributes:
         keyword_index: Dictionary mapping keywords to sets of file IDs.
         normalized_hash: Dictionary mapping normalized titles to sets of file IDs (O(1) add/remove/lookup).
+        signature_store: MinHash signatures and LSH index keyed by normalized title.
 
     Example:
         >>> index = TitleIndex()
@@ -55,13 +61,21 @@ class TitleIndex:
         1
     """
 
-    def __init__(self, lsh_threshold: float = 0.5, num_perm: int = 128) -> None:
+    def __init__(
+        self,
+        lsh_threshold: float = DEFAULT_LSH_THRESHOLD,
+        num_perm: int = DEFAULT_NUM_PERM,
+        signature_store: TitleSignatureStore | None = None,
+    ) -> None:
         """Initialize an empty TitleIndex.
 
         Args:
             lsh_threshold: Jaccard similarity threshold for LSH (0.0-1.0). Default 0.5.
             num_perm: Number of permutations for MinHash. Higher = more accurate but slower.
-                     Default 128 (good balance). Will be adjusted dynamically based on title length.
+                     Default 128 (good balance).
+            signature_store: Shared signature store. If None, a private in-memory
+                            store with lsh_threshold and num_perm is created
+                            (otherwise the store's parameters apply).
         """
         self.keyword_index: dict[str, set[int]] = {}
         self.normalized_hash: dict[str, set[int]] = {}
@@ -69,14 +83,7 @@ class TitleIndex:
         self.reverse_keyword_index: dict[int, set[str]] = {}
         # Reverse index: file_id -> normalized title (for efficient removal)
         self.file_id_to_normalized: dict[int, str] = {}
-        # LSH index for approximate similarity search
-        self.lsh_index: MinHashLSH = MinHashLSH(threshold=lsh_threshold, num_perm=num_perm)
-        # Store MinHash objects for each file_id (for querying)
-        self.file_id_to_minhash: dict[int, MinHash] = {}
-        # Soft-deleted keys (for incremental updates)
-        self.deleted_keys: set[int] = set()
-        # Base num_perm for dynamic adjustment
-        self.base_num_perm = num_perm
+        self.signature_store = signature_store if signature_store is not None else TitleSignatureStore(num_perm=num_perm, lsh_threshold=lsh_threshold)
 
     def _normalize_title(self, title: str) -> str:
         """Normalize title for indexing and matching."""
@@ -114,76 +121,38 @@ class TitleIndex:
 
         return normalized.strip()
 
-    def add_title(self, file_id: int, title: str) -> None:
-        """Add a title to the index."""
+    def _index_file(self, file_id: int, title: str) -> str | None:
+        """Add a file to the keyword and exact-match indexes; return its normalized title."""
         if not title:
-            return
+            return None
 
         normalized = self._normalize_title(title)
         if not normalized:
-            return
+            return None
 
-        self.normalized_hash.setdefault(normalized, set()).add(file_id)
+        if file_id in self.file_id_to_normalized:
+            self.remove_file(file_id)
 
+        self.normalized_hash.setdefault(normalized, set()).add(file_id)
         self.file_id_to_normalized[file_id] = normalized
 
         keyword_set: set[str] = set()
         for keyword in normalized.split():
             if keyword:
-                if keyword not in self.keyword_index:
-                    self.keyword_index[keyword] = set()
-                self.keyword_index[keyword].add(file_id)
+                self.keyword_index.setdefault(keyword, set()).add(file_id)
                 keyword_set.add(keyword)
 
         self.reverse_keyword_index[file_id] = keyword_set
+        return normalized
 
-        minhash = self._create_minhash_from_title(normalized)
-        if minhash is not None:
-            if file_id in self.file_id_to_minhash:
-                self.deleted_keys.add(file_id)
-                logger.debug("File ID %d already in LSH, soft-deleting old entry", file_id)
-
-            self.file_id_to_minhash[file_id] = minhash
-            self.deleted_keys.discard(file_id)
-
-            try:
-                self.lsh_index.insert(file_id, minhash)
-            except ValueError:
-                logger.debug(
-                    "LSH key %d already exists in index, will use soft-delete filtering",
-                    file_id,
-                )
-
-    def _create_minhash_from_title(self, normalized_title: str, num_perm: int | None = None) -> MinHash | None:
-        """Create MinHash signature from normalized title using shingling."""
-        if not normalized_title:
-            return None
-
-        if num_perm is None:
-            num_perm = self.lsh_index.h
-
-        shingles: set[str] = set()
-        n = 3
-
-        for i in range(len(normalized_title) - n + 1):
-            shingle = normalized_title[i : i + n]
-            shingles.add(shingle)
-
-        if len(shingles) < 3:
-            words = normalized_title.split()
-            for word in words:
-                if len(word) >= 2:
-                    for j in range(len(word) - 1):
-                        shingles.add(word[j : j + 2])
-
-        if not shingles:
-            return None
-
-        minhash = MinHash(num_perm=num_perm)
-        for shingle in shingles:
-            minhash.update(shingle.encode("utf-8"))
+    def add_title(self, file_id: int, title: str) -> None:
+        """Add a title to the index."""
+        self.add_titles(((file_id, title),))
 
-        return minhash
+    def add_titles(self, items: Iterable[tuple[int, str]]) -> None:
+        """Add (file_id, title) pairs, hashing unseen titles in one bulk pass."""
+        normalized_titles = [normalized for file_id, title in items if (normalized := self._index_file(file_id, title))]
+        self.signature_store.index_titles(normalized_titles)
 
     def query_similar_titles(self, title: str) -> list[int]:
         """Query LSH index for titles similar to the given title."""
@@ -194,12 +163,11 @@ class TitleIndex:
         if not normalized:
             return []
 
-        query_minhash = self._create_minhash_from_title(normalized)
-        if query_minhash is None:
-            return []
-
-        candidate_ids = self.lsh_index.query(query_minhash)
-        return [file_id for file_id in candidate_ids if file_id not in self.deleted_keys]
+        candidate_ids: list[int] = []
+        for candidate_title in self.signature_store.query(normalized):
+            # The store's LSH index is shared: keep only titles of this index
+            candidate_ids.extend(self.normalized_hash.get(candidate_title, ()))
+        return candidate_ids
 
     def get_exact_matches(self, title: str) -> list[int]:
         """Get all file IDs with titles that normalize to the same string."""
@@ -213,13 +181,15 @@ class TitleIndex:
         return list(self.normalized_hash.get(normalized, set()))
 
     def add_file(self, file_id: int, title: str) -> None:
-        """Add a file to the index (public API for incremental updates)."""
-        self.deleted_keys.discard(file_id)
+        """Add a file to the index (public API for incremental updates).
+
+        Only titles never seen by the signature store are hashed.
+        """
         self.add_title(file_id, title)
 
     def remove_file(self, file_id: int) -> None:
         """Remove a file from the index."""
-        normalized = self.file_id_to_normalized.get(file_id)
+        normalized = self.file_id_to_normalized.pop(file_id, None)
 
         if normalized is None:
             return
@@ -229,19 +199,13 @@ class TitleIndex:
             if not self.normalized_hash[normalized]:
                 del self.normalized_hash[normalized]
 
-        keywords = self.reverse_keyword_index.get(file_id, set())
+        keywords = self.reverse_keyword_index.pop(file_id, set())
         for keyword in keywords:
             if keyword in self.keyword_index:
                 self.keyword_index[keyword].discard(file_id)
                 if not self.keyword_index[keyword]:
                     del self.keyword_index[keyword]
 
-        self.reverse_keyword_index.pop(file_id, None)
-        self.file_id_to_normalized.pop(file_id, None)
-
-        self.deleted_keys.add(file_id)
-        self.file_id_to_minhash.pop(file_id, None)
-
     def update_file(self, file_id: int, new_title: str) -> None:
         """Update a file's title in the index."""
         self.remove_file(file_id)
@@ -2,6 +2,15 @@
 
 This module implements title-based grouping using fuzzy string matching.
 Files with similar titles are grouped together based on configurable threshold.
+
+Candidate verification is batched: titles are lowercased once per ``match()``
+call, the length/token guards are numpy array filters over all candidates of
+a file, and the surviving candidates are scored in one ``rapidfuzz.process.cdist``
+call with a ``score_cutoff``.
+
+MinHash signatures are kept in a TitleSignatureStore shared by every TitleIndex
+the matcher builds (``match``, recursive splits, ``refine_group``), so each
+distinct title is hashed once; with a persistent store, once per library.
 """
 
 from __future__ import annotations
@@ -10,18 +19,60 @@ import logging
 import re
 from typing import Any
 
-from rapidfuzz import fuzz
+import numpy as np
+from rapidfuzz import fuzz, process
 
-from anivault.config import load_settings
+from anivault.config import get_settings_snapshot
 from anivault.config.models.matching_weights import MatchingWeights
 from anivault.core.data_structures.linked_hash_table import LinkedHashTable
 from anivault.core.file_grouper.models import Group
 from anivault.core.models import ScannedFile
 
 from .title_index import TitleIndex
+from .title_signature_store import TitleSignatureStore
 
 logger = logging.getLogger(__name__)
 
+# Characters kept by blocking keys: ASCII alphanumerics and Hangul syllables
+_BLOCKING_KEY_STRIP_PATTERN = re.compile(r"[^a-zA-Z0-9가-힣]")
+
+# Similarity guards: candidates failing these are not scored
+_MIN_LENGTH_RATIO = 0.5
+_MAX_TOKEN_COUNT_DIFF = 3
+
+
+class _TitleFeatures:
+    """Per-file title data computed once per match() call, indexed by file id.
+
+    Attributes:
+        lowered: Lowercased title per file id ("" for unused ids)
+        lengths: Title length per file id
+        token_counts: Whitespace token count per file id
+    """
+
+    def __init__(self, file_id_to_title: dict[int, str]) -> None:
+        size = max(file_id_to_title, default=0) + 1
+        self.lowered: list[str] = [""] * size
+        lengths = [0] * size
+        token_counts = [0] * size
+        for file_id, title in file_id_to_title.items():
+            self.lowered[file_id] = title.lower()
+            lengths[file_id] = len(title)
+            token_counts[file_id] = len(title.split())
+        self.lengths = np.asarray(lengths, dtype=np.int64)
+        self.token_counts = np.asarray(token_counts, dtype=np.int64)
+
+    def guard_mask(self, file_id: int, candidate_ids: np.ndarray) -> np.ndarray:
+        """Boolean mask of candidates passing the length-ratio and token-count guards."""
+        length = self.lengths[file_id]
+        candidate_lengths = self.lengths[candidate_ids]
+        mask: np.ndarray = np.abs(self.token_counts[candidate_ids] - self.token_counts[file_id]) <= _MAX_TOKEN_COUNT_DIFF
+        if length > 0:
+            shorter = np.minimum(candidate_lengths, length)
+            longer = np.maximum(candidate_lengths, length)
+            mask &= (candidate_lengths == 0) | (shorter >= _MIN_LENGTH_RATIO * longer)
+        return mask
+
 
 class TitleSimilarityMatcher:
     """Matcher that groups files by title similarity using fuzzy matching.
@@ -48,6 +99,7 @@ class TitleSimilarityMatcher:
         quality_evaluator: Any,
         threshold: float | None = None,
         weights: MatchingWeights | None = None,
+        signature_store: TitleSignatureStore | None = None,
     ) -> None:
         """Initialize title similarity matcher.
 
@@ -59,6 +111,9 @@ class TitleSimilarityMatcher:
                       Default is 0.85 (85% similarity) if weights is also None.
             weights: MatchingWeights instance for configurable weights.
                     If None, loads from config or uses defaults.
+            signature_store: MinHash signature store shared by all TitleIndex
+                            instances of this matcher. If None, an in-memory
+                            store is used (signatures live as long as the matcher).
 
         Raises:
             ValueError: If threshold is not in range [0.0, 1.0].
@@ -72,7 +127,7 @@ class TitleSimilarityMatcher:
         # Load weights if not provided
         if weights is None:
             try:
-                settings = load_settings()
+                settings = get_settings_snapshot().settings
                 weights = settings.matching_weights
             except (ImportError, AttributeError):
                 weights = MatchingWeights()
@@ -91,6 +146,7 @@ class TitleSimilarityMatcher:
         self.threshold = threshold
         self.title_extractor = title_extractor
         self.quality_evaluator = quality_evaluator
+        self.signature_store = signature_store if signature_store is not None else TitleSignatureStore()
 
     def _extract_title_from_file(self, file: ScannedFile) -> str | None:
         """Extract title from a scanned file.
@@ -147,7 +203,7 @@ class TitleSimilarityMatcher:
         """
         # Extract only alphanumeric and Korean characters
         # Pattern matches: a-z, A-Z, 0-9, and Korean characters (가-힣)
-        cleaned = re.sub(r"[^a-zA-Z0-9가-힣]", "", title)
+        cleaned = _BLOCKING_KEY_STRIP_PATTERN.sub("", title)
         # Convert to lowercase
         cleaned = cleaned.lower()
         # Return first k characters, or entire string if shorter
@@ -183,7 +239,7 @@ class TitleSimilarityMatcher:
             Maximum group size for Title matcher processing (default: 150)
         """
         try:
-            settings = load_settings()
+            settings = get_settings_snapshot().settings
             if hasattr(settings, "grouping") and settings.grouping is not None:
                 return settings.grouping.max_title_match_group_size
         except (ImportError, AttributeError) as e:
@@ -208,7 +264,7 @@ class TitleSimilarityMatcher:
             file_titles may be empty if no titles could be extracted.
         """
         file_titles: list[tuple[ScannedFile, str]] = []
-        title_index = TitleIndex()
+        title_index = TitleIndex(signature_store=self.signature_store)
         file_id_to_file: dict[int, ScannedFile] = {}
         file_id_to_title: dict[int, str] = {}
 
@@ -216,7 +272,6 @@ class TitleSimilarityMatcher:
             title = self._extract_title_from_file(file)
             if title:
                 file_titles.append((file, title))
-                title_index.add_title(file_id, title)
                 file_id_to_file[file_id] = file
                 file_id_to_title[file_id] = title
             else:
@@ -225,6 +280,8 @@ class TitleSimilarityMatcher:
                     file.file_path.name,
                 )
 
+        # One bulk pass: only titles new to the signature store are hashed
+        title_index.add_titles(file_id_to_title.items())
         return file_titles, title_index, file_id_to_file, file_id_to_title
 
     def _process_exact_matches(
@@ -347,45 +404,42 @@ class TitleSimilarityMatcher:
         )
         return candidate_file_ids
 
-    def _passes_similarity_guards(self, title: str, rep_title: str, file_keyword_set: set[str], rep_keyword_set: set[str]) -> bool:
-        """Return True if title and rep_title pass length/token/overlap guards."""
-        if file_keyword_set and rep_keyword_set:
-            if not file_keyword_set.intersection(rep_keyword_set):
-                return False
-        len1, len2 = len(title), len(rep_title)
-        if len1 > 0 and len2 > 0:
-            length_ratio = min(len1, len2) / max(len1, len2)
-            if length_ratio < 0.5:
-                return False
-        title_tokens = title.split()
-        rep_title_tokens = rep_title.split()
-        return abs(len(title_tokens) - len(rep_title_tokens)) <= 3
-
     def _find_group_match_for_title(
         self,
-        title: str,
         current_file_id: int,
         candidate_file_ids: set[int],
         rep_to_group: dict[int, tuple[str, list[ScannedFile]]],
-        file_keywords: dict[int, set[str]],
-        file_id_to_title: dict[int, str],
+        features: _TitleFeatures,
     ) -> str | None:
-        """Find an existing group that matches the title, or None."""
-        file_keyword_set = file_keywords.get(current_file_id, set())
-        for cid in candidate_file_ids:
-            if cid not in rep_to_group:
-                continue
-            group_name, group_files = rep_to_group[cid]
-            if not group_files:
-                continue
-            rep_keyword_set = file_keywords.get(cid, set())
-            rep_title = file_id_to_title.get(cid, group_name)
-            if not self._passes_similarity_guards(title, rep_title, file_keyword_set, rep_keyword_set):
-                continue
-            similarity = self._calculate_similarity(title, rep_title)
-            if similarity >= self.threshold:
-                return group_name
-        return None
+        """Find an existing group that matches the title, or None.
+
+        Candidates are group representatives. The length-ratio and token-count
+        guards are applied as array filters, then all remaining candidates are
+        scored in one ``cdist`` call. The first candidate (lowest file id, i.e. oldest group)
+        reaching the threshold wins. Candidates already share a keyword with the
+        title (see ``_get_candidate_ids_for_title``), so no keyword guard is needed.
+        """
+        candidates = [cid for cid in sorted(candidate_file_ids) if (entry := rep_to_group.get(cid)) is not None and entry[1]]
+        if not candidates:
+            return None
+
+        candidate_ids = np.fromiter(candidates, dtype=np.int64, count=len(candidates))
+        candidate_ids = candidate_ids[features.guard_mask(current_file_id, candidate_ids)]
+        if candidate_ids.size == 0:
+            return None
+
+        # cutoff slightly below threshold * 100 so float rounding cannot drop exact-threshold scores
+        scores = process.cdist(
+            [features.lowered[current_file_id]],
+            [features.lowered[cid] for cid in candidate_ids],
+            scorer=fuzz.ratio,
+            score_cutoff=max(0.0, self.threshold * 100.0 - 1e-9),
+            dtype=np.float64,
+        )[0]
+        hits = np.flatnonzero(scores / 100.0 >= self.threshold)
+        if hits.size == 0:
+            return None
+        return rep_to_group[int(candidate_ids[hits[0]])][0]
 
     def _add_file_to_existing_group(
         self,
@@ -512,6 +566,7 @@ class TitleSimilarityMatcher:
             title_index,
             all_groups_table,
         )
+        features = _TitleFeatures(file_id_to_title)
 
         for file, title in remaining_files:
             current_file_id = id_to_file_id.get(id(file))
@@ -527,12 +582,10 @@ class TitleSimilarityMatcher:
                 processed_file_ids,
             )
             matched_group = self._find_group_match_for_title(
-                title,
                 current_file_id,
                 candidate_file_ids,
                 rep_to_group,
-                file_keywords,
-                file_id_to_title,
+                features,
             )
 
             if matched_group:
@@ -599,16 +652,16 @@ class TitleSimilarityMatcher:
 
         # Hash-first optimization: Build TitleIndex only for this group's files
         # This reduces the search space from O(n²) to O(m²) where m = group size
-        title_index = TitleIndex()
+        title_index = TitleIndex(signature_store=self.signature_store)
         file_id_to_file: dict[int, ScannedFile] = {}
         file_id_to_title: dict[int, str] = {}
 
         for file_id, file in enumerate(group.files, start=1):
             title = self._extract_title_from_file(file)
             if title:
-                title_index.add_title(file_id, title)
                 file_id_to_file[file_id] = file
                 file_id_to_title[file_id] = title
+        title_index.add_titles(file_id_to_title.items())
 
         if not file_id_to_file:
             return None
@@ -656,6 +709,30 @@ class TitleSimilarityMatcher:
         )
         return subgroups
 
+    def export_shard_state(self) -> dict[str, np.ndarray]:
+        """Signatures computed by this copy in a GroupingEngine shard worker.
+
+        Returns:
+            Hash values by normalized title (see ``merge_shard_states``)
+        """
+        return self.signature_store.take_computed()
+
+    def merge_shard_states(self, states: list[dict[str, np.ndarray]]) -> None:
+        """Add the signatures exported by shard workers' copies of this matcher."""
+        for state in states:
+            self.signature_store.add_signatures(state)
+
+    def reset_state(self) -> None:
+        """Start a grouping run with an empty LSH index (titles of earlier runs are not candidates)."""
+        self.signature_store.reset_index()
+
+    def save_state(self) -> None:
+        """Persist signatures of titles seen for the first time (no-op otherwise).
+
+        Called by GroupingEngine once per grouping run rather than per match call.
+        """
+        self.signature_store.save()
+
 
 # Re-export TitleIndex for backward compatibility
 __all__ = ["TitleIndex", "TitleSimilarityMatcher"]
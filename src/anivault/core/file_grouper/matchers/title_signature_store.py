@@ -0,0 +1,280 @@
+"""Persistent MinHash signatures and LSH index keyed by normalized title.
+
+MinHash signatures are the dominant cost of building a TitleIndex, and they
+depend only on the normalized title. This store:
+
+1. Keeps one signature per normalized title (shared by every file and every
+   TitleIndex using the store), so a title is hashed once per library
+2. Computes missing signatures in bulk (``MinHash.bulk``, one permutation
+   setup per batch) and keeps them as ``LeanMinHash``
+3. Keeps one title-keyed LSH index, filled lazily with the titles that are
+   actually indexed in the current grouping run (``reset_index`` starts a new one)
+4. Persists the signatures to an ``.npz`` file (no pickle), so the next run
+   only hashes titles it has never seen
+
+At most ``MAX_STORED_SIGNATURES`` signatures are kept, in memory as on disk
+(oldest dropped first), so a long-lived process does not grow without bound.
+
+Access is serialized with a lock: TitleIndex instances in Title refinement
+threads share one store. A pickled store (GroupingEngine shard workers) is a
+read-only copy: it loads the cache file itself and never writes it; the
+signatures it computes are handed back with ``take_computed`` and
+``add_signatures``.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from datasketch import LeanMinHash, MinHash, MinHashLSH
+
+logger = logging.getLogger(__name__)
+
+_STORE_VERSION = 1
+
+# Defaults (match the previous per-index TitleIndex parameters)
+DEFAULT_LSH_THRESHOLD = 0.5
+DEFAULT_NUM_PERM = 128
+# Oldest signatures beyond this count are dropped (in memory and when saving)
+MAX_STORED_SIGNATURES = 500_000
+# Shingle size of the MinHash input
+_SHINGLE_SIZE = 3
+
+
+def title_shingles(normalized_title: str) -> set[str]:
+    """Character shingles of a normalized title (bigrams of words for very short titles)."""
+    shingles = {normalized_title[i : i + _SHINGLE_SIZE] for i in range(len(normalized_title) - _SHINGLE_SIZE + 1)}
+
+    if len(shingles) < 3:
+        for word in normalized_title.split():
+            if len(word) >= 2:
+                for j in range(len(word) - 1):
+                    shingles.add(word[j : j + 2])
+
+    return shingles
+
+
+class TitleSignatureStore:
+    """MinHash signature cache and shared LSH index keyed by normalized title.
+
+    Attributes:
+        cache_file: ``.npz`` file the signatures are persisted to (None = memory only)
+        num_perm: Number of MinHash permutations
+        lsh_threshold: Jaccard similarity threshold of the LSH index
+        computed: Number of signatures computed (not loaded) by this instance
+
+    Example:
+        >>> store = TitleSignatureStore(Path("cache/title_minhash_signatures.npz"))
+        >>> store.index_titles(["attack on titan", "attack on titan final season"])
+        >>> store.query("attack on titan")
+        ['attack on titan', 'attack on titan final season']
+        >>> store.save()
+    """
+
+    def __init__(
+        self,
+        cache_file: Path | None = None,
+        num_perm: int = DEFAULT_NUM_PERM,
+        lsh_threshold: float = DEFAULT_LSH_THRESHOLD,
+    ) -> None:
+        """Initialize and load persisted signatures.
+
+        Args:
+            cache_file: Signature file (created on first save); None keeps
+                signatures in memory only
+            num_perm: Number of MinHash permutations
+            lsh_threshold: Jaccard similarity threshold (0.0-1.0) of the LSH index
+        """
+        self.cache_file = Path(cache_file) if cache_file is not None else None
+        self.num_perm = num_perm
+        self.lsh_threshold = lsh_threshold
+        self.computed = 0
+        self._seed, self._scheme = self._minhash_parameters(num_perm)
+        self._signatures: dict[str, LeanMinHash | None] = {}
+        self._lsh = MinHashLSH(threshold=lsh_threshold, num_perm=num_perm)
+        self._lsh_titles: set[str] = set()
+        self._dirty = False
+        self._writable = True
+        self._new_titles: list[str] = []
+        self._lock = threading.RLock()
+        self._load()
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Pickle parameters only; the copy reloads the cache file (see __setstate__)."""
+        return {"cache_file": self.cache_file, "num_perm": self.num_perm, "lsh_threshold": self.lsh_threshold}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Recreate the store as a read-only copy (only the original writes the cache file)."""
+        self.__init__(state["cache_file"], state["num_perm"], state["lsh_threshold"])  # type: ignore[misc]  # pylint: disable=unnecessary-dunder-call
+        self._writable = False
+
+    def __len__(self) -> int:
+        """Number of titles with a known signature."""
+        return len(self._signatures)
+
+    @staticmethod
+    def _minhash_parameters(num_perm: int) -> tuple[int, str]:
+        """(seed, scheme) of signatures created with default MinHash settings."""
+        probe = MinHash(num_perm=num_perm)
+        return int(probe.seed), str(probe.scheme)
+
+    def _load(self) -> None:
+        """Load signatures from the cache file (empty store if missing, invalid or incompatible)."""
+        if self.cache_file is None or not self.cache_file.exists():
+            return
+
+        try:
+            with np.load(self.cache_file, allow_pickle=False) as data:
+                compatible = (
+                    int(data["version"]) == _STORE_VERSION
+                    and int(data["num_perm"]) == self.num_perm
+                    and int(data["seed"]) == self._seed
+                    and str(data["scheme"]) == self._scheme
+                )
+                if not compatible:
+                    logger.info("Ignoring incompatible title signature file: %s", self.cache_file)
+                    return
+                titles = data["titles"].tolist()
+                hashvalues = data["hashvalues"]
+            if hashvalues.shape != (len(titles), self.num_perm):
+                logger.warning("Ignoring malformed title signature file: %s", self.cache_file)
+                return
+            for title, values in zip(titles, hashvalues):
+                self._signatures[title] = LeanMinHash(seed=self._seed, hashvalues=values, scheme=self._scheme)
+            self._evict_oldest()
+            logger.debug("Loaded %d title signatures from %s", len(self._signatures), self.cache_file)
+        except (OSError, KeyError, TypeError, ValueError) as e:
+            logger.warning("Failed to load title signature file %s, starting empty: %s", self.cache_file, e)
+            self._signatures = {}
+
+    def _compute_missing(self, titles: Iterable[str]) -> None:
+        """Compute signatures of titles without one, in bulk (caller holds the lock)."""
+        missing = [title for title in dict.fromkeys(titles) if title not in self._signatures]
+        if not missing:
+            return
+
+        shingle_sets = [title_shingles(title) for title in missing]
+        hashable = [i for i, shingles in enumerate(shingle_sets) if shingles]
+        minhashes = MinHash.bulk(
+            ([shingle.encode("utf-8") for shingle in shingle_sets[i]] for i in hashable),
+            num_perm=self.num_perm,
+        )
+        for title in missing:
+            self._signatures[title] = None
+        for i, minhash in zip(hashable, minhashes):
+            self._signatures[missing[i]] = LeanMinHash(minhash)
+        if not self._writable:
+            # Read-only copy: remembered for take_computed
+            self._new_titles.extend(missing[i] for i in hashable)
+
+        self.computed += len(hashable)
+        self._dirty = self._dirty or bool(hashable)
+        logger.debug("Computed %d title signatures (%d cached)", len(hashable), len(self._signatures) - len(missing))
+        self._evict_oldest()
+
+    def _evict_oldest(self) -> None:
+        """Drop the oldest signatures beyond MAX_STORED_SIGNATURES (caller holds the lock)."""
+        excess = len(self._signatures) - MAX_STORED_SIGNATURES
+        if excess <= 0:
+            return
+        for title in list(self._signatures)[:excess]:
+            del self._signatures[title]
+        logger.debug("Dropped %d oldest title signatures", excess)
+
+    def signature(self, normalized_title: str) -> LeanMinHash | None:
+        """Signature of a normalized title (computed and cached if unknown).
+
+        Returns:
+            LeanMinHash, or None if the title yields no shingles
+        """
+        with self._lock:
+            self._compute_missing((normalized_title,))
+            return self._signatures.get(normalized_title)
+
+    def index_titles(self, normalized_titles: Iterable[str]) -> None:
+        """Make titles queryable, computing missing signatures in one bulk pass."""
+        with self._lock:
+            new_titles = [title for title in dict.fromkeys(normalized_titles) if title and title not in self._lsh_titles]
+            if not new_titles:
+                return
+            self._compute_missing(new_titles)
+            for title in new_titles:
+                minhash = self._signatures.get(title)
+                if minhash is not None:
+                    self._lsh.insert(title, minhash, check_duplication=False)
+                    self._lsh_titles.add(title)
+
+    def query(self, normalized_title: str) -> list[str]:
+        """Indexed titles whose estimated Jaccard similarity passes the LSH threshold."""
+        with self._lock:
+            self._compute_missing((normalized_title,))
+            minhash = self._signatures.get(normalized_title)
+            if minhash is None:
+                return []
+            return list(self._lsh.query(minhash))
+
+    def reset_index(self) -> None:
+        """Empty the LSH index (signatures are kept); called at the start of each grouping run."""
+        with self._lock:
+            if self._lsh_titles:
+                self._lsh = MinHashLSH(threshold=self.lsh_threshold, num_perm=self.num_perm)
+                self._lsh_titles = set()
+
+    def take_computed(self) -> dict[str, np.ndarray]:
+        """Hash values of the signatures a read-only copy computed since the last call (for ``add_signatures``)."""
+        with self._lock:
+            titles, self._new_titles = self._new_titles, []
+            signatures = ((title, self._signatures.get(title)) for title in titles)
+            return {title: minhash.hashvalues for title, minhash in signatures if minhash is not None}
+
+    def add_signatures(self, signatures: dict[str, np.ndarray]) -> None:
+        """Add signatures computed by another store (e.g. ``take_computed`` of a worker copy)."""
+        with self._lock:
+            added = 0
+            for title, hashvalues in signatures.items():
+                if self._signatures.get(title) is None and len(hashvalues) == self.num_perm:
+                    self._signatures[title] = LeanMinHash(seed=self._seed, hashvalues=hashvalues, scheme=self._scheme)
+                    added += 1
+            self._dirty = self._dirty or bool(added)
+            self._evict_oldest()
+
+    def save(self) -> None:
+        """Write signatures to the cache file if new ones were computed (atomically)."""
+        if self.cache_file is None or not self._writable:
+            return
+
+        with self._lock:
+            if not self._dirty:
+                return
+            entries = [(title, minhash) for title, minhash in self._signatures.items() if minhash is not None]
+            # Oldest first (insertion order): keep the most recently added titles
+            entries = entries[-MAX_STORED_SIGNATURES:]
+            titles = np.array([title for title, _ in entries], dtype=str)
+            hashvalues = np.stack([minhash.hashvalues for _, minhash in entries]) if entries else np.empty((0, self.num_perm), dtype=np.uint32)
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.cache_file.with_suffix(self.cache_file.suffix + ".tmp")
+            try:
+                with tmp_file.open("wb") as f:
+                    np.savez(
+                        f,
+                        version=_STORE_VERSION,
+                        num_perm=self.num_perm,
+                        seed=self._seed,
+                        scheme=self._scheme,
+                        titles=titles,
+                        hashvalues=hashvalues,
+                    )
+                tmp_file.replace(self.cache_file)
+            except OSError as e:
+                logger.warning("Failed to save title signature file %s: %s", self.cache_file, e)
+                return
+            self._dirty = False
+        logger.debug("Saved %d title signatures to %s", len(entries), self.cache_file)
+
+
+__all__ = ["TitleSignatureStore", "title_shingles"]
@@ -1,5 +1,5 @@
 """Compatibility shim for grouping models."""
 
-from anivault.core.models.grouping import Group, GroupingEvidence
+from anivault.core.models.grouping import Group, GroupingEvidence, GroupingState
 
-__all__ = ["Group", "GroupingEvidence"]
+__all__ = ["Group", "GroupingEvidence", "GroupingState"]
@@ -10,6 +10,7 @@ from __future__ import annotations
 
 import logging
 from abc import ABC, abstractmethod
+from array import array
 
 from anivault.core.file_grouper.models import Group, GroupingEvidence
 
@@ -17,20 +18,64 @@ logger = logging.getLogger(__name__)
 
 
 class _UnionFind:
-    """Union-Find for O(N*alpha(N)) connected component detection."""
+    """Union-Find over dense integer ids (O(N*alpha(N)) connected components).
 
-    def __init__(self, elements: list[str]) -> None:
-        self._parent: dict[str, str] = {e: e for e in elements}
+    Parents and ranks live in flat arrays (``array('i')`` / ``array('B')``), not
+    per-element dict entries; ``find`` compresses paths iteratively.
+    """
+
+    def __init__(self, size: int) -> None:
+        self._parent = array("i", range(size))
+        self._rank = array("B", bytes(size))
 
-    def find(self, x: str) -> str:
-        if self._parent[x] != x:
-            self._parent[x] = self.find(self._parent[x])
-        return self._parent[x]
+    def find(self, x: int) -> int:
+        parent = self._parent
+        root = x
+        while parent[root] != root:
+            root = parent[root]
+        while parent[x] != root:
+            parent[x], x = root, parent[x]
+        return root
 
-    def union(self, x: str, y: str) -> None:
+    def union(self, x: int, y: int) -> None:
         rx, ry = self.find(x), self.find(y)
-        if rx != ry:
-            self._parent[rx] = ry
+        if rx == ry:
+            return
+        rank = self._rank
+        if rank[rx] < rank[ry]:
+            rx, ry = ry, rx
+        self._parent[ry] = rx
+        if rank[rx] == rank[ry]:
+            rank[rx] += 1
+
+
+def _intern_group_files(
+    matcher_results: dict[str, list[Group]],
+) -> tuple[int, list[tuple[str, Group, array[int]]]]:
+    """Intern file names to dense ids (in order of first appearance).
+
+    Returns:
+        (number of distinct file names, [(matcher_name, group, file ids in group order), ...])
+    """
+    file_ids: dict[str, int] = {}
+    # Matchers share ScannedFile objects: resolve each object's name once
+    object_ids: dict[int, int] = {}
+    entries: list[tuple[str, Group, array[int]]] = []
+    for matcher_name, groups in matcher_results.items():
+        for group in groups:
+            group_ids = array("i")
+            for file in group.files:
+                file_id = object_ids.get(id(file))
+                if file_id is None:
+                    file_id = object_ids[id(file)] = file_ids.setdefault(file.file_path.name, len(file_ids))
+                group_ids.append(file_id)
+            entries.append((matcher_name, group, group_ids))
+    return len(file_ids), entries
+
+
+def _file_set_key(group_ids: array[int]) -> bytes:
+    """Order-independent key of a group's file set (sorted unique ids as bytes)."""
+    return array("i", sorted(set(group_ids))).tobytes()
 
 
 class GroupingStrategy(ABC):
@@ -102,6 +147,10 @@ class WeightedMergeStrategy(GroupingStrategy):
     2. Calculates weighted confidence scores
     3. Merges overlapping groups with highest combined score
     4. Generates evidence showing contribution from each matcher
+
+    Files are interned to dense integer ids (by file name) and overlaps are
+    found with an array-backed union-find, so merging stays linear in the
+    total group size.
     """
 
     def combine_results(
@@ -113,21 +162,13 @@ class WeightedMergeStrategy(GroupingStrategy):
         if not matcher_results:
             return []
 
-        # Step 1: Create file-to-group mapping for each matcher
-        file_groups: dict[str, dict[str, Group]] = {}
-        for matcher_name, groups in matcher_results.items():
-            file_groups[matcher_name] = {}
-            for group in groups:
-                for file in group.files:
-                    file_groups[matcher_name][file.file_path.name] = group
-
-        # Step 2: Find overlapping groups across matchers
-        merged_groups = self._merge_overlapping_groups(matcher_results, weights, file_groups)
+        # Step 1-2: Find and merge overlapping groups across matchers
+        merged_groups = self._merge_overlapping_groups(matcher_results, weights)
 
         # Step 3: Generate evidence for each merged group
         final_groups = []
-        for group in merged_groups:
-            evidence = self._generate_merge_evidence(group, matcher_results, weights)
+        for group, contributing in merged_groups:
+            evidence = self._generate_merge_evidence(contributing, matcher_results, weights)
             final_group = Group(
                 title=group.title,
                 files=group.files,
@@ -146,116 +187,78 @@ class WeightedMergeStrategy(GroupingStrategy):
         self,
         matcher_results: dict[str, list[Group]],
         weights: dict[str, float],
-        _file_groups: dict[str, dict[str, Group]],
-    ) -> list[Group]:
-        """Merge groups that have overlapping files using Union-Find for O(N*alpha(N))."""
-        file_to_groups = self._build_file_to_groups(matcher_results)
-        all_files = list(file_to_groups.keys())
-        uf = self._connect_overlapping_files(file_to_groups, matcher_results)
-        components, component_groups = self._build_components(all_files, file_to_groups, uf)
-        return self._build_merged_groups_from_components(components, component_groups, matcher_results, weights)
+    ) -> list[tuple[Group, set[str]]]:
+        """Merge groups that have overlapping files using Union-Find for O(N*alpha(N)).
 
-    @staticmethod
-    def _build_file_to_groups(
-        matcher_results: dict[str, list[Group]],
-    ) -> dict[str, list[tuple[str, Group]]]:
-        """Build file -> [(matcher_name, group), ...] mapping."""
-        file_to_groups: dict[str, list[tuple[str, Group]]] = {}
-        for matcher_name, groups in matcher_results.items():
-            for group in groups:
-                for file in group.files:
-                    file_name = file.file_path.name
-                    if file_name not in file_to_groups:
-                        file_to_groups[file_name] = []
-                    file_to_groups[file_name].append((matcher_name, group))
-        return file_to_groups
+        Returns:
+            (merged group, names of matchers with a group in it) per connected
+            component, in order of the component's first file
+        """
+        file_count, entries = _intern_group_files(matcher_results)
+        uf = self._connect_overlapping_files(file_count, entries)
+        components = self._build_components(entries, uf)
+        return [self._create_merged_group(cluster_groups, weights) for cluster_groups in components]
 
     @staticmethod
     def _connect_overlapping_files(
-        file_to_groups: dict[str, list[tuple[str, Group]]],
-        matcher_results: dict[str, list[Group]],
+        file_count: int,
+        entries: list[tuple[str, Group, array[int]]],
     ) -> _UnionFind:
         """Run Union-Find to connect files that belong to the same group across matchers."""
-        all_files = list(file_to_groups.keys())
-        uf = _UnionFind(all_files)
-        seen_groups: set[tuple[str, int]] = set()
-        for matcher_name, groups in matcher_results.items():
-            for group in groups:
-                key = (matcher_name, id(group))
-                if key in seen_groups:
-                    continue
-                seen_groups.add(key)
-                names_in_index = [f.file_path.name for f in group.files if f.file_path.name in file_to_groups]
-                if len(names_in_index) < 2:
-                    continue
-                first = names_in_index[0]
-                for other in names_in_index[1:]:
-                    uf.union(first, other)
+        uf = _UnionFind(file_count)
+        for _, _, group_ids in entries:
+            if len(group_ids) < 2:
+                continue
+            first = group_ids[0]
+            for other in group_ids[1:]:
+                uf.union(first, other)
         return uf
 
     @staticmethod
     def _build_components(
-        all_files: list[str],
-        file_to_groups: dict[str, list[tuple[str, Group]]],
+        entries: list[tuple[str, Group, array[int]]],
         uf: _UnionFind,
-    ) -> tuple[dict[str, set[str]], dict[str, list[tuple[str, Group]]]]:
-        """Group files by component root and collect (matcher, group) per root."""
-        components: dict[str, set[str]] = {}
-        component_groups: dict[str, list[tuple[str, Group]]] = {}
-        seen_per_root: dict[str, set[tuple[str, int]]] = {}
-        for file_name in all_files:
-            root = uf.find(file_name)
-            components.setdefault(root, set()).add(file_name)
-            for m, g in file_to_groups[file_name]:
-                key = (m, id(g))
-                if key not in seen_per_root.setdefault(root, set()):
-                    seen_per_root[root].add(key)
-                    component_groups.setdefault(root, []).append((m, g))
-        return components, component_groups
-
-    def _build_merged_groups_from_components(
-        self,
-        components: dict[str, set[str]],
-        component_groups: dict[str, list[tuple[str, Group]]],
-        matcher_results: dict[str, list[Group]],
-        weights: dict[str, float],
-    ) -> list[Group]:
-        """Build final merged Group list from component mappings."""
-        merged_groups = []
-        for root, cluster_files in components.items():
-            if not cluster_files:
+    ) -> list[list[tuple[str, Group, array[int]]]]:
+        """Collect the distinct (matcher, group) entries of each component.
+
+        Components are ordered by their first file id; entries within a
+        component by (first file id of the group, matcher/group order), i.e.
+        the order in which a walk over files in first-appearance order meets them.
+        """
+        seen: set[tuple[str, int]] = set()
+        ordered: list[tuple[int, int, tuple[str, Group, array[int]]]] = []
+        for index, entry in enumerate(entries):
+            matcher_name, group, group_ids = entry
+            key = (matcher_name, id(group))
+            if not group_ids or key in seen:
                 continue
-            cluster_groups = component_groups.get(root, [])
-            merged_group = self._create_merged_group(cluster_files, cluster_groups, matcher_results, weights)
-            merged_groups.append(merged_group)
-        return merged_groups
+            seen.add(key)
+            ordered.append((min(group_ids), index, entry))
+        ordered.sort(key=lambda item: (item[0], item[1]))
+
+        components: dict[int, list[tuple[str, Group, array[int]]]] = {}
+        for _, _, entry in ordered:
+            components.setdefault(uf.find(entry[2][0]), []).append(entry)
+        return list(components.values())
 
     def _create_merged_group(
         self,
-        cluster_files: set[str],
-        cluster_groups: list[tuple[str, Group]],
-        _matcher_results: dict[str, list[Group]],
+        cluster_groups: list[tuple[str, Group, array[int]]],
         weights: dict[str, float],
-    ) -> Group:
+    ) -> tuple[Group, set[str]]:
         """Create a single group from overlapping groups."""
-        # Collect all files from overlapping groups
-        all_files = []
-        for _matcher_name, group in cluster_groups:
-            for file in group.files:
-                if file.file_path.name in cluster_files:
-                    all_files.append(file)
-
-        # Remove duplicates while preserving order
-        seen_files = set()
+        # Collect all files from overlapping groups, removing duplicates while preserving order
+        seen_ids: set[int] = set()
         unique_files = []
-        for file in all_files:
-            if file.file_path.name not in seen_files:
-                unique_files.append(file)
-                seen_files.add(file.file_path.name)
+        for _matcher_name, group, group_ids in cluster_groups:
+            for file, file_id in zip(group.files, group_ids):
+                if file_id not in seen_ids:
+                    seen_ids.add(file_id)
+                    unique_files.append(file)
 
         # Select best title using weighted scoring
-        title_scores = {}
-        for matcher_name, group in cluster_groups:
+        title_scores: dict[str, float] = {}
+        for matcher_name, group, _ in cluster_groups:
             weight = weights.get(matcher_name, 0.0)
             if group.title not in title_scores:
                 title_scores[group.title] = 0.0
@@ -263,30 +266,21 @@ class WeightedMergeStrategy(GroupingStrategy):
 
         best_title = max(title_scores.keys(), key=lambda t: title_scores[t])
 
-        return Group(title=best_title, files=unique_files)
+        return Group(title=best_title, files=unique_files), {matcher_name for matcher_name, _, _ in cluster_groups}
 
-    def _generate_merge_evidence(  # pylint: disable=too-many-locals
+    def _generate_merge_evidence(
         self,
-        group: Group,
+        contributing: set[str],
         matcher_results: dict[str, list[Group]],
         weights: dict[str, float],
     ) -> GroupingEvidence:
-        """Generate evidence showing contribution from each matcher."""
-        match_scores = {}
-        contributing_matchers = []
-
-        # Build merged group's file set once (O(F) instead of per matcher/group)
-        group_files = {f.file_path.name for f in group.files}
+        """Generate evidence showing contribution from each matcher.
 
-        # Calculate contribution from each matcher
-        for matcher_name, groups in matcher_results.items():
-            weight = weights.get(matcher_name, 0.0)
-            for matcher_group in groups:
-                matcher_files = {f.file_path.name for f in matcher_group.files}
-                if group_files.intersection(matcher_files):
-                    match_scores[matcher_name] = weight
-                    contributing_matchers.append(matcher_name)
-                    break
+        A matcher contributes if one of its groups overlaps the merged group,
+        i.e. belongs to the same component (``contributing``).
+        """
+        contributing_matchers = [matcher_name for matcher_name in matcher_results if matcher_name in contributing]
+        match_scores = {matcher_name: weights.get(matcher_name, 0.0) for matcher_name in contributing_matchers}
 
         # Calculate overall confidence
         confidence = sum(match_scores.values()) / len(contributing_matchers) if contributing_matchers else 0.0
@@ -365,6 +359,9 @@ class ConsensusStrategy(GroupingStrategy):
 
     Only creates groups when multiple matchers agree on the grouping.
     More conservative but higher confidence.
+
+    Groups are compared by their file set, keyed by the sorted unique ids of
+    their (interned) file names.
     """
 
     def __init__(self, min_consensus: int = 2):
@@ -389,8 +386,8 @@ class ConsensusStrategy(GroupingStrategy):
 
         # Generate evidence
         result_groups = []
-        for group in consensus_groups:
-            evidence = self._generate_consensus_evidence(group, matcher_results, weights)
+        for group, agreeing in consensus_groups:
+            evidence = self._generate_consensus_evidence(agreeing, matcher_results, weights)
             final_group = Group(
                 title=group.title,
                 files=group.files,
@@ -405,24 +402,28 @@ class ConsensusStrategy(GroupingStrategy):
 
         return result_groups
 
-    def _find_consensus_groups(  # pylint: disable=too-many-branches
+    def _find_consensus_groups(
         self,
         matcher_results: dict[str, list[Group]],
         weights: dict[str, float],
-    ) -> list[Group]:
-        """Find groups that have consensus from multiple matchers."""
-        # Count matchers per file_set and store (matcher_name, group) for O(1) reconstruction
-        file_group_counts: dict[frozenset[str], list[str]] = {}
-        file_set_to_groups: dict[frozenset[str], list[tuple[str, Group]]] = {}
-
-        for matcher_name, groups in matcher_results.items():
-            for group in groups:
-                file_set = frozenset(f.file_path.name for f in group.files)
-                if file_set not in file_group_counts:
-                    file_group_counts[file_set] = []
-                    file_set_to_groups[file_set] = []
-                file_group_counts[file_set].append(matcher_name)
-                file_set_to_groups[file_set].append((matcher_name, group))
+    ) -> list[tuple[Group, list[str]]]:
+        """Find groups that have consensus from multiple matchers.
+
+        Returns:
+            (group, names of matchers with a group of the same file set) per consensus group
+        """
+        # Count matchers per file set and store (matcher_name, group) for O(1) reconstruction
+        file_group_counts: dict[bytes, list[str]] = {}
+        file_set_to_groups: dict[bytes, list[tuple[str, Group]]] = {}
+
+        _, entries = _intern_group_files(matcher_results)
+        for matcher_name, group, group_ids in entries:
+            file_set = _file_set_key(group_ids)
+            if file_set not in file_group_counts:
+                file_group_counts[file_set] = []
+                file_set_to_groups[file_set] = []
+            file_group_counts[file_set].append(matcher_name)
+            file_set_to_groups[file_set].append((matcher_name, group))
 
         # Find groups with sufficient consensus (no re-scan of matcher_results)
         consensus_groups = []
@@ -441,31 +442,26 @@ class ConsensusStrategy(GroupingStrategy):
                 None,
             )
             if best_title:
-                consensus_groups.append(Group(title=best_title, files=all_files))
+                consensus_groups.append((Group(title=best_title, files=all_files), matchers))
 
         return consensus_groups
 
-    def _generate_consensus_evidence(  # pylint: disable=too-many-locals
+    def _generate_consensus_evidence(
         self,
-        group: Group,
+        agreeing: list[str],
         matcher_results: dict[str, list[Group]],
         weights: dict[str, float],
     ) -> GroupingEvidence:
-        """Generate evidence for consensus-based grouping."""
-        # Find which matchers contributed to this group
-        contributing_matchers = []
-        match_scores = {}
+        """Generate evidence for consensus-based grouping.
 
-        group_file_set = frozenset(f.file_path.name for f in group.files)
-
-        for matcher_name, groups in matcher_results.items():
-            weight = weights.get(matcher_name, 0.0)
-            for matcher_group in groups:
-                matcher_file_set = frozenset(f.file_path.name for f in matcher_group.files)
-                if matcher_file_set == group_file_set:
-                    contributing_matchers.append(matcher_name)
-                    match_scores[matcher_name] = weight
-                    break
+        Args:
+            agreeing: Matchers with a group of exactly the consensus file set
+            matcher_results: All matcher results (for matcher order and count)
+            weights: Matcher weights
+        """
+        # Matchers that contributed to this group (each once, in matcher order)
+        contributing_matchers = [matcher_name for matcher_name in matcher_results if matcher_name in agreeing]
+        match_scores = {matcher_name: weights.get(matcher_name, 0.0) for matcher_name in contributing_matchers}
 
         # Calculate confidence based on consensus
         consensus_ratio = len(contributing_matchers) / len(matcher_results)
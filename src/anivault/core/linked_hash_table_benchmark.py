@@ -0,0 +1,116 @@
+"""Benchmark of the LinkedHashTable implementations.
+
+Times ``put`` (insert), ``get`` (hits), ``iterate`` (full scan in insertion
+order) and ``remove`` (every key) on ``ChainedLinkedHashTable`` (legacy, pure
+Python) and ``DictLinkedHashTable`` (default, built-in dict) at several table
+sizes. Keys are either normalized titles (``str``, as in the grouping
+matchers) or ``(title, episode)`` tuples (the chained table's polynomial hash
+path).
+
+Run:
+    python -m anivault.core.linked_hash_table_benchmark [--sizes 1000,10000,100000,1000000] [--keys str]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from collections.abc import Callable
+from typing import Any
+
+from anivault.core.data_structures.linked_hash_table import ChainedLinkedHashTable, DictLinkedHashTable
+
+_IMPLEMENTATIONS: dict[str, Callable[[], Any]] = {
+    "chained": ChainedLinkedHashTable,
+    "dict": DictLinkedHashTable,
+}
+
+
+def generate_keys(size: int, key_type: str = "str") -> list[Any]:
+    """Distinct keys shaped like the ones used on grouping hot paths.
+
+    Args:
+        size: Number of keys
+        key_type: ``"str"`` (normalized titles) or ``"tuple"`` ((title, episode))
+
+    Returns:
+        List of distinct keys
+    """
+    if key_type == "tuple":
+        return [(f"series title {index // 26:07d}", index % 26 + 1) for index in range(size)]
+    return [f"series title {index:07d} season {index % 4 + 1}" for index in range(size)]
+
+
+def _time_operations(factory: Callable[[], Any], keys: list[Any]) -> dict[str, float]:
+    """Seconds of put/get/iterate/remove over all keys on a fresh table."""
+    table = factory()
+    put, get, remove = table.put, table.get, table.remove
+    timings: dict[str, float] = {}
+
+    start = time.perf_counter()
+    for value, key in enumerate(keys):
+        put(key, value)
+    timings["put"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for key in keys:
+        get(key)
+    timings["get"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in table:
+        pass
+    timings["iterate"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for key in keys:
+        remove(key)
+    timings["remove"] = time.perf_counter() - start
+    return timings
+
+
+def run_linked_hash_table_benchmark(
+    sizes: tuple[int, ...] = (1_000, 10_000, 100_000, 1_000_000),
+    key_type: str = "str",
+    repeat: int = 3,
+) -> list[dict[str, Any]]:
+    """Time both implementations at each table size (best of ``repeat`` runs).
+
+    Args:
+        sizes: Number of entries per table
+        key_type: ``"str"`` or ``"tuple"`` keys (see ``generate_keys``)
+        repeat: Runs per implementation and size; the fastest time per operation is kept
+
+    Returns:
+        One result per size with seconds per operation and implementation,
+        and the speedup of the dict-backed table per operation
+    """
+    results = []
+    for size in sizes:
+        keys = generate_keys(size, key_type)
+        result: dict[str, Any] = {"entries": size, "keys": key_type}
+        for name, factory in _IMPLEMENTATIONS.items():
+            runs = [_time_operations(factory, keys) for _ in range(max(1, repeat))]
+            result[name] = {operation: min(run[operation] for run in runs) for operation in runs[0]}
+        result["speedup"] = {operation: result["chained"][operation] / seconds if seconds else 0.0 for operation, seconds in result["dict"].items()}
+        results.append(result)
+    return results
+
+
+def main() -> None:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark chained vs dict-backed LinkedHashTable")
+    parser.add_argument("--sizes", default="1000,10000,100000,1000000", help="Comma-separated table sizes")
+    parser.add_argument("--keys", choices=("str", "tuple"), default="str")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    sizes = tuple(int(size) for size in args.sizes.split(","))
+    print(json.dumps(run_linked_hash_table_benchmark(sizes, args.keys, args.repeat), indent=2))
+
+
+__all__ = ["generate_keys", "run_linked_hash_table_benchmark"]
+
+
+if __name__ == "__main__":
+    main()
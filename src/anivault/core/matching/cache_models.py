@@ -35,3 +35,47 @@ class CachedSearchData:
     results: list[TMDBSearchResult]
     language: str = "ko-KR"
     cached_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+
+
+@dataclass
+class CachedMatchDecision:
+    """Final match decision cached per normalized query.
+
+    Stores everything needed to rebuild a MatchResult without searching or
+    scoring again, plus the decision version it was produced under.
+
+    Attributes:
+        query_title: Normalized query title
+        query_year: Query year hint (if any)
+        tmdb_id: Chosen TMDB ID
+        title: Chosen TMDB title
+        year: Release/first air year of the chosen title
+        confidence_score: Confidence of the decision (0.0 to 1.0)
+        media_type: 'tv' or 'movie'
+        poster_path: Poster image path (if available)
+        backdrop_path: Backdrop image path (if available)
+        overview: Plot synopsis (if available)
+        popularity: TMDB popularity (if available)
+        vote_average: Average user rating (if available)
+        original_language: Original language code (if available)
+        decision_version: Weights/strategy version the decision was made with
+        language: Language code used for the search
+        cached_at: Timestamp when the decision was cached
+    """
+
+    query_title: str
+    query_year: int | None
+    tmdb_id: int
+    title: str
+    year: int | None
+    confidence_score: float
+    media_type: str
+    poster_path: str | None = None
+    backdrop_path: str | None = None
+    overview: str | None = None
+    popularity: float | None = None
+    vote_average: float | None = None
+    original_language: str | None = None
+    decision_version: str = ""
+    language: str = "ko-KR"
+    cached_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
@@ -8,6 +8,7 @@ fuzzy matching, year-based filtering, and confidence scoring.
 from __future__ import annotations
 
 import logging
+from collections.abc import Sequence
 from typing import Any
 
 from anivault.core.matching.models import CacheStats, MatchQuery, MatchResult, NormalizedQuery
@@ -15,8 +16,12 @@ from anivault.core.matching.services import (
     CacheAdapterProtocol,
     CandidateFilterService,
     CandidateScoringService,
+    ExactMatchService,
     FallbackStrategyService,
+    LocalTitleIndex,
+    MatchDecisionCache,
     TMDBSearchService,
+    compute_decision_version,
 )
 from anivault.core.matching.strategies import (
     FallbackStrategy,
@@ -25,22 +30,38 @@ from anivault.core.matching.strategies import (
 )
 from anivault.core.statistics import StatisticsCollector
 from anivault.domain.entities.parser import ParsingResult
-from anivault.shared.constants import ConfidenceThresholds
+from anivault.shared.constants import Cache, ConfidenceThresholds
 from anivault.shared.models.api.tmdb import ScoredSearchResult, TMDBSearchResult
 from anivault.shared.protocols.services import TMDBClientProtocol
 
 logger = logging.getLogger(__name__)
 
 
+def default_fallback_strategies() -> list[FallbackStrategy]:
+    """Fallback strategies used by the engine (executed cheapest first).
+
+    Also used to compute the match decision version outside the engine
+    (e.g. by the ``match-cache`` CLI command).
+
+    Returns:
+        New strategy instances
+    """
+    return [
+        GenreBoostStrategy(),
+        PartialMatchStrategy(),
+    ]
+
+
 class MatchingEngine:
     """Multi-stage matching engine for finding anime titles in TMDB.
 
     This engine orchestrates the entire matching process by:
     1. Normalizing the input query
     2. Searching TMDB with caching
-    3. Scoring candidates using fuzzy matching
-    4. Filtering and sorting by year
-    5. Returning the best match
+    3. Returning an exact title (+ year) match directly (fast path)
+    4. Scoring candidates using fuzzy matching
+    5. Filtering and sorting by year
+    6. Returning the best match
 
     Args:
         cache: Cache v2 instance for storing TMDB search results
@@ -52,6 +73,8 @@ class MatchingEngine:
         cache_adapter: CacheAdapterProtocol,
         tmdb_client: TMDBClientProtocol,
         statistics: StatisticsCollector | None = None,
+        local_index: LocalTitleIndex | None = None,
+        decision_cache: MatchDecisionCache | None = None,
     ):
         """Initialize the matching engine.
 
@@ -59,6 +82,9 @@ class MatchingEngine:
             cache_adapter: Cache adapter for storing TMDB search results
             tmdb_client: TMDB client for API calls
             statistics: Optional statistics collector for performance tracking
+            local_index: Optional offline title index consulted before TMDB search
+            decision_cache: Optional cache of final match decisions; a hit skips
+                search, scoring and fallback entirely
         """
         self.statistics = statistics or StatisticsCollector()
 
@@ -73,19 +99,25 @@ class MatchingEngine:
             cache=self.cache,
             tmdb_client=tmdb_client,
             statistics=self.statistics,
+            local_index=local_index,
         )
+        self._exact_match_service = ExactMatchService(statistics=self.statistics)
         self._scoring_service = CandidateScoringService(statistics=self.statistics)
         self._filter_service = CandidateFilterService(statistics=self.statistics)
 
         # Initialize fallback strategies
 
-        fallback_strategies: list[FallbackStrategy] = [
-            GenreBoostStrategy(),
-            PartialMatchStrategy(),
-        ]
         self._fallback_service = FallbackStrategyService(
             statistics=self.statistics,
-            strategies=fallback_strategies,
+            strategies=default_fallback_strategies(),
+        )
+
+        # Final decision cache, keyed by the weights/strategy version so that
+        # configuration changes invalidate previous decisions automatically
+        self._decision_cache = decision_cache
+        self.decision_version = compute_decision_version(
+            self._scoring_service.weights,
+            self._fallback_service.strategies,
         )
 
     async def find_match(  # pylint: disable=too-many-return-statements
@@ -113,99 +145,273 @@ class MatchingEngine:
             if not normalized_query:
                 return None
 
+            cached_result = self._get_cached_decision(normalized_query)
+            if cached_result is not None:
+                return cached_result
+
             # Step 2: Search for candidates (delegate to SearchService)
             candidates = await self._search_service.search(normalized_query)
             if not candidates:
                 logger.debug("No candidates found for query: %s", normalized_query.title)
                 return None
 
+            # Fast path: an unambiguous exact title (+ year) match skips steps 3-9
+            exact_result = self._resolve_exact_match(candidates, normalized_query)
+            if exact_result is not None:
+                return exact_result
+
             # Step 3: Score and rank candidates (delegate to ScoringService)
             scored_candidates = self._scoring_service.score_candidates(
                 candidates,
                 normalized_query,
             )
-            if not scored_candidates:
-                return None
 
-            # Step 4: Apply filters (delegate to FilterService)
-            filtered_candidates = self._filter_service.filter_by_year(
-                scored_candidates,
-                normalized_query.year,
-            )
-            if not filtered_candidates:
-                logger.debug("All candidates filtered out")
-                return None
+            # Steps 4-9: filter, re-rank, fallback, validate, build result
+            match_result = self._select_best_match(scored_candidates, candidates, normalized_query)
+            if match_result is not None:
+                self._store_decision(normalized_query, match_result)
+            return match_result
 
-            # Step 5: Re-rank candidates after filtering (optional, for consistency)
-            # Note: FilterService.filter_by_year() now preserves confidence order,
-            # but we still re-rank here to ensure consistency and handle any edge cases.
-            # This also applies popularity tie-breaker for candidates with equal confidence.
-            ranked_candidates = self._scoring_service.rank_candidates(filtered_candidates)
-            if not ranked_candidates:
-                logger.debug("No candidates after re-ranking")
-                return None
+        except (KeyError, ValueError, TypeError, AttributeError, IndexError):
+            # Data parsing errors during matching
+            logger.exception("Error in find_match (parsing error)")
+            self.statistics.record_match_failure()
+            return None
+        except Exception:  # pylint: disable=broad-exception-caught
+            # Unexpected errors
+            logger.exception("Error in find_match (unexpected error)")
+            self.statistics.record_match_failure()
+            return None
+        finally:
+            # Every exit path ends its timer (timers are per task; see StatisticsCollector)
+            self.statistics.end_timing("matching_operation")
 
-            # Step 6: Get best candidate from re-ranked list
-            best_candidate = ranked_candidates[0]
-            best_confidence = best_candidate.confidence_score
+    async def find_matches(
+        self,
+        queries: Sequence[MatchQuery | ParsingResult | dict[str, Any]],
+    ) -> list[MatchResult | None]:
+        """Find the best match for many queries at once.
+
+        Same per-query result as ``find_match``, but the batch is processed
+        stage by stage:
+        1. Normalize all queries; identical (title, year) queries are matched once,
+           and queries with a cached decision are answered from the decision cache
+        2. Read the search cache for all distinct series in one bulk lookup,
+           then fetch all misses concurrently (under the TMDB client's rate limits)
+        3. Resolve exact title (+ year) matches directly, then score all
+           remaining candidate lists in one scoring pass
+        4. Filter/rank/fallback per query
+
+        Args:
+            queries: MatchQuery, ParsingResult, or dict per item
+
+        Returns:
+            MatchResult or None per input query, in input order
+        """
+        self.statistics.start_timing("matching_batch_operation")
+        try:
+            # Step 1: Normalize and dedup
+            normalized: list[NormalizedQuery | None] = []
+            for raw in queries:
+                try:
+                    normalized.append(self._validate_and_normalize_input(self._convert_input(raw)))
+                except (KeyError, ValueError, TypeError, AttributeError, IndexError):
+                    logger.exception("Error in find_matches (invalid query)")
+                    self.statistics.record_match_failure()
+                    normalized.append(None)
+
+            results_by_query: dict[NormalizedQuery, MatchResult | None] = {}
+            unique_queries: list[NormalizedQuery] = []
+            for query in dict.fromkeys(q for q in normalized if q is not None):
+                cached_result = self._get_cached_decision(query)
+                if cached_result is not None:
+                    results_by_query[query] = cached_result
+                else:
+                    unique_queries.append(query)
+
+            if unique_queries:
+                # Step 2: Search (bulk cache check, concurrent misses)
+                candidate_lists = await self._search_service.search_many(unique_queries)
+
+                # Step 3: Exact matches first, then score everything else in one pass
+                to_score: list[tuple[list[TMDBSearchResult], NormalizedQuery]] = []
+                for query, candidates in zip(unique_queries, candidate_lists):
+                    if not candidates:
+                        logger.debug("No candidates found for query: %s", query.title)
+                        results_by_query[query] = None
+                        continue
+                    exact_result = self._resolve_exact_match(candidates, query)
+                    if exact_result is not None:
+                        results_by_query[query] = exact_result
+                    else:
+                        to_score.append((candidates, query))
+                scored_lists = self._scoring_service.score_candidates_batch(to_score)
+
+                # Step 4: Select per query
+                for (candidates, query), scored_candidates in zip(to_score, scored_lists):
+                    try:
+                        match_result = self._select_best_match(scored_candidates, candidates, query)
+                        if match_result is not None:
+                            self._store_decision(query, match_result)
+                        results_by_query[query] = match_result
+                    except Exception:  # pylint: disable=broad-exception-caught
+                        logger.exception("Error in find_matches for query: %s", query.title)
+                        self.statistics.record_match_failure()
+                        results_by_query[query] = None
 
             logger.debug(
-                "Best candidate for '%s': '%s' (confidence: %.3f)",
-                normalized_query.title,
-                best_candidate.display_title,
-                best_confidence,
+                "Batch matched %d queries (%d distinct, %d from decision cache): %d matches",
+                len(normalized),
+                len(results_by_query),
+                len(results_by_query) - len(unique_queries),
+                sum(1 for result in results_by_query.values() if result is not None),
             )
+            return [results_by_query[q] if q is not None else None for q in normalized]
+        finally:
+            self.statistics.end_timing("matching_batch_operation")
 
-            # Step 7: Apply fallback strategies if confidence < HIGH
-            if best_confidence < ConfidenceThresholds.HIGH:
-                logger.debug(
-                    "Confidence below HIGH threshold (%.3f < %.3f), applying fallback",
-                    best_confidence,
-                    ConfidenceThresholds.HIGH,
-                )
+    def _get_cached_decision(self, normalized_query: NormalizedQuery) -> MatchResult | None:
+        """Return the cached decision for a query, recording hit/miss statistics.
 
-                enhanced_candidates = self._fallback_service.apply_strategies(
-                    ranked_candidates,
-                    normalized_query,
-                )
+        Args:
+            normalized_query: NormalizedQuery domain object
 
-                if enhanced_candidates:
-                    best_candidate = enhanced_candidates[0]
-                    logger.debug(
-                        "Fallback improved confidence: %.3f → %.3f",
-                        best_confidence,
-                        best_candidate.confidence_score,
-                    )
+        Returns:
+            Cached MatchResult or None if there is no decision cache or no entry
+        """
+        if self._decision_cache is None:
+            return None
 
-            # Step 8: Validate final confidence
-            if not self._validate_final_confidence(best_candidate):
-                return None
+        cached_result = self._decision_cache.get(normalized_query, self.decision_version)
+        if cached_result is None:
+            self.statistics.record_cache_miss(Cache.TYPE_MATCH)
+            return None
 
-            # Step 9: Create MatchResult
-            match_result = self._create_match_result(
-                best_candidate,
-                normalized_query,
-            )
+        self.statistics.record_cache_hit(Cache.TYPE_MATCH)
+        self.statistics.record_match_success(
+            confidence=cached_result.confidence_score,
+            candidates_count=0,
+        )
+        logger.debug(
+            "Match decision cache hit for '%s': '%s' (confidence: %.3f)",
+            normalized_query.title,
+            cached_result.title,
+            cached_result.confidence_score,
+        )
+        return cached_result
 
-            # Record stats
-            self._record_successful_match(best_candidate, normalized_query, candidates)
-            self.statistics.end_timing("matching_operation")
+    def _resolve_exact_match(
+        self,
+        candidates: list[TMDBSearchResult],
+        normalized_query: NormalizedQuery,
+    ) -> MatchResult | None:
+        """Build the result directly if one candidate is an exact title (+ year) match.
 
-            return match_result
+        Args:
+            candidates: Search results for the query
+            normalized_query: NormalizedQuery domain object
 
-        except (KeyError, ValueError, TypeError, AttributeError, IndexError):
-            # Data parsing errors during matching
-            logger.exception("Error in find_match (parsing error)")
-            self.statistics.record_match_failure()
-            self.statistics.end_timing("matching_operation")
+        Returns:
+            MatchResult with ``ConfidenceThresholds.EXACT_MATCH`` confidence,
+            or None if the full pipeline has to decide
+        """
+        exact_candidate = self._exact_match_service.find_exact_match(candidates, normalized_query)
+        if exact_candidate is None:
             return None
-        except Exception:  # pylint: disable=broad-exception-caught
-            # Unexpected errors
-            logger.exception("Error in find_match (unexpected error)")
-            self.statistics.record_match_failure()
-            self.statistics.end_timing("matching_operation")
+
+        match_result = self._create_match_result(exact_candidate, normalized_query)
+        self._record_successful_match(exact_candidate, normalized_query, candidates)
+        self._store_decision(normalized_query, match_result)
+        return match_result
+
+    def _store_decision(self, normalized_query: NormalizedQuery, match_result: MatchResult) -> None:
+        """Store a successful decision in the decision cache (if configured)."""
+        if self._decision_cache is not None:
+            self._decision_cache.set(normalized_query, match_result, self.decision_version)
+
+    def _select_best_match(
+        self,
+        scored_candidates: list[ScoredSearchResult],
+        candidates: list[TMDBSearchResult],
+        normalized_query: NormalizedQuery,
+    ) -> MatchResult | None:
+        """Filter, re-rank and apply fallbacks to scored candidates, then build the result.
+
+        Args:
+            scored_candidates: Candidates scored by CandidateScoringService
+            candidates: Original search results (for statistics)
+            normalized_query: NormalizedQuery domain object
+
+        Returns:
+            MatchResult or None if no candidate survives filtering/validation
+        """
+        if not scored_candidates:
             return None
 
+        # Step 4: Apply filters (delegate to FilterService)
+        filtered_candidates = self._filter_service.filter_by_year(
+            scored_candidates,
+            normalized_query.year,
+        )
+        if not filtered_candidates:
+            logger.debug("All candidates filtered out")
+            return None
+
+        # Step 5: Re-rank candidates after filtering (optional, for consistency)
+        # Note: FilterService.filter_by_year() now preserves confidence order,
+        # but we still re-rank here to ensure consistency and handle any edge cases.
+        # This also applies popularity tie-breaker for candidates with equal confidence.
+        ranked_candidates = self._scoring_service.rank_candidates(filtered_candidates)
+        if not ranked_candidates:
+            logger.debug("No candidates after re-ranking")
+            return None
+
+        # Step 6: Get best candidate from re-ranked list
+        best_candidate = ranked_candidates[0]
+        best_confidence = best_candidate.confidence_score
+
+        logger.debug(
+            "Best candidate for '%s': '%s' (confidence: %.3f)",
+            normalized_query.title,
+            best_candidate.display_title,
+            best_confidence,
+        )
+
+        # Step 7: Apply fallback strategies if confidence < HIGH
+        if best_confidence < ConfidenceThresholds.HIGH:
+            logger.debug(
+                "Confidence below HIGH threshold (%.3f < %.3f), applying fallback",
+                best_confidence,
+                ConfidenceThresholds.HIGH,
+            )
+
+            enhanced_candidates = self._fallback_service.apply_strategies(
+                ranked_candidates,
+                normalized_query,
+            )
+
+            if enhanced_candidates:
+                best_candidate = enhanced_candidates[0]
+                logger.debug(
+                    "Fallback improved confidence: %.3f → %.3f",
+                    best_confidence,
+                    best_candidate.confidence_score,
+                )
+
+        # Step 8: Validate final confidence
+        if not self._validate_final_confidence(best_candidate):
+            return None
+
+        # Step 9: Create MatchResult
+        match_result = self._create_match_result(
+            best_candidate,
+            normalized_query,
+        )
+
+        # Record stats
+        self._record_successful_match(best_candidate, normalized_query, candidates)
+        return match_result
+
     def _convert_input(
         self,
         query: MatchQuery | ParsingResult | dict[str, Any],
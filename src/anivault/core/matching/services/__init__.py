@@ -7,8 +7,11 @@ of the matching engine, following the Single Responsibility Principle.
 from __future__ import annotations
 
 from .cache_adapter import CacheAdapterProtocol, SQLiteCacheAdapter
+from .decision_cache import MatchDecisionCache, compute_decision_version
+from .exact_match_service import ExactMatchService, build_title_index
 from .fallback_service import FallbackStrategyService
 from .filter_service import CandidateFilterService
+from .local_index import LocalIndexHit, LocalTitleIndex, load_local_title_index
 from .scoring_service import CandidateScoringService
 from .search_service import TMDBSearchService
 
@@ -16,7 +19,14 @@ __all__ = [
     "CacheAdapterProtocol",
     "CandidateFilterService",
     "CandidateScoringService",
+    "ExactMatchService",
     "FallbackStrategyService",
+    "LocalIndexHit",
+    "LocalTitleIndex",
+    "MatchDecisionCache",
     "SQLiteCacheAdapter",
     "TMDBSearchService",
+    "build_title_index",
+    "compute_decision_version",
+    "load_local_title_index",
 ]
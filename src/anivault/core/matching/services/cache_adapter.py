@@ -54,6 +54,21 @@ class CacheAdapterProtocol(Protocol):
             Strongly-typed cached data model, or None if not found or expired
         """
 
+    def get_many(
+        self,
+        keys: list[str],
+        cache_type: str = Cache.TYPE_SEARCH,
+    ) -> dict[str, CachedSearchData]:
+        """Retrieve cached data for many keys in one bulk lookup.
+
+        Args:
+            keys: Cache key identifiers
+            cache_type: Type of cache (e.g., 'search', 'details')
+
+        Returns:
+            Cached data by key for keys found and not expired (misses omitted)
+        """
+
     def delete(self, key: str, cache_type: str = Cache.TYPE_SEARCH) -> None:
         """Delete cached data by key.
 
@@ -183,6 +198,42 @@ class SQLiteCacheAdapter:
             )
             return None
 
+    def get_many(
+        self,
+        keys: list[str],
+        cache_type: str = Cache.TYPE_SEARCH,
+    ) -> dict[str, CachedSearchData]:
+        """Retrieve cached data for many keys with one bulk backend lookup.
+
+        Args:
+            keys: Cache key identifiers (each enhanced with language)
+            cache_type: Type of cache (default: 'search')
+
+        Returns:
+            Cached data by (original) key for keys found and not expired;
+            misses and unreadable entries are omitted
+
+        Example:
+            >>> found = adapter.get_many(["attack on titan", "one piece"], "search")
+            >>> missing = [key for key in keys if key not in found]
+        """
+        validated_keys = {self._validate_key(self._enhance_key_with_language(key)): key for key in keys}
+        try:
+            cached_dicts = self.backend.get_many(list(validated_keys), cache_type)
+        except Exception:  # pylint: disable=broad-exception-caught
+            logger.exception("Cache get_many operation failed for %d keys, type=%s", len(validated_keys), cache_type)
+            return {}
+
+        found: dict[str, CachedSearchData] = {}
+        for validated_key, cached_dict in cached_dicts.items():
+            key = validated_keys[validated_key]
+            try:
+                found[key] = cast("CachedSearchData", from_dict(CachedSearchData, cached_dict))
+            except Exception:  # pylint: disable=broad-exception-caught
+                logger.exception("Cache get_many deserialization failed for key=%s, type=%s", key[:50], cache_type)
+        logger.debug("Cache get_many: %d keys, %d hits, type=%s", len(validated_keys), len(found), cache_type)
+        return found
+
     def delete(self, key: str, cache_type: str = Cache.TYPE_SEARCH) -> None:
         """Delete cached data by key.
 
@@ -0,0 +1,264 @@
+"""Persistent cache of final match decisions.
+
+The search cache saves TMDB calls, but every lookup still re-scores,
+filters and runs fallback strategies. This cache stores the *decision*
+(chosen TMDB id + confidence) per normalized query so a repeat query skips
+the whole engine.
+
+Keys include a decision version derived from the scoring weights, the
+confidence thresholds and the fallback strategy configuration. Changing any
+of them yields a new version, so entries produced under the old
+configuration are simply never read again (and can be purged).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from collections.abc import Sequence
+from typing import Any, cast
+
+from anivault.config.models.matching_weights import MatchingWeights
+from anivault.core.matching.cache_models import CachedMatchDecision
+from anivault.core.matching.models import MatchResult, NormalizedQuery
+from anivault.core.matching.strategies import FallbackStrategy
+from anivault.infrastructure.cache import SQLiteCacheDB
+from anivault.shared.constants import Cache, ConfidenceThresholds, MatchingCacheConfig
+from anivault.shared.utils.dataclass_serialization import from_dict, to_dict
+
+logger = logging.getLogger(__name__)
+
+_VERSION_LENGTH = 12
+_KEY_SEPARATOR = "|"
+
+
+def _strategy_config(strategy: FallbackStrategy) -> dict[str, Any]:
+    """Describe a strategy by class name and its public scalar settings."""
+    settings = {}
+    for name in dir(strategy):
+        if name.startswith("_"):
+            continue
+        value = getattr(strategy, name)
+        if isinstance(value, (bool, int, float, str)):
+            settings[name] = value
+    return {"type": type(strategy).__name__, "settings": settings}
+
+
+def compute_decision_version(
+    weights: MatchingWeights,
+    strategies: Sequence[FallbackStrategy],
+) -> str:
+    """Fingerprint everything that influences which candidate is chosen.
+
+    Args:
+        weights: Scoring weights used by the engine
+        strategies: Fallback strategies in execution order
+
+    Returns:
+        Short hex digest; changes whenever weights, thresholds or strategies change
+    """
+    payload = {
+        "logic": MatchingCacheConfig.MATCH_DECISION_LOGIC_VERSION,
+        "weights": weights.model_dump(),
+        "thresholds": {
+            "high": ConfidenceThresholds.HIGH,
+            "low": ConfidenceThresholds.LOW,
+        },
+        "strategies": [_strategy_config(strategy) for strategy in strategies],
+    }
+    encoded = json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()[:_VERSION_LENGTH]
+
+
+class MatchDecisionCache:
+    """SQLite-backed cache of final match decisions.
+
+    Shares the TMDB cache database under its own cache type. Only successful
+    matches are stored; a miss always falls through to the full engine.
+    Cache failures are logged and treated as misses.
+
+    Args:
+        backend: SQLite cache database
+        language: Language code (part of the key; results are language-specific)
+        ttl_seconds: Entry lifetime
+
+    Example:
+        >>> cache = MatchDecisionCache(db, language="ko-KR")
+        >>> version = compute_decision_version(weights, strategies)
+        >>> cache.set(query, match_result, version)
+        >>> cache.get(query, version).tmdb_id
+        1429
+    """
+
+    def __init__(
+        self,
+        backend: SQLiteCacheDB,
+        language: str = "ko-KR",
+        ttl_seconds: int = MatchingCacheConfig.MATCH_DECISION_TTL_SECONDS,
+    ) -> None:
+        """Initialize the decision cache.
+
+        Args:
+            backend: SQLite cache database
+            language: Language code (part of the key)
+            ttl_seconds: Entry lifetime
+        """
+        self.backend = backend
+        self.language = language
+        self.ttl_seconds = ttl_seconds
+
+    def make_key(self, query: NormalizedQuery, version: str) -> str:
+        """Build the cache key for a query under a decision version.
+
+        Args:
+            query: Normalized query
+            version: Decision version from ``compute_decision_version``
+
+        Returns:
+            Key of the form ``title|year|version|language``
+        """
+        year = str(query.year) if query.year is not None else ""
+        return _KEY_SEPARATOR.join((query.title, year, version, self.language))
+
+    def get(self, query: NormalizedQuery, version: str) -> MatchResult | None:
+        """Look up the cached decision for a query.
+
+        Args:
+            query: Normalized query
+            version: Current decision version
+
+        Returns:
+            Rebuilt MatchResult, or None on miss/error
+        """
+        try:
+            data = self.backend.get(self.make_key(query, version), cache_type=Cache.TYPE_MATCH)
+            if data is None:
+                return None
+            decision = cast("CachedMatchDecision", from_dict(CachedMatchDecision, data))
+            return MatchResult(
+                tmdb_id=decision.tmdb_id,
+                title=decision.title,
+                year=decision.year,
+                confidence_score=decision.confidence_score,
+                media_type=decision.media_type,
+                poster_path=decision.poster_path,
+                backdrop_path=decision.backdrop_path,
+                overview=decision.overview,
+                popularity=decision.popularity,
+                vote_average=decision.vote_average,
+                original_language=decision.original_language,
+            )
+        except Exception:  # pylint: disable=broad-exception-caught
+            logger.exception("Match decision cache get failed for '%s'", query.title)
+            return None
+
+    def set(self, query: NormalizedQuery, result: MatchResult, version: str) -> None:
+        """Store the decision made for a query.
+
+        Args:
+            query: Normalized query
+            result: Chosen match
+            version: Decision version the match was made under
+        """
+        decision = CachedMatchDecision(
+            query_title=query.title,
+            query_year=query.year,
+            tmdb_id=result.tmdb_id,
+            title=result.title,
+            year=result.year,
+            confidence_score=result.confidence_score,
+            media_type=result.media_type,
+            poster_path=result.poster_path,
+            backdrop_path=result.backdrop_path,
+            overview=result.overview,
+            popularity=result.popularity,
+            vote_average=result.vote_average,
+            original_language=result.original_language,
+            decision_version=version,
+            language=self.language,
+        )
+        try:
+            self.backend.set_cache(
+                key=self.make_key(query, version),
+                data=to_dict(decision),
+                cache_type=Cache.TYPE_MATCH,
+                ttl_seconds=self.ttl_seconds,
+            )
+        except Exception:  # pylint: disable=broad-exception-caught
+            logger.exception("Match decision cache set failed for '%s'", query.title)
+
+    def list_entries(self, limit: int | None = None) -> list[CachedMatchDecision]:
+        """List cached decisions, newest first.
+
+        Args:
+            limit: Maximum number of entries (None for all)
+
+        Returns:
+            Cached decisions (all versions and languages)
+        """
+        decisions: list[CachedMatchDecision] = []
+        for entry in self.backend.list_entries(Cache.TYPE_MATCH, limit):
+            try:
+                decisions.append(cast("CachedMatchDecision", from_dict(CachedMatchDecision, entry["response_data"])))
+            except (KeyError, ValueError, TypeError):
+                logger.debug("Skipping malformed match decision entry: %s", entry["cache_key"][:50])
+        return decisions
+
+    def clear(self) -> int:
+        """Remove all cached decisions.
+
+        Returns:
+            Number of removed entries
+        """
+        cleared = self.backend.clear(cache_type=Cache.TYPE_MATCH)
+        logger.info("Cleared %d match decision cache entries", cleared)
+        return cleared
+
+    def purge_stale(self, current_version: str) -> int:
+        """Remove decisions made under any other decision version.
+
+        Args:
+            current_version: Version to keep
+
+        Returns:
+            Number of removed entries
+        """
+        removed = 0
+        for entry in self.backend.list_entries(Cache.TYPE_MATCH):
+            version = entry["response_data"].get("decision_version")
+            if version != current_version and self.backend.delete(entry["cache_key"], Cache.TYPE_MATCH):
+                removed += 1
+        logger.info("Purged %d stale match decision cache entries", removed)
+        return removed
+
+    def get_cache_info(self, current_version: str | None = None) -> dict[str, Any]:
+        """Summarize cached decisions.
+
+        Args:
+            current_version: Version to count as current (optional)
+
+        Returns:
+            Dictionary with database path, total entries, entries per version
+            and (if ``current_version`` is given) current/stale counts
+        """
+        by_version: dict[str, int] = {}
+        for entry in self.backend.list_entries(Cache.TYPE_MATCH):
+            version = str(entry["response_data"].get("decision_version", ""))
+            by_version[version] = by_version.get(version, 0) + 1
+
+        info: dict[str, Any] = {
+            "database_path": str(self.backend.db_path),
+            "cache_type": Cache.TYPE_MATCH,
+            "total_entries": sum(by_version.values()),
+            "versions": by_version,
+        }
+        if current_version is not None:
+            current = by_version.get(current_version, 0)
+            info["current_version"] = current_version
+            info["current_entries"] = current
+            info["stale_entries"] = info["total_entries"] - current
+        return info
+
+
+__all__ = ["MatchDecisionCache", "compute_decision_version"]
@@ -0,0 +1,148 @@
+"""Exact-match fast path for the matching engine.
+
+Most queries from a well-named library are the exact title of one of the
+search candidates. For those, fuzzy scoring, year filtering, re-ranking and
+fallback strategies cannot change the outcome, so the engine resolves them
+here directly from an index of candidate titles and skips the remaining
+stages.
+
+A candidate is indexed under each of its title variants (localized
+``title``/``name`` and ``original_title``/``original_name``), normalized with
+``normalize_index_title``. A query takes the fast path only when the match is
+unambiguous:
+
+- with a year hint: exactly one indexed candidate has the same normalized
+  title and the same release year
+- without a year hint: exactly one candidate carries the normalized title
+
+Anything else (no exact title, remakes sharing a title, missing dates) goes
+through the full pipeline.
+"""
+
+from __future__ import annotations
+
+import logging
+
+from anivault.core.matching.models import NormalizedQuery
+from anivault.core.matching.services.local_index import normalize_index_title
+from anivault.core.matching.services.scoring_service import _to_scored_result
+from anivault.core.statistics import StatisticsCollector
+from anivault.shared.constants import ConfidenceThresholds
+from anivault.shared.models.api.tmdb import ScoredSearchResult, TMDBSearchResult
+
+logger = logging.getLogger(__name__)
+
+
+def _release_year(candidate: TMDBSearchResult) -> int | None:
+    """Release year of a candidate (None if missing or unparsable)."""
+    date_str = candidate.display_date
+    if not date_str:
+        return None
+    try:
+        return int(date_str.split("-")[0])
+    except ValueError:
+        return None
+
+
+def build_title_index(candidates: list[TMDBSearchResult]) -> dict[str, list[TMDBSearchResult]]:
+    """Index candidates by every normalized title variant.
+
+    Args:
+        candidates: TMDB search results
+
+    Returns:
+        Mapping of normalized title to the candidates carrying it (each
+        candidate at most once per title, in input order)
+    """
+    index: dict[str, list[TMDBSearchResult]] = {}
+    for candidate in candidates:
+        variants = {
+            normalize_index_title(title)
+            for title in (
+                candidate.title,
+                candidate.name,
+                candidate.original_title,
+                candidate.original_name,
+            )
+            if title
+        }
+        for variant in variants:
+            if variant:
+                index.setdefault(variant, []).append(candidate)
+    return index
+
+
+class ExactMatchService:
+    """Resolve exact title (+ year) matches without scoring.
+
+    Attributes:
+        statistics: Statistics collector; every lookup is recorded as a
+            fast-path hit or miss
+
+    Example:
+        >>> service = ExactMatchService(StatisticsCollector())
+        >>> query = NormalizedQuery(title="attack on titan", year=2013)
+        >>> service.find_exact_match(candidates, query).confidence_score
+        1.0
+    """
+
+    def __init__(self, statistics: StatisticsCollector) -> None:
+        """Initialize exact-match service.
+
+        Args:
+            statistics: Statistics collector for fast-path rate tracking
+        """
+        self.statistics = statistics
+
+    def find_exact_match(
+        self,
+        candidates: list[TMDBSearchResult],
+        normalized_query: NormalizedQuery,
+    ) -> ScoredSearchResult | None:
+        """Return the unambiguous exact match among candidates, if any.
+
+        Args:
+            candidates: TMDB search results for the query
+            normalized_query: Normalized query
+
+        Returns:
+            The matching candidate scored with ``ConfidenceThresholds.EXACT_MATCH``,
+            or None if the full pipeline has to decide
+        """
+        match = self._lookup(candidates, normalized_query)
+        self.statistics.record_fast_path(hit=match is not None)
+        if match is None:
+            return None
+
+        logger.debug(
+            "Exact match fast path for '%s': '%s' (id=%d)",
+            normalized_query.title,
+            match.display_title,
+            match.id,
+        )
+        return _to_scored_result(match, ConfidenceThresholds.EXACT_MATCH)
+
+    @staticmethod
+    def _lookup(
+        candidates: list[TMDBSearchResult],
+        normalized_query: NormalizedQuery,
+    ) -> TMDBSearchResult | None:
+        """Find the single candidate whose title (and year, if hinted) matches exactly."""
+        key = normalize_index_title(normalized_query.title)
+        if not key or not candidates:
+            return None
+
+        matches = build_title_index(candidates).get(key)
+        if not matches:
+            return None
+
+        if normalized_query.year is not None:
+            matches = [candidate for candidate in matches if _release_year(candidate) == normalized_query.year]
+
+        # Ambiguous titles (remakes, tv/movie pairs) need scoring and fallbacks
+        if len({(candidate.media_type, candidate.id) for candidate in matches}) != 1:
+            return None
+        return matches[0]
+
+
+__all__ = ["ExactMatchService", "build_title_index"]
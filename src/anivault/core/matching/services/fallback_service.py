@@ -1,7 +1,7 @@
 """Fallback strategy service for matching engine.
 
 This module provides the FallbackStrategyService class that orchestrates
-multiple fallback strategies in priority order.
+multiple fallback strategies in cost order, stopping once confidence is achieved.
 """
 
 from __future__ import annotations
@@ -11,23 +11,37 @@ import logging
 from anivault.core.matching.models import NormalizedQuery
 from anivault.core.matching.strategies import FallbackStrategy
 from anivault.core.statistics import StatisticsCollector
+from anivault.shared.constants import ConfidenceThresholds
+from anivault.shared.constants import FallbackStrategy as FallbackStrategyConfig
 from anivault.shared.models.api.tmdb import ScoredSearchResult
 
 logger = logging.getLogger(__name__)
 
 
+def _execution_order(strategy: FallbackStrategy) -> tuple[int, int]:
+    """Sort key: declared cost, then priority."""
+    return (getattr(strategy, "cost", FallbackStrategyConfig.DEFAULT_COST), strategy.priority)
+
+
+def _top_score(candidates: list[ScoredSearchResult]) -> float:
+    """Highest confidence among candidates (0.0 if empty)."""
+    return max((c.confidence_score for c in candidates), default=0.0)
+
+
 class FallbackStrategyService:
     """Service for orchestrating fallback strategies.
 
     This service:
     1. Manages multiple fallback strategies
-    2. Applies them in priority order (lowest first)
-    3. Handles strategy failures gracefully
-    4. Logs strategy application and results
+    2. Applies them to the top-k candidates in cost order (cheapest first)
+    3. Stops once HIGH confidence is achieved
+    4. Handles strategy failures gracefully
+    5. Times each strategy and logs application and results
 
     Attributes:
         statistics: Statistics collector for performance tracking
-        strategies: List of fallback strategies (sorted by priority)
+        strategies: List of fallback strategies (sorted by cost, then priority)
+        top_k: Number of top-ranked candidates the strategies are applied to
 
     Example:
         >>> from anivault.core.matching.strategies import GenreBoostStrategy, PartialMatchStrategy
@@ -43,46 +57,59 @@ class FallbackStrategyService:
         self,
         statistics: StatisticsCollector,
         strategies: list[FallbackStrategy] | None = None,
+        top_k: int = FallbackStrategyConfig.TOP_K,
     ) -> None:
         """Initialize fallback strategy service.
 
         Args:
             statistics: Statistics collector for performance tracking
-            strategies: List of fallback strategies (will be sorted by priority)
+            strategies: List of fallback strategies (will be sorted by cost, then priority)
+            top_k: Number of top-ranked candidates the strategies are applied to
         """
         self.statistics = statistics
+        self.top_k = top_k
         self._strategies: list[FallbackStrategy] = []
 
         if strategies:
-            # Sort strategies by priority (ascending = lower priority first)
-            self._strategies = sorted(strategies, key=lambda s: s.priority)
+            # Cheapest strategies first, priority as tie-breaker
+            self._strategies = sorted(strategies, key=_execution_order)
             logger.debug(
                 "Initialized with %d strategies: %s",
                 len(self._strategies),
                 [type(s).__name__ for s in self._strategies],
             )
 
+    @property
+    def strategies(self) -> tuple[FallbackStrategy, ...]:
+        """Configured strategies in execution order."""
+        return tuple(self._strategies)
+
     def apply_strategies(
         self,
         candidates: list[ScoredSearchResult],
         query: NormalizedQuery,
     ) -> list[ScoredSearchResult]:
-        """Apply all strategies in priority order.
+        """Apply strategies cheapest first until confidence is achieved.
 
-        Strategies are applied sequentially, with each strategy receiving
-        the output of the previous strategy. Failed strategies are logged
-        and skipped (graceful degradation).
+        Only the top ``top_k`` candidates are passed to the strategies (the
+        input is expected to be ranked). Strategies are applied sequentially,
+        each receiving the output of the previous one, in ascending cost order.
+        After each strategy the confidence predicate is checked and the
+        remaining strategies are skipped once it holds. Failed strategies are
+        logged and skipped (graceful degradation). Each strategy run is timed
+        in StatisticsCollector as ``fallback_strategy.<StrategyName>``.
 
         Args:
-            candidates: List of scored candidates
+            candidates: List of scored candidates, ranked by confidence
             query: Normalized query for matching
 
         Returns:
-            Enhanced list of candidates after all strategies applied
+            Enhanced top candidates re-ranked by confidence (popularity as
+            tie-breaker), followed by the untouched remaining candidates
             Returns original candidates if all strategies fail
 
         Note:
-            - Strategies applied in ascending priority order
+            - Strategies applied in ascending (cost, priority) order
             - Exception in one strategy doesn't affect others
             - Empty candidate lists handled gracefully
         """
@@ -94,12 +121,18 @@ class FallbackStrategyService:
             logger.debug("No strategies configured")
             return candidates
 
-        # Start with original candidates
-        current_candidates = candidates
+        # Boosts only raise scores, so the untouched tail stays ranked below the head
+        current_candidates = candidates[: self.top_k]
+        remaining_candidates = candidates[self.top_k :]
+
+        if self._confidence_achieved(current_candidates):
+            logger.debug("Confidence already achieved, skipping fallback strategies")
+            return candidates
 
         logger.debug(
-            "Applying %d fallback strategies to %d candidates",
+            "Applying up to %d fallback strategies to top %d of %d candidates",
             len(self._strategies),
+            len(current_candidates),
             len(candidates),
         )
 
@@ -110,14 +143,15 @@ class FallbackStrategyService:
             try:
                 # Record initial state
                 before_count = len(current_candidates)
-                before_top_score = current_candidates[0].confidence_score if current_candidates else 0.0
+                before_top_score = _top_score(current_candidates)
 
                 # Apply strategy
-                current_candidates = strategy.apply(current_candidates, query)
+                with self.statistics.timing(f"fallback_strategy.{strategy_name}"):
+                    current_candidates = strategy.apply(current_candidates, query)
 
                 # Record result
                 after_count = len(current_candidates)
-                after_top_score = current_candidates[0].confidence_score if current_candidates else 0.0
+                after_top_score = _top_score(current_candidates)
 
                 # Log delta
                 count_delta = after_count - before_count
@@ -141,6 +175,7 @@ class FallbackStrategyService:
                     strategy_name,
                 )
                 # Keep current candidates unchanged
+                continue
             except Exception:  # pylint: disable=broad-exception-caught
                 # Unexpected errors
                 logger.exception(
@@ -148,14 +183,31 @@ class FallbackStrategyService:
                     strategy_name,
                 )
                 # Keep current candidates unchanged
+                continue
+
+            achieved = getattr(strategy, "confidence_achieved", None) or self._confidence_achieved
+            if achieved(current_candidates):
+                logger.debug("Confidence achieved after %s, skipping remaining strategies", strategy_name)
+                break
+
+        current_candidates = sorted(
+            current_candidates,
+            key=lambda c: (c.confidence_score, c.popularity),
+            reverse=True,
+        )
 
         logger.debug(
             "Completed fallback strategies: %d candidates, top score: %.3f",
             len(current_candidates),
-            current_candidates[0].confidence_score if current_candidates else 0.0,
+            _top_score(current_candidates),
         )
 
-        return current_candidates
+        return current_candidates + remaining_candidates
+
+    @staticmethod
+    def _confidence_achieved(candidates: list[ScoredSearchResult]) -> bool:
+        """Default predicate: the best candidate reached HIGH confidence."""
+        return _top_score(candidates) >= ConfidenceThresholds.HIGH
 
     def register_strategy(self, strategy: FallbackStrategy) -> None:
         """Register a new strategy dynamically.
@@ -164,14 +216,15 @@ class FallbackStrategyService:
             strategy: Fallback strategy to register
 
         Note:
-            Strategies are automatically sorted by priority after registration
+            Strategies are automatically sorted by (cost, priority) after registration
         """
         self._strategies.append(strategy)
-        self._strategies.sort(key=lambda s: s.priority)
+        self._strategies.sort(key=_execution_order)
 
         logger.debug(
-            "Registered strategy: %s (priority: %d)",
+            "Registered strategy: %s (cost: %d, priority: %d)",
             type(strategy).__name__,
+            _execution_order(strategy)[0],
             strategy.priority,
         )
 
@@ -0,0 +1,324 @@
+"""Offline title index built from TMDB daily ID export files.
+
+TMDB publishes daily ID exports (``tv_series_ids_MM_DD_YYYY.json.gz``,
+``movie_ids_MM_DD_YYYY.json.gz``): gzip JSON lines with ``id``,
+``original_name``/``original_title`` and ``popularity``. This module loads
+them into an in-memory character n-gram inverted index so that search
+queries can be resolved to candidate TMDB ids without a search API call.
+
+Lookup is two-staged:
+1. Count shared n-grams through the inverted index to pick a small pool of
+   candidate titles (rare n-grams first, very common ones skipped).
+2. Score the pool with rapidfuzz and keep hits above ``min_score``.
+"""
+
+from __future__ import annotations
+
+import gzip
+import heapq
+import json
+import logging
+import re
+import unicodedata
+from array import array
+from collections import Counter
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+
+from rapidfuzz import fuzz, process
+
+from anivault.shared.constants import Encoding, LocalTitleIndexConfig, MediaType
+from anivault.shared.errors import ErrorCode, ErrorContext, InfrastructureError
+
+logger = logging.getLogger(__name__)
+
+_NON_ALNUM = re.compile(r"[\W_]+", flags=re.UNICODE)
+
+
+def normalize_index_title(title: str) -> str:
+    """Normalize a title for index storage and lookup.
+
+    NFKC-normalizes (full-width to half-width), casefolds and replaces
+    punctuation/separators with single spaces. CJK characters are kept.
+
+    Args:
+        title: Raw title
+
+    Returns:
+        Normalized title
+
+    Example:
+        >>> normalize_index_title("Re:Zero - Starting Life")
+        're zero starting life'
+    """
+    folded = unicodedata.normalize("NFKC", title).casefold()
+    return _NON_ALNUM.sub(" ", folded).strip()
+
+
+def _ngrams(text: str, size: int) -> set[str]:
+    """Character n-grams of a normalized title, padded so short titles still index."""
+    padded = f" {text} "
+    if len(padded) <= size:
+        return {padded}
+    return {padded[i : i + size] for i in range(len(padded) - size + 1)}
+
+
+def _iter_export_titles(path: Path | str) -> Iterator[tuple[int, str, float]]:
+    """Yield (id, original title, popularity) per valid, non-adult export line."""
+    with gzip.open(Path(path), "rt", encoding=Encoding.DEFAULT) as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            title = entry.get("original_name") or entry.get("original_title")
+            if entry.get("adult") or not title or "id" not in entry:
+                continue
+            yield int(entry["id"]), title, float(entry.get("popularity") or 0.0)
+
+
+@dataclass(frozen=True)
+class LocalIndexHit:
+    """A title found in the offline index.
+
+    Attributes:
+        id: TMDB ID
+        media_type: 'tv' or 'movie'
+        title: Original title from the export
+        popularity: TMDB popularity at export time
+        score: rapidfuzz similarity to the query (0-100)
+    """
+
+    id: int
+    media_type: str
+    title: str
+    popularity: float
+    score: float
+
+
+class LocalTitleIndex:  # pylint: disable=too-many-instance-attributes
+    """In-memory n-gram inverted index over TMDB export titles.
+
+    Args:
+        min_score: Minimum rapidfuzz score for ``lookup`` hits (0-100)
+        max_candidates: Maximum hits returned by ``lookup``
+        ngram_size: Character n-gram size
+
+    Example:
+        >>> index = LocalTitleIndex.from_directory("~/.anivault/tmdb_exports")
+        >>> index.lookup("shingeki no kyojin")
+        [LocalIndexHit(id=1429, media_type='tv', title='進撃の巨人', ...)]
+    """
+
+    def __init__(
+        self,
+        min_score: float = LocalTitleIndexConfig.MIN_SCORE,
+        max_candidates: int = LocalTitleIndexConfig.MAX_CANDIDATES,
+        ngram_size: int = LocalTitleIndexConfig.NGRAM_SIZE,
+    ) -> None:
+        """Initialize an empty index.
+
+        Args:
+            min_score: Minimum rapidfuzz score for ``lookup`` hits (0-100)
+            max_candidates: Maximum hits returned by ``lookup``
+            ngram_size: Character n-gram size
+        """
+        self.min_score = min_score
+        self.max_candidates = max_candidates
+        self.ngram_size = ngram_size
+
+        # Column storage keyed by document number
+        self._ids = array("q")
+        self._popularity = array("d")
+        self._media_types: list[str] = []
+        self._titles: list[str] = []
+        self._normalized: list[str] = []
+        self._postings: dict[str, array[int]] = {}
+
+    def __len__(self) -> int:
+        """Number of indexed titles."""
+        return len(self._ids)
+
+    def add(self, media_id: int, media_type: str, title: str, popularity: float = 0.0) -> None:
+        """Add a title to the index.
+
+        Args:
+            media_id: TMDB ID
+            media_type: 'tv' or 'movie'
+            title: Title to index
+            popularity: TMDB popularity (tie-breaker for candidate selection)
+        """
+        normalized = normalize_index_title(title)
+        if not normalized:
+            return
+
+        doc = len(self._ids)
+        self._ids.append(media_id)
+        self._popularity.append(popularity)
+        self._media_types.append(media_type)
+        self._titles.append(title)
+        self._normalized.append(normalized)
+        for gram in _ngrams(normalized, self.ngram_size):
+            posting = self._postings.get(gram)
+            if posting is None:
+                posting = self._postings[gram] = array("i")
+            posting.append(doc)
+
+    def add_export_file(self, path: Path | str, media_type: str) -> int:
+        """Load a TMDB daily ID export file (gzip JSON lines).
+
+        Adult entries are skipped. Malformed lines are ignored.
+
+        Args:
+            path: Path to the ``*.json.gz`` export
+            media_type: 'tv' or 'movie'
+
+        Returns:
+            Number of titles added
+
+        Raises:
+            InfrastructureError: If the file cannot be read
+        """
+        path = Path(path)
+        added = 0
+        try:
+            for media_id, title, popularity in _iter_export_titles(path):
+                before = len(self)
+                self.add(media_id, media_type, title, popularity)
+                added += len(self) - before
+        except OSError as e:
+            raise InfrastructureError(
+                code=ErrorCode.FILE_READ_ERROR,
+                message=f"Failed to read TMDB export file: {path}",
+                context=ErrorContext(
+                    operation="local_title_index_load",
+                    additional_data={"path": str(path), "media_type": media_type},
+                ),
+                original_error=e,
+            ) from e
+
+        logger.info("Loaded %d %s titles from TMDB export %s", added, media_type, path.name)
+        return added
+
+    @classmethod
+    def from_directory(
+        cls,
+        directory: Path | str,
+        min_score: float = LocalTitleIndexConfig.MIN_SCORE,
+        max_candidates: int = LocalTitleIndexConfig.MAX_CANDIDATES,
+    ) -> LocalTitleIndex:
+        """Build an index from the newest TV and movie exports in a directory.
+
+        Args:
+            directory: Directory containing the export files
+            min_score: Minimum rapidfuzz score for ``lookup`` hits (0-100)
+            max_candidates: Maximum hits returned by ``lookup``
+
+        Returns:
+            Populated index (empty if no export files are found)
+        """
+        directory = Path(directory).expanduser()
+        index = cls(min_score=min_score, max_candidates=max_candidates)
+        for pattern, media_type in (
+            (LocalTitleIndexConfig.TV_EXPORT_PATTERN, MediaType.TV),
+            (LocalTitleIndexConfig.MOVIE_EXPORT_PATTERN, MediaType.MOVIE),
+        ):
+            files = sorted(directory.glob(pattern), key=lambda p: p.stat().st_mtime)
+            if files:
+                index.add_export_file(files[-1], media_type)
+        return index
+
+    def _candidate_pool(self, query: str) -> list[int]:
+        """Pick documents sharing the most n-grams with the query."""
+        grams = [g for g in _ngrams(query, self.ngram_size) if g in self._postings]
+        if not grams:
+            return []
+
+        grams.sort(key=lambda g: len(self._postings[g]))
+        selective = [g for g in grams if len(self._postings[g]) <= LocalTitleIndexConfig.MAX_POSTING_LENGTH]
+        counts: Counter[int] = Counter()
+        for gram in selective or grams[:1]:
+            counts.update(self._postings[gram])
+
+        return heapq.nlargest(
+            LocalTitleIndexConfig.CANDIDATE_POOL,
+            counts,
+            key=lambda doc: (counts[doc], self._popularity[doc]),
+        )
+
+    def lookup(self, title: str, limit: int | None = None) -> list[LocalIndexHit]:
+        """Find indexed titles similar to a query.
+
+        Args:
+            title: Query title
+            limit: Maximum hits (defaults to ``max_candidates``)
+
+        Returns:
+            Hits with score >= ``min_score``, best first (popularity breaks ties)
+        """
+        query = normalize_index_title(title)
+        if not query:
+            return []
+
+        pool = self._candidate_pool(query)
+        if not pool:
+            return []
+
+        scored = process.extract(
+            query,
+            {doc: self._normalized[doc] for doc in pool},
+            scorer=fuzz.token_sort_ratio,
+            score_cutoff=self.min_score,
+            limit=None,
+        )
+        scored.sort(key=lambda item: (item[1], self._popularity[item[2]]), reverse=True)
+
+        return [
+            LocalIndexHit(
+                id=self._ids[doc],
+                media_type=self._media_types[doc],
+                title=self._titles[doc],
+                popularity=self._popularity[doc],
+                score=score,
+            )
+            for _, score, doc in scored[: limit or self.max_candidates]
+        ]
+
+
+def load_local_title_index(
+    directory: str | Path | None,
+    min_score: float = LocalTitleIndexConfig.MIN_SCORE,
+    max_candidates: int = LocalTitleIndexConfig.MAX_CANDIDATES,
+) -> LocalTitleIndex | None:
+    """Load the offline title index if a directory is configured.
+
+    Args:
+        directory: Export directory (``api.tmdb.local_index_dir``); empty disables the index
+        min_score: Minimum rapidfuzz score for hits (0-100)
+        max_candidates: Maximum hits per lookup
+
+    Returns:
+        Populated index, or None if disabled, missing or empty
+    """
+    if not directory:
+        return None
+
+    path = Path(directory).expanduser()
+    if not path.is_dir():
+        logger.warning("Offline title index directory not found: %s", path)
+        return None
+
+    index = LocalTitleIndex.from_directory(path, min_score=min_score, max_candidates=max_candidates)
+    if not len(index):
+        logger.warning("No TMDB export files found in %s", path)
+        return None
+    return index
+
+
+__all__ = [
+    "LocalIndexHit",
+    "LocalTitleIndex",
+    "load_local_title_index",
+    "normalize_index_title",
+]
@@ -7,10 +7,16 @@ confidence score calculation and candidate ranking logic.
 from __future__ import annotations
 
 import logging
+from collections.abc import Sequence
+from dataclasses import fields
+from typing import Any
 
 from anivault.config.models.matching_weights import MatchingWeights
 from anivault.core.matching.models import NormalizedQuery
-from anivault.core.matching.scoring import calculate_confidence_score
+from anivault.core.matching.scoring import (
+    calculate_confidence_score,
+    calculate_confidence_scores_batch,
+)
 from anivault.core.statistics import StatisticsCollector
 from anivault.shared.constants import ConfidenceThresholds
 from anivault.shared.constants.validation_constants import (
@@ -76,9 +82,9 @@ class CandidateScoringService:
         # Load weights if not provided
         if weights is None:
             try:
-                from anivault.config import load_settings
+                from anivault.config import get_settings_snapshot
 
-                settings = load_settings()
+                settings = get_settings_snapshot().settings
                 weights = settings.matching_weights
             except (ImportError, AttributeError):
                 weights = MatchingWeights()
@@ -105,6 +111,7 @@ class CandidateScoringService:
         self,
         candidates: list[TMDBSearchResult],
         normalized_query: NormalizedQuery,
+        top_k: int | None = None,
     ) -> list[ScoredSearchResult]:
         """Score and rank candidates by confidence.
 
@@ -115,6 +122,8 @@ class CandidateScoringService:
         Args:
             candidates: List of TMDB search results to score
             normalized_query: Normalized query for scoring comparison
+            top_k: Only build ScoredSearchResult objects for the k best candidates
+                (default: all candidates)
 
         Returns:
             List of scored candidates sorted by confidence (highest first)
@@ -125,6 +134,18 @@ class CandidateScoringService:
             >>> for result in scored:
             ...     print(f"{result.title}: {result.confidence_score:.3f}")
         """
+        return self.score_candidates_batch([(candidates, normalized_query)], top_k=top_k)[0]
+
+    def _score_candidates_scalar(
+        self,
+        candidates: list[TMDBSearchResult],
+        normalized_query: NormalizedQuery,
+    ) -> list[ScoredSearchResult]:
+        """Score candidates one by one with calculate_confidence_score.
+
+        Reference implementation of the vectorized path; used as fallback
+        when vectorized scoring fails.
+        """
         scored_candidates: list[ScoredSearchResult] = []
 
         for candidate in candidates:
@@ -225,6 +246,62 @@ class CandidateScoringService:
 
         return scored_candidates
 
+    def score_candidates_batch(
+        self,
+        batch: Sequence[tuple[list[TMDBSearchResult], NormalizedQuery]],
+        top_k: int | None = None,
+    ) -> list[list[ScoredSearchResult]]:
+        """Score candidate lists of many queries in one vectorized pass.
+
+        Scores come from ``calculate_confidence_scores_batch`` (rapidfuzz +
+        NumPy, identical to the scalar scores); candidates are ranked on the
+        score arrays and only the top ``top_k`` per query are materialized as
+        ScoredSearchResult.
+
+        Args:
+            batch: (candidates, normalized query) pairs
+            top_k: Only build ScoredSearchResult objects for the k best candidates
+                of each pair (default: all candidates)
+
+        Returns:
+            Scored and sorted candidates per pair, in input order
+        """
+        try:
+            score_arrays = calculate_confidence_scores_batch(
+                [(query, candidates) for candidates, query in batch],
+                weights=self.weights,
+            )
+        except Exception:  # pylint: disable=broad-exception-caught
+            logger.exception("Vectorized candidate scoring failed; falling back to scalar scoring")
+            return [self._score_candidates_scalar(candidates, query)[:top_k] for candidates, query in batch]
+
+        return [self._materialize_ranked(candidates, scores.tolist(), top_k) for (candidates, _), scores in zip(batch, score_arrays)]
+
+    def _materialize_ranked(
+        self,
+        candidates: list[TMDBSearchResult],
+        scores: list[float],
+        top_k: int | None,
+    ) -> list[ScoredSearchResult]:
+        """Rank candidates by (score, popularity) and build results for the top k."""
+        # Same stable order as sorting ScoredSearchResults by _candidate_sort_key
+        order = sorted(
+            range(len(candidates)),
+            key=lambda i: (scores[i], candidates[i].popularity),
+            reverse=True,
+        )
+        if top_k is not None:
+            order = order[:top_k]
+
+        scored_candidates = [_to_scored_result(candidates[i], scores[i]) for i in order]
+
+        logger.debug(
+            "Scored %d candidates, materialized %d",
+            len(candidates),
+            len(scored_candidates),
+        )
+        return scored_candidates
+
     def rank_candidates(
         self,
         candidates: list[TMDBCandidate],
@@ -300,3 +377,24 @@ class CandidateScoringService:
         if confidence_score >= ConfidenceThresholds.LOW:
             return "low"
         return SCORE_VERY_LOW
+
+
+_PLAIN_TYPES = (str, int, float, bool, type(None))
+
+
+def _to_scored_result(candidate: TMDBSearchResult, confidence_score: float) -> ScoredSearchResult:
+    """Build a ScoredSearchResult from a candidate.
+
+    Equivalent to ``ScoredSearchResult(**to_dict(candidate), ...)`` for plain
+    field values (lists are copied) without the recursive asdict walk;
+    anything else goes through to_dict.
+    """
+    data: dict[str, Any] = {}
+    for field_info in fields(candidate):
+        value = getattr(candidate, field_info.name)
+        if isinstance(value, list) and all(isinstance(item, _PLAIN_TYPES) for item in value):
+            value = list(value)
+        elif not isinstance(value, _PLAIN_TYPES):
+            return ScoredSearchResult(**to_dict(candidate), confidence_score=confidence_score)
+        data[field_info.name] = value
+    return ScoredSearchResult(**data, confidence_score=confidence_score)
@@ -7,17 +7,20 @@ cache hit/miss logic, and result validation.
 
 from __future__ import annotations
 
+import asyncio
 import inspect
 import logging
 import re
+from collections.abc import Sequence
 
 from anivault.core.matching.cache_models import CachedSearchData
 from anivault.core.matching.models import NormalizedQuery
 from anivault.core.matching.services.cache_adapter import CacheAdapterProtocol
+from anivault.core.matching.services.local_index import LocalIndexHit, LocalTitleIndex
 from anivault.core.statistics import StatisticsCollector
 from anivault.shared.constants import MatchingCacheConfig, NormalizationConfig
 from anivault.shared.errors import ErrorCode, InfrastructureError
-from anivault.shared.models.api.tmdb import TMDBSearchResult
+from anivault.shared.models.api.tmdb import TMDBMediaDetails, TMDBSearchResult
 from anivault.shared.protocols.services import TMDBClientProtocol
 
 logger = logging.getLogger(__name__)
@@ -76,11 +79,13 @@ class TMDBSearchService:
     3. Pydantic-based result validation
     4. Automatic cache storage with TTL
     5. Graceful error handling
+    6. Optional offline title index consulted before the search API
 
     Attributes:
         tmdb_client: TMDB API client for search operations
         cache: Cache adapter for storing/retrieving search results
         statistics: Statistics collector for performance tracking
+        local_index: Optional offline title index (TMDB daily ID exports)
 
     Example:
         >>> from anivault.infrastructure.tmdb import TMDBClient
@@ -100,6 +105,7 @@ class TMDBSearchService:
         tmdb_client: TMDBClientProtocol,
         cache: CacheAdapterProtocol,
         statistics: StatisticsCollector,
+        local_index: LocalTitleIndex | None = None,
     ) -> None:
         """Initialize TMDB search service.
 
@@ -107,10 +113,12 @@ class TMDBSearchService:
             tmdb_client: TMDB API client for search operations
             cache: Cache adapter for storing/retrieving results
             statistics: Statistics collector for performance tracking
+            local_index: Optional offline title index consulted before the search API
         """
         self.tmdb_client = tmdb_client
         self.cache = cache
         self.statistics = statistics
+        self.local_index = local_index
 
     async def search(
         self,
@@ -121,7 +129,8 @@ class TMDBSearchService:
         This method orchestrates the cache-aware search workflow:
         1. Check cache for existing results
         2. On cache hit: validate and return cached results
-        3. On cache miss: call TMDB API, validate, cache, and return results
+        3. On cache miss: resolve strong offline index hits via details calls
+        4. Otherwise: call TMDB search API, validate, cache, and return results
 
         Args:
             normalized_query: Normalized query with title and optional year
@@ -163,6 +172,73 @@ class TMDBSearchService:
         )
         self.statistics.record_cache_miss("search")
 
+        return await self._fetch_and_store(title, cache_key)
+
+    async def search_many(
+        self,
+        normalized_queries: Sequence[NormalizedQuery],
+    ) -> list[list[TMDBSearchResult]]:
+        """Search TMDB for many queries, one lookup per distinct series.
+
+        Queries are grouped by their series cache key; all distinct keys are
+        looked up in one bulk cache read (``get_many``), then the misses are
+        fetched concurrently (TMDB requests still go through the client's rate
+        limits).
+
+        Args:
+            normalized_queries: Normalized queries
+
+        Returns:
+            Search results per input query, in input order (queries of the same
+            series share one result list)
+        """
+        keys = [_extract_series_title(query.title) for query in normalized_queries]
+        titles: dict[str, str] = {}
+        for key, query in zip(keys, normalized_queries):
+            titles.setdefault(key, query.title)
+
+        cached = self.cache.get_many(list(titles), MatchingCacheConfig.CACHE_TYPE_SEARCH)
+        results_by_key: dict[str, list[TMDBSearchResult]] = {key: cached_data.results for key, cached_data in cached.items()}
+        misses = [key for key in titles if key not in results_by_key]
+        for _ in results_by_key:
+            self.statistics.record_cache_hit("search")
+        for _ in misses:
+            self.statistics.record_cache_miss("search")
+
+        logger.debug(
+            "Batch search: %d queries, %d series, %d cache misses",
+            len(normalized_queries),
+            len(titles),
+            len(misses),
+        )
+
+        fetched = await asyncio.gather(*(self._fetch_and_store(titles[key], key) for key in misses))
+        results_by_key.update(zip(misses, fetched))
+
+        return [results_by_key[key] for key in keys]
+
+    async def _fetch_and_store(self, title: str, cache_key: str) -> list[TMDBSearchResult]:
+        """Resolve a cache miss via the offline index or the TMDB search API.
+
+        Args:
+            title: Query title sent to TMDB
+            cache_key: Series-based cache key
+
+        Returns:
+            List of TMDBSearchResult objects (empty list on error)
+        """
+        local_results, complete = await self._search_local_index(cache_key)
+        if local_results:
+            # Degraded hits (a details call failed) are served but not cached
+            if complete:
+                self._store_results(cache_key, local_results)
+            logger.debug(
+                "Resolved %d results for query from offline index: %s",
+                len(local_results),
+                title,
+            )
+            return local_results
+
         try:
             # Call TMDB API
             self.statistics.record_api_call("tmdb_search", success=True)
@@ -180,16 +256,7 @@ class TMDBSearchService:
             results = search_response.results if hasattr(search_response, "results") else search_response
 
             # Store in cache with series-based key for reuse across episodes
-            cached_data = CachedSearchData(
-                results=results,
-                language=self.cache.language,
-            )
-            self.cache.set(
-                key=cache_key,  # Use series-based key, not original title
-                data=cached_data,
-                cache_type=MatchingCacheConfig.CACHE_TYPE_SEARCH,
-                ttl_seconds=MatchingCacheConfig.SEARCH_CACHE_TTL,
-            )
+            self._store_results(cache_key, results)
 
             logger.debug(
                 "Found %d results for query: %s (cached with key: %s)",
@@ -236,3 +303,91 @@ class TMDBSearchService:
                 error="Exception",
             )
             return []
+
+    def _store_results(self, cache_key: str, results: list[TMDBSearchResult]) -> None:
+        """Cache search results under the series-based key."""
+        cached_data = CachedSearchData(
+            results=results,
+            language=self.cache.language,
+        )
+        self.cache.set(
+            key=cache_key,  # Use series-based key, not original title
+            data=cached_data,
+            cache_type=MatchingCacheConfig.CACHE_TYPE_SEARCH,
+            ttl_seconds=MatchingCacheConfig.SEARCH_CACHE_TTL,
+        )
+
+    async def _search_local_index(self, series_title: str) -> tuple[list[TMDBSearchResult], bool]:
+        """Resolve a query through the offline title index.
+
+        Strong index hits are turned into full search results with one details
+        call each (served from the client's details cache when already fetched).
+        If a details call fails, the hit is returned with the export fields only.
+
+        Args:
+            series_title: Series title (episode/season info removed)
+
+        Returns:
+            Search results for the index hits (empty if no index or no strong
+            hit), and whether every details call succeeded
+        """
+        if self.local_index is None or not series_title:
+            return [], True
+
+        hits = self.local_index.lookup(series_title)
+        if not hits:
+            return [], True
+
+        get_details = getattr(self.tmdb_client, "get_media_details", None)
+        if get_details is None or not inspect.iscoroutinefunction(get_details):
+            return [_hit_to_search_result(hit, None) for hit in hits], True
+
+        details = await asyncio.gather(
+            *(get_details(hit.id, hit.media_type) for hit in hits),
+            return_exceptions=True,
+        )
+        results = []
+        complete = True
+        for hit, detail in zip(hits, details):
+            success = isinstance(detail, TMDBMediaDetails)
+            complete = complete and success
+            self.statistics.record_api_call(
+                "tmdb_details",
+                success=success,
+                error=None if success else type(detail).__name__,
+            )
+            results.append(_hit_to_search_result(hit, detail if success else None))
+        return results, complete
+
+
+def _hit_to_search_result(hit: LocalIndexHit, details: TMDBMediaDetails | None) -> TMDBSearchResult:
+    """Build a search result from an offline index hit and its details (if fetched)."""
+    media_type = "movie" if hit.media_type == "movie" else "tv"
+    if details is None:
+        title_field = "original_title" if media_type == "movie" else "original_name"
+        display_field = "title" if media_type == "movie" else "name"
+        return TMDBSearchResult(
+            id=hit.id,
+            media_type=media_type,
+            popularity=hit.popularity,
+            **{title_field: hit.title, display_field: hit.title},
+        )
+
+    return TMDBSearchResult(
+        id=details.id,
+        media_type=media_type,
+        title=details.title,
+        name=details.name,
+        original_title=details.original_title,
+        original_name=details.original_name,
+        release_date=details.release_date,
+        first_air_date=details.first_air_date,
+        popularity=details.popularity,
+        vote_average=details.vote_average,
+        vote_count=details.vote_count,
+        overview=details.overview,
+        original_language=details.original_language,
+        poster_path=details.poster_path,
+        backdrop_path=details.backdrop_path,
+        genre_ids=[genre.id for genre in details.genres],
+    )
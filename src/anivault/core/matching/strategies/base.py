@@ -19,13 +19,21 @@ class FallbackStrategy(Protocol):
     All fallback strategies must implement this protocol to ensure
     consistent interface and enable strategy chaining.
 
+    Strategies may additionally define ``confidence_achieved(candidates) -> bool``;
+    FallbackStrategyService then uses it instead of the default "top candidate
+    reached HIGH confidence" check to decide whether the remaining strategies
+    can be skipped after this one.
+
     Attributes:
         priority: Execution priority (lower = earlier, default 100)
-                  Strategies are applied in ascending priority order
+                  Tie-breaker among strategies with the same cost
+        cost: Declared relative cost (lower = cheaper, default 100)
+              Strategies are applied in ascending cost order
 
     Example:
         >>> class MyStrategy:
         ...     priority = 50  # Runs before default strategies
+        ...     cost = 5  # Cheap, runs first
         ...
         ...     def apply(self, candidates, query):
         ...         # Apply custom matching logic
@@ -33,6 +41,7 @@ class FallbackStrategy(Protocol):
     """
 
     priority: int = 100
+    cost: int = 100
 
     def apply(
         self,
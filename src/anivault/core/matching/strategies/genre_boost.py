@@ -10,6 +10,7 @@ import logging
 from dataclasses import dataclass, replace
 
 from anivault.core.matching.models import NormalizedQuery
+from anivault.shared.constants import FallbackStrategy as FallbackStrategyConfig
 from anivault.shared.constants import GenreConfig
 from anivault.shared.models.api.tmdb import ScoredSearchResult
 
@@ -23,6 +24,7 @@ class GenreBoostStrategy:
     Attributes:
         boost: Confidence boost amount (default: from GenreConfig)
         priority: Execution priority (10 = early, before other strategies)
+        cost: Declared relative cost (genre id lookup only)
 
     Example:
         >>> strategy = GenreBoostStrategy()
@@ -32,6 +34,7 @@ class GenreBoostStrategy:
 
     boost: float = GenreConfig.ANIMATION_BOOST
     priority: int = 10
+    cost: int = FallbackStrategyConfig.COST_GENRE_BOOST
 
     def apply(
         self,
@@ -12,6 +12,7 @@ from dataclasses import dataclass, replace
 from rapidfuzz import fuzz
 
 from anivault.core.matching.models import NormalizedQuery
+from anivault.shared.constants import FallbackStrategy as FallbackStrategyConfig
 from anivault.shared.constants import GenreConfig
 from anivault.shared.models.api.tmdb import ScoredSearchResult
 
@@ -26,6 +27,7 @@ class PartialMatchStrategy:
         boost: Confidence boost amount (default: from GenreConfig)
         min_ratio: Minimum fuzzy match ratio to apply boost (default: 60)
         priority: Execution priority (20 = after genre boost)
+        cost: Declared relative cost (one rapidfuzz call per candidate)
 
     Example:
         >>> strategy = PartialMatchStrategy()
@@ -36,6 +38,7 @@ class PartialMatchStrategy:
     boost: float = GenreConfig.ANIMATION_BOOST  # Reuse same boost value
     min_ratio: int = 60  # Minimum partial ratio for boost
     priority: int = 20  # After genre boost
+    cost: int = FallbackStrategyConfig.COST_PARTIAL_MATCH
 
     def apply(
         self,
@@ -1,12 +1,13 @@
 """Core model exports."""
 
 from .file import FileOperation, OperationType, ScannedFile
-from .grouping import Group, GroupingEvidence
+from .grouping import Group, GroupingEvidence, GroupingState
 
 __all__ = [
     "FileOperation",
     "Group",
     "GroupingEvidence",
+    "GroupingState",
     "OperationType",
     "ScannedFile",
 ]
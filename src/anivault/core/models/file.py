@@ -7,12 +7,16 @@ the AniVault system for file operations and organization.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from anivault.domain.entities.parser import ParsingResult
 
+if TYPE_CHECKING:
+    from anivault.core.file_grouper.duplicate_resolver import DuplicateFeatures
+
 
 class OperationType(str, Enum):
     """Enumeration of supported file operations."""
@@ -46,12 +50,17 @@ class ScannedFile:
 
     This model combines file path information with parsed metadata,
     serving as the input for the FileOrganizer.
+
+    ``duplicate_features`` caches the features DuplicateResolver extracted
+    from the file; it is not an init argument and does not take part in
+    comparisons.
     """
 
     file_path: Path
     metadata: ParsingResult
     file_size: int = 0
     last_modified: float = 0.0
+    duplicate_features: DuplicateFeatures | None = field(default=None, init=False, repr=False, compare=False)
 
     @property
     def extension(self) -> str:
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from pathlib import Path
 
 from .file import ScannedFile
 
@@ -64,4 +65,29 @@ class Group:
         }
 
 
-__all__ = ["Group", "GroupingEvidence"]
+@dataclass(frozen=True)
+class GroupingState:
+    """Grouping results of a FileGrouper run, kept for incremental regrouping.
+
+    Engine groups are stored per hash key (the Hash matcher's normalized
+    title), the unit the grouping pipeline never groups across. A later run
+    re-groups only the keys whose files were added, removed, modified or
+    reordered and reuses the stored groups of all other keys.
+
+    Attributes:
+        files: Input files by path, in input order
+        file_keys: Hash key per path (None: no extractable title)
+        key_paths: Paths per hash key, in input order
+        key_groups: Engine groups per hash key
+        incremental: False if the engine configuration is not partitioned by
+            hash key (updates then regroup everything)
+    """
+
+    files: dict[Path, ScannedFile] = field(default_factory=dict)
+    file_keys: dict[Path, str | None] = field(default_factory=dict)
+    key_paths: dict[str | None, tuple[Path, ...]] = field(default_factory=dict)
+    key_groups: dict[str | None, tuple[Group, ...]] = field(default_factory=dict)
+    incremental: bool = True
+
+
+__all__ = ["Group", "GroupingEvidence", "GroupingState"]
@@ -10,15 +10,21 @@ The normalization process includes:
 2. Removal of superfluous metadata (resolution, codecs, release groups)
 3. Unicode and character normalization
 4. Basic language detection
+
+Results are memoized in a shared, bounded, thread-safe ``NormalizationCache``
+(see ``get_normalization_cache``): the same raw titles recur across every
+episode of a series and across matching, grouping and series-key building.
 """
 
 from __future__ import annotations
 
-import functools
 import logging
 import re
+import threading
 import unicodedata
-from typing import TYPE_CHECKING, Any
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, TypeVar
 
 if TYPE_CHECKING:
     from anivault.core.matching.models import NormalizedQuery
@@ -32,6 +38,141 @@ logger = logging.getLogger(__name__)
 _WHITESPACE_PATTERN = re.compile(r"[-\s]+")
 _WHITESPACE_NORMALIZE_PATTERN = re.compile(r"\s+")
 
+_T = TypeVar("_T")
+
+
+class NormalizationCache:
+    """Bounded, thread-safe LRU memo for pure title normalization functions.
+
+    Entries are keyed by (stage, input string); each stage is one pure
+    function of its input (e.g. ``"title"`` for ``normalize_title``). Values
+    are computed outside the lock, so a rare concurrent miss may compute the
+    same value twice but never blocks other threads on a regex.
+
+    Args:
+        maxsize: Maximum number of entries across all stages
+
+    Example:
+        >>> cache = NormalizationCache(maxsize=2)
+        >>> cache.get_or_compute("upper", "abc", str.upper)
+        'ABC'
+        >>> cache.get_or_compute("upper", "abc", str.upper)
+        'ABC'
+        >>> cache.get_stats()["stages"]["upper"]
+        {'hits': 1, 'misses': 1}
+    """
+
+    def __init__(self, maxsize: int = NormalizationConfig.CACHE_MAX_SIZE) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            maxsize: Maximum number of entries across all stages
+        """
+        self.maxsize = maxsize
+        self._entries: OrderedDict[tuple[str, str], Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self._stage_stats: dict[str, list[int]] = {}
+
+    def get_or_compute(self, stage: str, value: str, compute: Callable[[str], _T]) -> _T:
+        """Return the memoized result of ``compute(value)`` for a stage.
+
+        Args:
+            stage: Stage name (one pure function per stage)
+            value: Input string
+            compute: Function computing the stage result
+
+        Returns:
+            Cached or freshly computed result
+        """
+        key = (stage, value)
+        with self._lock:
+            stats = self._stage_stats.get(stage)
+            if stats is None:
+                stats = self._stage_stats[stage] = [0, 0]
+            try:
+                result: _T = self._entries[key]
+            except KeyError:
+                stats[1] += 1
+            else:
+                stats[0] += 1
+                self._entries.move_to_end(key)
+                return result
+
+        result = compute(value)
+        with self._lock:
+            self._entries[key] = result
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return result
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get size and hit statistics.
+
+        Returns:
+            Dictionary with size, maxsize, hits, misses, hit_ratio and
+            per-stage hits/misses
+        """
+        with self._lock:
+            stages = {stage: {"hits": hits, "misses": misses} for stage, (hits, misses) in self._stage_stats.items()}
+            size = len(self._entries)
+        hits = sum(stage["hits"] for stage in stages.values())
+        misses = sum(stage["misses"] for stage in stages.values())
+        return {
+            "size": size,
+            "maxsize": self.maxsize,
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": hits / (hits + misses) if hits + misses else 0.0,
+            "stages": stages,
+        }
+
+    def clear(self) -> None:
+        """Drop all entries and reset statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._stage_stats.clear()
+
+
+_normalization_cache = NormalizationCache()
+
+
+def get_normalization_cache() -> NormalizationCache:
+    """Get the process-wide normalization cache.
+
+    Returns:
+        Shared NormalizationCache instance
+    """
+    return _normalization_cache
+
+
+def normalize_title(title: str) -> str:
+    """Remove metadata and normalize characters of a title (memoized).
+
+    Args:
+        title: Raw title (e.g. anitopy ``anime_title``)
+
+    Returns:
+        Clean title suitable for TMDB search
+    """
+    return _normalization_cache.get_or_compute("title", title, _normalize_title_uncached)
+
+
+def detect_language(title: str) -> str:
+    """Detect the language of a normalized title (memoized).
+
+    Args:
+        title: Normalized title
+
+    Returns:
+        Language code: 'ja', 'ko', 'en' or 'unknown'
+    """
+    return _normalization_cache.get_or_compute("language", title, _detect_language)
+
+
+def _normalize_title_uncached(title: str) -> str:
+    """Uncached ``normalize_title``."""
+    return _normalize_characters(_remove_metadata(title))
+
 
 def normalize_query_from_anitopy(
     anitopy_result: dict[str, Any],
@@ -68,11 +209,8 @@ def normalize_query_from_anitopy(
             logger.warning("No title found in anitopy result")
             return None
 
-        # Remove superfluous metadata
-        cleaned_title = _remove_metadata(title)
-
-        # Normalize characters and Unicode
-        normalized_title = _normalize_characters(cleaned_title)
+        # Remove superfluous metadata and normalize characters/Unicode
+        normalized_title = normalize_title(title)
 
         # Extract year hint if available
         year_hint = anitopy_result.get("anime_year")
@@ -144,14 +282,11 @@ def normalize_query(filename: str) -> tuple[str, str]:
         # Extract title from anitopy results
         title = _extract_title_from_anitopy(parsed_data)
 
-        # Remove superfluous metadata
-        cleaned_title = _remove_metadata(title)
-
-        # Normalize characters and Unicode
-        normalized_title = _normalize_characters(cleaned_title)
+        # Remove superfluous metadata and normalize characters/Unicode
+        normalized_title = normalize_title(title)
 
         # Detect language
-        language = _detect_language(normalized_title)
+        language = detect_language(normalized_title)
 
         logger.debug(
             "Normalized query: '%s' -> '%s' (%s)",
@@ -170,9 +305,8 @@ def normalize_query(filename: str) -> tuple[str, str]:
             str(e),
         )
         # Fallback to basic processing of the filename
-        cleaned = _remove_metadata(filename)
-        normalized = _normalize_characters(cleaned)
-        language = _detect_language(normalized)
+        normalized = normalize_title(filename)
+        language = detect_language(normalized)
         return normalized, language
 
 
@@ -202,7 +336,6 @@ def _extract_title_from_anitopy(parsed_data: dict[str, Any]) -> str:
     return ""
 
 
-@functools.lru_cache(maxsize=4096)
 def _remove_metadata(title: str) -> str:
     """Remove superfluous metadata from a title string.
 
@@ -234,7 +367,6 @@ def _remove_metadata(title: str) -> str:
     return cleaned
 
 
-@functools.lru_cache(maxsize=4096)
 def _normalize_characters(title: str) -> str:
     """Normalize Unicode characters and standardize formatting.
 
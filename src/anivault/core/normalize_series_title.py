@@ -10,6 +10,8 @@ from __future__ import annotations
 
 import re
 
+from anivault.core.normalization import get_normalization_cache
+
 
 # End-only patterns (existing behavior): strip suffix from title end
 _END_PATTERNS: list[tuple[re.Pattern[str], str]] = [
@@ -49,7 +51,14 @@ def normalize_series_title(title: str) -> str:
         >>> normalize_series_title("명탐정 코난 극장판 02기 CD1")
         '명탐정 코난 극장판'
     """
-    if not title or not (raw := title.strip()):
+    if not title:
+        return title
+    return get_normalization_cache().get_or_compute("series", title, _normalize_series_title_uncached)
+
+
+def _normalize_series_title_uncached(title: str) -> str:
+    """Uncached ``normalize_series_title``."""
+    if not (raw := title.strip()):
         return title
 
     cleaned = raw
@@ -11,7 +11,7 @@ import logging
 import os
 from pathlib import Path
 
-from anivault.config import Settings, load_settings
+from anivault.config import Settings, get_settings_snapshot
 from anivault.config.models.folder_security_settings import FolderSettings
 from anivault.core.log_manager import OperationLogManager
 from anivault.core.models import FileOperation, OperationType, ScannedFile
@@ -46,7 +46,7 @@ class FileOrganizer:
             settings: Settings instance containing configuration. If None, loads default settings.
         """
         self.log_manager = log_manager
-        self.settings = settings or load_settings()
+        self.settings = settings or get_settings_snapshot().settings
         self.app_config = self.settings.app
 
         # Initialize service components
@@ -19,7 +19,7 @@ from concurrent.futures import (
 from concurrent.futures import TimeoutError as FutureTimeoutError
 from pathlib import Path
 
-from anivault.config import load_settings
+from anivault.config import get_settings_snapshot
 from anivault.core.pipeline.utils import BoundedQueue, ScanStatistics
 from anivault.shared.constants import ProcessingConfig
 from anivault.shared.constants.network import NetworkConfig
@@ -92,7 +92,7 @@ class ParallelDirectoryScanner(threading.Thread):
             Minimum directory count to use parallel scanning (default: 5)
         """
         try:
-            settings = load_settings()
+            settings = get_settings_snapshot().settings
             if hasattr(settings, "scan") and settings.scan is not None:
                 threshold = settings.scan.parallel_threshold
                 # Use threshold as-is, but ensure minimum of 5 for directory count
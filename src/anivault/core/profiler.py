@@ -504,10 +504,12 @@ class Profiler:
     ) -> dict[str, float]:
         """Calculate efficiency metrics."""
         api_calls = max(metrics.api_calls, 1)
+        fast_path_attempts = max(metrics.fast_path_attempts, 1)
 
         return {
             "cache_efficiency": metrics.cache_hit_ratio,
             "api_efficiency": ((api_calls - metrics.api_errors) / api_calls) * 100,
+            "fast_path_rate": (metrics.fast_path_matches / fast_path_attempts) * 100,
         }
 
     def _generate_memory_analysis(self, report: ProfilingReport) -> dict[str, Any]:
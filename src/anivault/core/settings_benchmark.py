@@ -0,0 +1,158 @@
+"""Benchmark of configuration I/O in grouping and organize plans.
+
+Builds a temporary library (one directory per series, empty video files named
+like real releases) next to a ``config/config.toml`` and runs
+``FileGrouper.group_files`` and ``FileOrganizer.generate_plan`` on it twice:
+
+- ``per_call``: every settings lookup re-reads and validates the TOML file
+  (the behaviour of calling ``load_settings()`` on hot paths)
+- ``snapshot``: lookups go through the process-wide settings snapshot, which
+  reads the file once and then only checks its mtime
+
+For each run the number of TOML reads (``Settings.from_toml_file`` calls) and
+the wall-clock time are reported.
+
+Requires TMDB_API_KEY in the environment (settings validation).
+
+Run:
+    python -m anivault.core.settings_benchmark [--files 2000] [--series 40]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import tempfile
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+from anivault.config import FolderSettings, Settings, loader
+from anivault.core.file_grouper.grouper import FileGrouper
+from anivault.core.log_manager import OperationLogManager
+from anivault.core.models import ScannedFile
+from anivault.core.normalization_benchmark import generate_filename_corpus
+from anivault.core.organizer.main import FileOrganizer
+from anivault.domain.entities.parser import ParsingResult
+
+
+def _build_library(root: Path, files: int, series: int, seed: int) -> list[ScannedFile]:
+    """Create empty video files (one directory per series) and their ScannedFiles."""
+    scanned: list[ScannedFile] = []
+    series_dirs: dict[str, Path] = {}
+    for index, (filename, title) in enumerate(generate_filename_corpus(files, series, seed)):
+        series_dir = series_dirs.setdefault(title, root / "library" / f"series_{len(series_dirs):04d}")
+        series_dir.mkdir(parents=True, exist_ok=True)
+        file_path = series_dir / f"{index:06d} {filename}"
+        file_path.touch()
+        scanned.append(
+            ScannedFile(
+                file_path=file_path,
+                metadata=ParsingResult(title=title, episode=index % 26 + 1, confidence=0.9),
+            ),
+        )
+    return scanned
+
+
+@contextmanager
+def _count_toml_reads() -> Iterator[list[int]]:
+    """Count ``Settings.from_toml_file`` calls inside the block."""
+    original = Settings.__dict__["from_toml_file"]
+    counter = [0]
+
+    def counting(cls: type[Settings], file_path: str | Path) -> Settings:
+        counter[0] += 1
+        return original.__func__(cls, file_path)  # type: ignore[no-any-return]
+
+    Settings.from_toml_file = classmethod(counting)  # type: ignore[method-assign,assignment]
+    try:
+        yield counter
+    finally:
+        Settings.from_toml_file = original  # type: ignore[method-assign]
+
+
+@contextmanager
+def _per_call_settings() -> Iterator[None]:
+    """Make every snapshot lookup load settings from disk (pre-snapshot behaviour)."""
+    manager = loader._snapshot_manager  # pylint: disable=protected-access
+
+    def load() -> loader.SettingsSnapshot:
+        return loader.SettingsSnapshot(settings=loader.load_settings(), config_path=None, mtime_ns=None)
+
+    manager.get = load  # type: ignore[method-assign]
+    try:
+        yield
+    finally:
+        del manager.get
+
+
+def _measure(func: Callable[[], Any]) -> dict[str, float]:
+    """Run func once; return TOML reads and seconds."""
+    loader.invalidate_settings_snapshot()
+    with _count_toml_reads() as reads:
+        start = time.perf_counter()
+        func()
+        seconds = time.perf_counter() - start
+    return {"toml_reads": reads[0], "seconds": seconds}
+
+
+def run_settings_benchmark(files: int = 2000, series: int = 40, seed: int = 42) -> dict[str, Any]:
+    """Measure config reads of grouping and organize-plan runs.
+
+    Args:
+        files: Number of video files
+        series: Number of distinct series
+        seed: Random seed
+
+    Returns:
+        TOML reads and seconds per workload for ``per_call`` and ``snapshot``
+    """
+    previous_cwd = Path.cwd()
+    with tempfile.TemporaryDirectory(prefix="anivault_settings_bench_") as tmp:
+        root = Path(tmp)
+        os.chdir(root)
+        try:
+            settings = Settings(folders=FolderSettings(target_folder=str(root / "organized")))
+            settings.to_toml_file(loader.DEFAULT_CONFIG_PATH)
+            scanned = _build_library(root, files, series, seed)
+            log_manager = OperationLogManager(root)
+
+            workloads: dict[str, Callable[[], Any]] = {
+                "grouping": lambda: FileGrouper().group_files(scanned),
+                "organize_plan": lambda: FileOrganizer(log_manager).generate_plan(scanned),
+            }
+
+            results: dict[str, Any] = {"files": files, "series": series}
+            for name, workload in workloads.items():
+                with _per_call_settings():
+                    per_call = _measure(workload)
+                snapshot = _measure(workload)
+                results[name] = {
+                    "per_call": per_call,
+                    "snapshot": snapshot,
+                    "speedup": per_call["seconds"] / snapshot["seconds"] if snapshot["seconds"] else 0.0,
+                }
+        finally:
+            os.chdir(previous_cwd)
+            loader.invalidate_settings_snapshot()
+    return results
+
+
+def main() -> None:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark configuration reads in grouping and organize plans")
+    parser.add_argument("--files", type=int, default=2000)
+    parser.add_argument("--series", type=int, default=40)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    print(json.dumps(run_settings_benchmark(args.files, args.series, args.seed), indent=2))
+
+
+__all__ = ["run_settings_benchmark"]
+
+
+if __name__ == "__main__":
+    main()
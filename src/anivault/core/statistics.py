@@ -3,22 +3,154 @@ Statistics Collection and Performance Benchmarking Module
 
 This module provides comprehensive statistics collection and performance
 benchmarking capabilities for the AniVault matching system.
+
+Memory use is constant over a session: durations are folded into streaming
+aggregates (count/sum/min/max plus log-bucketed percentiles) instead of being
+kept as per-call lists, per-file match records are limited to the most recent
+``Performance.MAX_FILE_METRICS`` files, and operation timers are context-local
+so concurrent coroutines/threads timing the same operation do not see each
+other's starts.
 """
 
 from __future__ import annotations
 
 import logging
 import math
+import threading
 import time
-from collections import defaultdict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any
 
-from anivault.shared.constants import ConfidenceThresholds
+from anivault.shared.constants import ConfidenceThresholds, Performance
 
 logger = logging.getLogger(__name__)
 
+# Open start_timing() calls as (collector id, operation, start). Each asyncio
+# task / thread works on its own copy, so concurrent find_match calls can't
+# pop each other's start times.
+_active_timings: ContextVar[tuple[tuple[int, str, float], ...]] = ContextVar("anivault_active_timings", default=())
+
+
+class StreamingHistogram:
+    """Fixed-memory aggregate of non-negative samples (durations in seconds).
+
+    Count, sum, min and max are exact. Percentiles come from logarithmic
+    buckets (HDR-style): every bucket spans a constant ratio, so estimates are
+    within ``relative_error`` of the true value and the number of buckets is
+    bounded by ``log(max_value / min_value)`` regardless of sample count.
+
+    Args:
+        min_value: Samples at or below this share the first bucket
+        max_value: Samples at or above this share the last bucket
+        relative_error: Percentile accuracy (e.g. 0.01 = 1%)
+
+    Example:
+        >>> hist = StreamingHistogram()
+        >>> for ms in range(1, 101):
+        ...     hist.record(ms / 1000)
+        >>> round(hist.percentile(50), 3)
+        0.05
+    """
+
+    __slots__ = ("_buckets", "_gamma_log", "_lock", "_max_bucket", "_min_value", "count", "max", "min", "total")
+
+    def __init__(
+        self,
+        min_value: float = Performance.HISTOGRAM_MIN_SECONDS,
+        max_value: float = Performance.HISTOGRAM_MAX_SECONDS,
+        relative_error: float = Performance.HISTOGRAM_RELATIVE_ERROR,
+    ) -> None:
+        """Initialize an empty histogram.
+
+        Args:
+            min_value: Samples at or below this share the first bucket
+            max_value: Samples at or above this share the last bucket
+            relative_error: Percentile accuracy (e.g. 0.01 = 1%)
+        """
+        self._min_value = min_value
+        self._gamma_log = math.log((1 + relative_error) / (1 - relative_error))
+        self._max_bucket = math.ceil(math.log(max_value / min_value) / self._gamma_log) + 1
+        self._buckets: dict[int, int] = {}
+        self._lock = threading.Lock()
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def _bucket(self, value: float) -> int:
+        """Bucket index: 0 for <= min_value, then one bucket per gamma ratio."""
+        if value <= self._min_value:
+            return 0
+        return min(self._max_bucket, int(math.log(value / self._min_value) / self._gamma_log) + 1)
+
+    def _bucket_value(self, index: int) -> float:
+        """Representative value of a bucket (within relative_error of any member)."""
+        if index == 0:
+            return self._min_value
+        gamma = math.exp(self._gamma_log)
+        return self._min_value * gamma ** (index - 1) * 2 * gamma / (gamma + 1)
+
+    def record(self, value: float) -> None:
+        """Add a sample.
+
+        Args:
+            value: Sample value (negative values are treated as 0)
+        """
+        value = max(0.0, value)
+        bucket = self._bucket(value)
+        with self._lock:
+            self.count += 1
+            self.total += value
+            self.min = min(self.min, value)
+            self.max = max(self.max, value)
+            self._buckets[bucket] = self._buckets.get(bucket, 0) + 1
+
+    @property
+    def mean(self) -> float:
+        """Mean of all samples (0.0 if empty)."""
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, percent: float) -> float:
+        """Estimate a percentile.
+
+        Args:
+            percent: Percentile in [0, 100]
+
+        Returns:
+            Estimated value (0.0 if empty), clamped to the observed min/max
+        """
+        with self._lock:
+            if not self.count:
+                return 0.0
+            rank = percent / 100 * (self.count - 1)
+            seen = 0
+            for index in sorted(self._buckets):
+                seen += self._buckets[index]
+                if seen > rank:
+                    return min(self.max, max(self.min, self._bucket_value(index)))
+            return self.max
+
+    def summary(self) -> dict[str, float]:
+        """Get count/total/mean/min/max and p50/p95/p99.
+
+        Returns:
+            JSON-serializable summary (values in the recorded unit)
+        """
+        return {
+            "count": self.count,
+            "total": self.total,
+            "mean": self.mean,
+            "min": self.min if self.count else 0.0,
+            "max": self.max,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+        }
+
 
 @dataclass
 class PerformanceMetrics:
@@ -42,6 +174,9 @@ class PerformanceMetrics:
     high_confidence_matches: int = 0
     medium_confidence_matches: int = 0
     low_confidence_matches: int = 0
+    fast_path_attempts: int = 0
+    fast_path_matches: int = 0
+    fallback_matches: int = 0
 
     # API metrics
     api_calls: int = 0
@@ -85,47 +220,90 @@ class StatisticsCollector:
         self.metrics = PerformanceMetrics()
         self.benchmark_results: list[BenchmarkResult] = []
         self.session_start = datetime.now(timezone.utc)
-        self.timing_stack: list[float] = []
+        # Last duration per operation
         self.timers: dict[str, float] = {}
+        # Streaming duration aggregates per operation
+        self.timing_stats: dict[str, StreamingHistogram] = {}
 
         # Detailed tracking
-        self.file_metrics: dict[str, dict[str, Any]] = defaultdict(dict)
-        self.api_call_times: list[float] = []
-        self.cache_operations: list[dict[str, Any]] = []
+        # Most recent per-file records (oldest evicted); totals live in metrics
+        self.file_metrics: dict[str, dict[str, Any]] = {}
+        self.match_duration_stats = StreamingHistogram()
+        self.api_call_stats = StreamingHistogram()
+        self.cache_operation_counts: dict[str, dict[str, int]] = {}
+        self.cache_operation_stats: dict[str, StreamingHistogram] = {}
 
         logger.info("StatisticsCollector initialized")
 
     def start_timing(self, operation: str) -> None:
         """Start timing an operation.
 
+        Timers are context-local: an asyncio task or thread only ever ends
+        its own timers, so concurrent calls for the same operation are timed
+        correctly.
+
         Args:
             operation: Name of the operation being timed
         """
-        self.timing_stack.append(time.time())
+        active = _active_timings.get()
+        if len(active) >= Performance.MAX_ACTIVE_TIMINGS:
+            # Drop the oldest start that was never ended
+            active = active[1:]
+        _active_timings.set((*active, (id(self), operation, time.perf_counter())))
         logger.debug("Started timing operation: %s", operation)
 
     def end_timing(self, operation: str) -> float:
         """End timing an operation and return duration.
 
+        Ends the most recent timer for ``operation`` started in the current
+        context.
+
         Args:
             operation: Name of the operation being timed
 
         Returns:
             Duration in seconds
         """
-        if not self.timing_stack:
+        active = _active_timings.get()
+        owner = id(self)
+        for position in range(len(active) - 1, -1, -1):
+            timer_owner, timer_operation, start_time = active[position]
+            if timer_owner == owner and timer_operation == operation:
+                break
+        else:
             logger.warning("No timing started for operation: %s", operation)
             return 0.0
 
-        start_time = self.timing_stack.pop()
-        duration = time.time() - start_time
+        duration = time.perf_counter() - start_time
+        _active_timings.set(active[:position] + active[position + 1 :])
 
-        # Store the duration in timers dictionary
         self.timers[operation] = duration
+        self._histogram(self.timing_stats, operation).record(duration)
 
         logger.debug("Ended timing operation: %s, duration: %.3fs", operation, duration)
         return duration
 
+    @contextmanager
+    def timing(self, operation: str) -> Iterator[None]:
+        """Time a block (``start_timing``/``end_timing`` around it).
+
+        Args:
+            operation: Name of the operation being timed
+        """
+        self.start_timing(operation)
+        try:
+            yield
+        finally:
+            self.end_timing(operation)
+
+    @staticmethod
+    def _histogram(table: dict[str, StreamingHistogram], name: str) -> StreamingHistogram:
+        """Get or create the histogram for a name (setdefault is atomic)."""
+        histogram = table.get(name)
+        if histogram is None:
+            histogram = table.setdefault(name, StreamingHistogram())
+        return histogram
+
     def record_matching_operation(  # pylint: disable=too-many-arguments,too-many-positional-arguments
         self,
         file_path: str,
@@ -157,8 +335,13 @@ class StatisticsCollector:
                     self.metrics.low_confidence_matches += 1
         else:
             self.metrics.failed_matches += 1
+        if used_fallback:
+            self.metrics.fallback_matches += 1
+        if duration is not None:
+            self.match_duration_stats.record(duration)
 
-        # Store detailed metrics for this file
+        # Keep detailed metrics for the most recent files only
+        self.file_metrics.pop(file_path, None)
         self.file_metrics[file_path] = {
             "success": success,
             "confidence": confidence,
@@ -166,6 +349,8 @@ class StatisticsCollector:
             "used_fallback": used_fallback,
             "timestamp": datetime.now(timezone.utc).isoformat(),
         }
+        while len(self.file_metrics) > Performance.MAX_FILE_METRICS:
+            self.file_metrics.pop(next(iter(self.file_metrics)), None)
 
         logger.debug(
             "Recorded matching operation for %s: success=%s, confidence=%s",
@@ -195,18 +380,14 @@ class StatisticsCollector:
             else:
                 self.metrics.cache_misses += 1
 
-        # Store detailed cache operation
-        self.cache_operations.append(
-            {
-                "operation": operation,
-                "hit": hit,
-                "duration": duration,
-                "key": key,
-                "timestamp": datetime.now(timezone.utc).isoformat(),
-            },
-        )
+        counts = self.cache_operation_counts.setdefault(operation, {"count": 0, "hits": 0})
+        counts["count"] += 1
+        if hit:
+            counts["hits"] += 1
+        if duration is not None:
+            self._histogram(self.cache_operation_stats, operation).record(duration)
 
-        logger.debug("Recorded cache operation: %s, hit=%s", operation, hit)
+        logger.debug("Recorded cache operation: %s, hit=%s, key=%s", operation, hit, key)
 
     def record_api_call(
         self,
@@ -229,7 +410,7 @@ class StatisticsCollector:
             self.metrics.api_errors += 1
 
         if duration is not None:
-            self.api_call_times.append(duration)
+            self.api_call_stats.record(duration)
             self.metrics.api_time += duration
 
         logger.debug(
@@ -312,6 +493,16 @@ class StatisticsCollector:
             used_fallback,
         )
 
+    def record_fast_path(self, hit: bool) -> None:
+        """Record an exact-match fast path lookup.
+
+        Args:
+            hit: Whether the query was resolved by the fast path
+        """
+        self.metrics.fast_path_attempts += 1
+        if hit:
+            self.metrics.fast_path_matches += 1
+
     def record_match_failure(self) -> None:
         """Record a failed match."""
         self.metrics.failed_matches += 1
@@ -337,6 +528,16 @@ class StatisticsCollector:
             return 0.0
         return (self.metrics.cache_hits / total_requests) * 100.0
 
+    def get_fast_path_rate(self) -> float:
+        """Get the share of lookups resolved by the exact-match fast path.
+
+        Returns:
+            Fast-path rate as a percentage (0.0 to 100.0)
+        """
+        if self.metrics.fast_path_attempts == 0:
+            return 0.0
+        return (self.metrics.fast_path_matches / self.metrics.fast_path_attempts) * 100.0
+
     def start_benchmark(self, test_name: str) -> None:
         """Start a benchmark test.
 
@@ -406,6 +607,10 @@ class StatisticsCollector:
                 "high_confidence_matches": self.metrics.high_confidence_matches,
                 "medium_confidence_matches": self.metrics.medium_confidence_matches,
                 "low_confidence_matches": self.metrics.low_confidence_matches,
+                "fast_path_attempts": self.metrics.fast_path_attempts,
+                "fast_path_matches": self.metrics.fast_path_matches,
+                "fast_path_rate": self.get_fast_path_rate(),
+                "fallback_matches": self.metrics.fallback_matches,
                 "cache_hits": self.metrics.cache_hits,
                 "cache_misses": self.metrics.cache_misses,
                 "cache_hit_ratio": self.metrics.cache_hit_ratio,
@@ -421,21 +626,31 @@ class StatisticsCollector:
             },
             "detailed_metrics": {
                 "file_metrics_count": len(self.file_metrics),
-                "cache_operations_count": len(self.cache_operations),
-                "api_call_times_count": len(self.api_call_times),
+                "cache_operations_count": sum(counts["count"] for counts in self.cache_operation_counts.values()),
+                "api_call_times_count": self.api_call_stats.count,
             },
         }
 
+    def get_timing_stats(self) -> dict[str, dict[str, float]]:
+        """Get streaming duration aggregates per timed operation.
+
+        Returns:
+            Mapping of operation name to count/total/mean/min/max/p50/p95/p99 (seconds)
+        """
+        return {operation: histogram.summary() for operation, histogram in list(self.timing_stats.items())}
+
     def reset(self) -> None:
         """Reset all collected statistics."""
         self.metrics = PerformanceMetrics()
         self.benchmark_results.clear()
         self.session_start = datetime.now(timezone.utc)
-        self.timing_stack.clear()
         self.timers.clear()
+        self.timing_stats.clear()
         self.file_metrics.clear()
-        self.api_call_times.clear()
-        self.cache_operations.clear()
+        self.match_duration_stats = StreamingHistogram()
+        self.api_call_stats = StreamingHistogram()
+        self.cache_operation_counts.clear()
+        self.cache_operation_stats.clear()
 
         # Reset memory tracking (lazy initialization)
         if hasattr(self, "_memory_samples"):  # pylint: disable=attribute-defined-outside-init
@@ -453,9 +668,17 @@ class StatisticsCollector:
         return {
             "summary": self.get_summary(),
             "timers": self.timers,
+            "timing_stats": self.get_timing_stats(),
             "file_metrics": dict(self.file_metrics),
-            "cache_operations": self.cache_operations,
-            "api_call_times": self.api_call_times,
+            "match_durations": self.match_duration_stats.summary(),
+            "cache_operations": {
+                operation: {
+                    **counts,
+                    "duration": self.cache_operation_stats[operation].summary() if operation in self.cache_operation_stats else None,
+                }
+                for operation, counts in self.cache_operation_counts.items()
+            },
+            "api_call_times": self.api_call_stats.summary(),
             "benchmark_results": [
                 {
                     "test_name": result.test_name,
@@ -11,7 +11,7 @@ import re
 from pathlib import Path
 from typing import Any
 
-from anivault.config import load_settings
+from anivault.config import get_settings_snapshot
 from anivault.core.models import ScannedFile
 from anivault.shared.constants import SubtitleMatchingStrategy
 from anivault.core.subtitle_hash import HASH_CHUNK_SIZE, calculate_file_hash
@@ -71,7 +71,7 @@ class SubtitleMatcher:
             Strategy name: SubtitleMatchingStrategy.INDEXED/FALLBACK/LEGACY
         """
         try:
-            settings = load_settings()
+            settings = get_settings_snapshot().settings
             if hasattr(settings, "grouping") and settings.grouping is not None:
                 return settings.grouping.subtitle_matching_strategy
         except (ImportError, AttributeError) as e:
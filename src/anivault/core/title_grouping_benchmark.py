@@ -0,0 +1,165 @@
+"""Benchmark of the title matchers on large synthetic libraries.
+
+Generates a filename corpus (see ``normalization_benchmark``) whose parsed
+titles carry realistic noise (season suffixes, punctuation, truncation,
+casing) and times ``TitleSimilarityMatcher`` (pairwise rapidfuzz) against
+``TfidfTitleMatcher`` (sparse TF-IDF nearest neighbours) at several library
+sizes. The rapidfuzz matcher is skipped above ``--rapidfuzz-max`` files.
+
+These matcher timings run each matcher over the whole library. In the
+configurations users can select (``grouping.title_matcher_backend``),
+GroupingEngine only runs the title matcher inside each hash group, so every
+size is also grouped end to end with ``FileGrouper`` once per backend
+(``end_to_end``).
+
+Run:
+    python -m anivault.core.title_grouping_benchmark [--sizes 10000,100000,500000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+from pathlib import Path
+from typing import Any
+
+from anivault.core.file_grouper.grouper import FileGrouper, TitleExtractor, TitleQualityEvaluator
+from anivault.core.file_grouper.grouping_engine import GroupingEngine
+from anivault.core.file_grouper.matchers.base import BaseMatcher
+from anivault.core.file_grouper.matchers.hash_matcher import HashSimilarityMatcher
+from anivault.core.file_grouper.matchers.season_matcher import SeasonEpisodeMatcher
+from anivault.core.file_grouper.matchers.tfidf_title_matcher import TfidfTitleMatcher
+from anivault.core.file_grouper.matchers.title_matcher import TitleSimilarityMatcher
+from anivault.core.file_grouper.matchers.title_signature_store import TitleSignatureStore
+from anivault.core.models import ScannedFile
+from anivault.core.normalization_benchmark import generate_filename_corpus
+from anivault.domain.entities.parser import ParsingResult
+
+_SUFFIXES = ("S2", "Season 2", "2nd Season", "OVA", "Movie", "Final Season")
+
+
+def _noisy_title(title: str, rng: random.Random) -> str:
+    """Title variant as parsers report it across releases."""
+    roll = rng.random()
+    if roll < 0.4:
+        return title
+    if roll < 0.6:
+        return f"{title} {rng.choice(_SUFFIXES)}"
+    if roll < 0.75:
+        return title.replace(" ", rng.choice(("-", "_", ".")))
+    if roll < 0.9:
+        return title[:-1] if len(title) > 4 else title
+    return title.upper()
+
+
+def generate_scanned_files(files: int, series: int, seed: int = 42) -> list[ScannedFile]:
+    """ScannedFiles with noisy parsed titles.
+
+    Args:
+        files: Number of files
+        series: Number of distinct series
+        seed: Random seed
+
+    Returns:
+        List of ScannedFile (paths are not created on disk)
+    """
+    rng = random.Random(seed)
+    return [
+        ScannedFile(
+            file_path=Path("/library") / f"{index:07d} {filename}",
+            metadata=ParsingResult(title=_noisy_title(title, rng), episode=index % 26 + 1),
+        )
+        for index, (filename, title) in enumerate(generate_filename_corpus(files, series, seed))
+    ]
+
+
+def _time_matcher(matcher: Any, files: list[ScannedFile]) -> dict[str, Any]:
+    """Run matcher.match once; return seconds and group count."""
+    start = time.perf_counter()
+    groups = matcher.match(files)
+    return {"seconds": time.perf_counter() - start, "groups": len(groups)}
+
+
+def _time_file_grouper(backend: str, files: list[ScannedFile]) -> dict[str, Any]:
+    """Group files end to end with FileGrouper using the given title matcher backend.
+
+    The engine mirrors FileGrouper's default (title, hash, season matchers);
+    the rapidfuzz backend gets an in-memory signature store so results do not
+    depend on a signature file from earlier runs.
+    """
+    extractor = TitleExtractor()
+    evaluator = TitleQualityEvaluator()
+    title_matcher: BaseMatcher
+    if backend == "tfidf":
+        title_matcher = TfidfTitleMatcher(extractor, evaluator)
+    else:
+        title_matcher = TitleSimilarityMatcher(extractor, evaluator, signature_store=TitleSignatureStore())
+    engine = GroupingEngine(matchers=[title_matcher, HashSimilarityMatcher(title_extractor=extractor), SeasonEpisodeMatcher()])
+    grouper = FileGrouper(engine=engine)
+    start = time.perf_counter()
+    groups = grouper.group_files(files)
+    return {"seconds": time.perf_counter() - start, "groups": len(groups)}
+
+
+def run_title_grouping_benchmark(
+    sizes: tuple[int, ...] = (10_000, 100_000, 500_000),
+    files_per_series: int = 25,
+    rapidfuzz_max: int = 100_000,
+    seed: int = 42,
+) -> list[dict[str, Any]]:
+    """Time both title matchers at each library size.
+
+    Args:
+        sizes: Library sizes (number of files)
+        files_per_series: Average files per series (series = size / this)
+        rapidfuzz_max: Largest size the rapidfuzz matcher is run on
+        seed: Random seed
+
+    Returns:
+        One result per size with timings and group counts per matcher, and
+        per backend for end-to-end FileGrouper runs (``end_to_end``)
+    """
+    extractor = TitleExtractor()
+    evaluator = TitleQualityEvaluator()
+    results = []
+    for size in sizes:
+        files = generate_scanned_files(size, max(1, size // files_per_series), seed)
+        result: dict[str, Any] = {"files": size, "unique_titles": len({f.metadata.title for f in files})}
+        result["tfidf"] = _time_matcher(TfidfTitleMatcher(extractor, evaluator), files)
+        if size <= rapidfuzz_max:
+            rapidfuzz_matcher = TitleSimilarityMatcher(extractor, evaluator)
+            # Compare raw grouping: no recursive splitting of large groups
+            rapidfuzz_matcher._get_max_title_match_group_size = lambda size=size: size  # type: ignore[method-assign,misc]  # pylint: disable=protected-access
+            result["rapidfuzz"] = _time_matcher(rapidfuzz_matcher, files)
+            result["speedup"] = result["rapidfuzz"]["seconds"] / result["tfidf"]["seconds"] if result["tfidf"]["seconds"] else 0.0
+        else:
+            result["rapidfuzz"] = "skipped"
+        result["end_to_end"] = {backend: _time_file_grouper(backend, files) for backend in ("rapidfuzz", "tfidf")}
+        results.append(result)
+    return results
+
+
+def main() -> None:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark rapidfuzz vs TF-IDF title matchers")
+    parser.add_argument("--sizes", default="10000,100000,500000", help="Comma-separated library sizes")
+    parser.add_argument("--files-per-series", type=int, default=25)
+    parser.add_argument("--rapidfuzz-max", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    sizes = tuple(int(size) for size in args.sizes.split(","))
+    print(
+        json.dumps(
+            run_title_grouping_benchmark(sizes, args.files_per_series, args.rapidfuzz_max, args.seed),
+            indent=2,
+        ),
+    )
+
+
+__all__ = ["generate_scanned_files", "run_title_grouping_benchmark"]
+
+
+if __name__ == "__main__":
+    main()
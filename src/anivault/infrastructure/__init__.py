@@ -5,15 +5,20 @@ Service implementations: tmdb, cache, enricher, rate limiting.
 
 from anivault.infrastructure.cache import SQLiteCacheDB
 from anivault.infrastructure.enricher import MetadataEnricher
+from anivault.infrastructure.match_state_store import FileMatchState, MatchStateStore
 from anivault.infrastructure.rate_limiter import TokenBucketRateLimiter
+from anivault.infrastructure.request_lanes import RequestLaneScheduler
 from anivault.infrastructure.semaphore_manager import SemaphoreManager
 from anivault.infrastructure.state_machine import RateLimitState, RateLimitStateMachine
 from anivault.infrastructure.tmdb import TMDBClient
 
 __all__ = [
+    "FileMatchState",
+    "MatchStateStore",
     "MetadataEnricher",
     "RateLimitState",
     "RateLimitStateMachine",
+    "RequestLaneScheduler",
     "SQLiteCacheDB",
     "SemaphoreManager",
     "TMDBClient",
@@ -67,5 +67,9 @@ class InsertOperations(BaseOperation):
         Returns:
             Default TTL in seconds
         """
-        ttl_map = {Cache.TYPE_SEARCH: MatchingCacheConfig.SEARCH_CACHE_TTL, Cache.TYPE_DETAILS: MatchingCacheConfig.DETAILS_CACHE_TTL}
+        ttl_map = {
+            Cache.TYPE_SEARCH: MatchingCacheConfig.SEARCH_CACHE_TTL,
+            Cache.TYPE_DETAILS: MatchingCacheConfig.DETAILS_CACHE_TTL,
+            Cache.TYPE_MATCH: MatchingCacheConfig.MATCH_DECISION_TTL,
+        }
         return ttl_map.get(cache_type, MatchingCacheConfig.SEARCH_CACHE_TTL)
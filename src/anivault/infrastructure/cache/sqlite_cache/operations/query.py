@@ -16,6 +16,13 @@ from anivault.shared.constants import BaseCacheConfig, Cache
 
 logger = logging.getLogger(__name__)
 
+# Cache types stored as plain dicts (not validated through CacheEntry)
+_RAW_CACHE_TYPES = frozenset({Cache.TYPE_PARSER, Cache.TYPE_MATCH})
+# Keys per SELECT of get_many (below SQLite's bound-parameter limit)
+_GET_MANY_CHUNK_SIZE = 500
+# Columns of a cache row, in the order _response_from_row unpacks them
+_ROW_COLUMNS = "cache_key, key_hash, cache_type, response_data, created_at, expires_at, hit_count, last_accessed_at, response_size"
+
 
 def _parse_timestamp_with_tz(timestamp_str: str | None) -> datetime | None:
     """Parse ISO timestamp string and ensure timezone-aware.
@@ -157,6 +164,61 @@ class QueryOperations(BaseOperation):
             self.statistics.record_cache_miss(cache_type)
             return None
 
+        response_data = self._response_from_row(key, key_hash, cache_type, row)
+        if response_data is None:
+            return None
+        self._update_access_stats(key_hash, cache_type)
+        self.statistics.record_cache_hit(cache_type)
+        logger.debug("Cache hit: key=%s (hash=%s...), type=%s", key[:50], key_hash[:8], cache_type)
+        return response_data
+
+    def get_many(self, keys: list[str], cache_type: str = Cache.TYPE_SEARCH) -> dict[str, dict[str, Any]]:
+        """Retrieve many entries of one cache type with one query per chunk of keys.
+
+        Args:
+            keys: Cache key identifiers
+            cache_type: Type of cache ('search' or 'details')
+
+        Returns:
+            Cached data by key, for keys found and not expired (misses are omitted)
+        """
+        self._validate_connection()
+        key_by_hash = {self._generate_cache_key_hash(key)[1]: key for key in dict.fromkeys(keys)}
+        hashes = list(key_by_hash)
+
+        found: dict[str, dict[str, Any]] = {}
+        hit_hashes: list[str] = []
+        row_count = 0
+        for offset in range(0, len(hashes), _GET_MANY_CHUNK_SIZE):
+            chunk = hashes[offset : offset + _GET_MANY_CHUNK_SIZE]
+            placeholders = ",".join("?" * len(chunk))
+            # Only "?" placeholders are interpolated; values are bound parameters
+            sql = f"SELECT {_ROW_COLUMNS} FROM tmdb_cache WHERE cache_type = ? AND key_hash IN ({placeholders})"  # noqa: S608
+            cursor = self.conn.execute(sql, (cache_type, *chunk))
+            rows = cursor.fetchall()
+            cursor.close()
+            row_count += len(rows)
+            for row in rows:
+                key_hash = row[1]
+                key = key_by_hash[key_hash]
+                response_data = self._response_from_row(key, key_hash, cache_type, row)
+                if response_data is not None:
+                    found[key] = response_data
+                    hit_hashes.append(key_hash)
+
+        # Unreadable/expired rows already recorded their miss in _response_from_row
+        for _ in range(len(key_by_hash) - row_count):
+            self.statistics.record_cache_miss(cache_type)
+        if hit_hashes:
+            update_sql = "UPDATE tmdb_cache SET hit_count = hit_count + 1, last_accessed_at = CURRENT_TIMESTAMP WHERE key_hash = ? AND cache_type = ?"
+            self.conn.executemany(update_sql, [(key_hash, cache_type) for key_hash in hit_hashes])
+            for _ in hit_hashes:
+                self.statistics.record_cache_hit(cache_type)
+        logger.debug("Cache get_many: %d keys, %d hits, type=%s", len(key_by_hash), len(hit_hashes), cache_type)
+        return found
+
+    def _response_from_row(self, key: str, key_hash: str, cache_type: str, row: tuple[Any, ...]) -> dict[str, Any] | None:
+        """Response data of a fetched row, or None (miss recorded) if unreadable or expired."""
         (
             cache_key_db,
             key_hash_db,
@@ -173,15 +235,12 @@ class QueryOperations(BaseOperation):
             self.statistics.record_cache_miss(cache_type)
             return None
 
-        # Parser cache: no CacheEntry model; check expiry and return response_data directly
-        if cache_type == Cache.TYPE_PARSER:
+        # Parser/match caches: no CacheEntry model; check expiry and return response_data directly
+        if cache_type in _RAW_CACHE_TYPES:
             if _is_expired(expires_at_str):
-                logger.debug("Parser cache entry expired for key: %s", key[:50])
+                logger.debug("%s cache entry expired for key: %s", cache_type, key[:50])
                 self.statistics.record_cache_miss(cache_type)
                 return None
-            self._update_access_stats(key_hash, cache_type)
-            self.statistics.record_cache_hit(cache_type)
-            logger.debug("Cache hit: key=%s (hash=%s...), type=%s", key[:50], key_hash[:8], cache_type)
             return response_data
 
         cache_entry = _build_cache_entry_from_row(
@@ -202,11 +261,47 @@ class QueryOperations(BaseOperation):
             logger.debug("Cache entry expired for key: %s", key[:50])
             self.statistics.record_cache_miss(cache_type)
             return None
-        self._update_access_stats(key_hash, cache_type)
-        self.statistics.record_cache_hit(cache_type)
-        logger.debug("Cache hit: key=%s (hash=%s...), type=%s", key[:50], key_hash[:8], cache_type)
         return response_data
 
+    def list_entries(self, cache_type: str, limit: int | None = None) -> list[dict[str, Any]]:
+        """List non-expired entries of one cache type, most recently created first.
+
+        Intended for inspection (CLI); does not update hit statistics.
+
+        Args:
+            cache_type: Type of cache to list
+            limit: Maximum number of entries (None for all)
+
+        Returns:
+            List of dicts with cache_key, response_data, created_at, expires_at
+            and hit_count
+        """
+        self._validate_connection()
+        sql = "\n        SELECT cache_key, key_hash, response_data, created_at, expires_at, hit_count\n        FROM tmdb_cache\n        WHERE cache_type = ?\n        ORDER BY created_at DESC\n        "
+        cursor = self.conn.execute(sql, (cache_type,))
+        rows = cursor.fetchall()
+        cursor.close()
+
+        entries: list[dict[str, Any]] = []
+        for cache_key, key_hash, response_data_str, created_at, expires_at, hit_count in rows:
+            if _is_expired(expires_at):
+                continue
+            response_data = _deserialize_response_data(response_data_str, key_hash)
+            if response_data is None:
+                continue
+            entries.append(
+                {
+                    "cache_key": cache_key,
+                    "response_data": response_data,
+                    "created_at": created_at,
+                    "expires_at": expires_at,
+                    "hit_count": hit_count or 0,
+                }
+            )
+            if limit is not None and len(entries) >= limit:
+                break
+        return entries
+
     def _update_access_stats(self, key_hash: str, cache_type: str) -> None:
         """Update access statistics for cache entry.
 
@@ -501,6 +501,26 @@ class SQLiteCacheDB:
         with self._lock:
             return self._query_ops.get(key, cache_type)
 
+    def get_many(
+        self,
+        keys: list[str],
+        cache_type: str = Cache.TYPE_SEARCH,
+    ) -> dict[str, dict[str, Any]]:
+        """Retrieve many entries in bulk (one query per chunk of keys).
+
+        Args:
+            keys: Cache key identifiers
+            cache_type: Type of cache ('search' or 'details')
+
+        Returns:
+            Cached data by key for keys found and not expired (misses omitted)
+
+        Raises:
+            InfrastructureError: If database operation fails
+        """
+        with self._lock:
+            return self._query_ops.get_many(keys, cache_type)
+
     def set_cache(
         self,
         key: str,
@@ -566,6 +586,23 @@ class SQLiteCacheDB:
         """
         return self._update_ops.clear(cache_type)
 
+    def list_entries(self, cache_type: str, limit: int | None = None) -> list[dict[str, Any]]:
+        """List non-expired entries of one cache type, newest first.
+
+        Args:
+            cache_type: Type of cache to list
+            limit: Maximum number of entries (None for all)
+
+        Returns:
+            List of dicts with cache_key, response_data, created_at, expires_at
+            and hit_count
+
+        Raises:
+            InfrastructureError: If database operation fails
+        """
+        with self._lock:
+            return self._query_ops.list_entries(cache_type, limit)
+
     def get_cache_info(self) -> dict[str, Any]:
         """Get cache statistics and metadata.
 
@@ -24,6 +24,7 @@ from anivault.application.adapters.organize import (
 )
 from anivault.application.models.match_services import MatchServices
 from anivault.application.use_cases.build_groups_use_case import BuildGroupsUseCase
+from anivault.application.use_cases.match_cache_use_case import MatchCacheUseCase
 from anivault.application.use_cases.match_use_case import MatchUseCase
 from anivault.application.use_cases.organize_use_case import OrganizeUseCase
 from anivault.application.use_cases.run_use_case import RunUseCase
@@ -32,10 +33,13 @@ from anivault.application.use_cases.verify_use_case import VerifyUseCase
 from anivault.config.loader import load_settings
 from anivault.core.matching.engine import MatchingEngine
 from anivault.core.matching.services.cache_adapter import SQLiteCacheAdapter
+from anivault.core.matching.services.decision_cache import MatchDecisionCache
+from anivault.core.matching.services.local_index import load_local_title_index
 from anivault.core.parser.anitopy_parser import AnitopyParser
 from anivault.infrastructure import (
     MetadataEnricher,
     RateLimitStateMachine,
+    RequestLaneScheduler,
     SemaphoreManager,
     SQLiteCacheDB,
     TMDBClient,
@@ -78,7 +82,9 @@ class Container(containers.DeclarativeContainer):
     )
 
     # Rate limiting components
-    rate_limiter = providers.Factory(
+    # Singletons: every TMDB client (GUI manual search, bulk matching, enrichment)
+    # shares one request budget, and priority lanes only work on a shared budget.
+    rate_limiter = providers.Singleton(
         TokenBucketRateLimiter,
         capacity=providers.Callable(
             lambda config: int(config.api.tmdb.rate_limit_rps),
@@ -90,7 +96,7 @@ class Container(containers.DeclarativeContainer):
         ),
     )
 
-    semaphore_manager = providers.Factory(
+    semaphore_manager = providers.Singleton(
         SemaphoreManager,
         concurrency_limit=providers.Callable(
             lambda config: int(config.api.tmdb.concurrent_requests),
@@ -98,7 +104,13 @@ class Container(containers.DeclarativeContainer):
         ),
     )
 
-    state_machine = providers.Factory(RateLimitStateMachine)
+    state_machine = providers.Singleton(RateLimitStateMachine)
+
+    request_lane_scheduler = providers.Singleton(
+        RequestLaneScheduler,
+        semaphore_manager=semaphore_manager,
+        rate_limiter=rate_limiter,
+    )
 
     # TMDB client
     tmdb_client = providers.Factory(
@@ -106,6 +118,23 @@ class Container(containers.DeclarativeContainer):
         rate_limiter=rate_limiter,
         semaphore_manager=semaphore_manager,
         state_machine=state_machine,
+        lane_scheduler=request_lane_scheduler,
+    )
+
+    # Offline title index (TMDB daily ID exports); None when api.tmdb.local_index_dir is empty.
+    # Singleton: the index is built once per process.
+    local_title_index = providers.Singleton(
+        load_local_title_index,
+        directory=providers.Callable(lambda config: config.api.tmdb.local_index_dir, config=config),
+        min_score=providers.Callable(lambda config: config.api.tmdb.local_index_min_score, config=config),
+        max_candidates=providers.Callable(lambda config: config.api.tmdb.local_index_max_candidates, config=config),
+    )
+
+    # Final match decision cache; None when cache.match_decisions is disabled
+    match_decision_cache = providers.Factory(
+        lambda config, backend: MatchDecisionCache(backend, language="ko-KR") if config.cache.match_decisions else None,
+        config=config,
+        backend=sqlite_cache_db,
     )
 
     # Matching engine
@@ -113,6 +142,8 @@ class Container(containers.DeclarativeContainer):
         MatchingEngine,
         cache_adapter=cache_adapter,
         tmdb_client=tmdb_client,
+        local_index=local_title_index,
+        decision_cache=match_decision_cache,
     )
 
     # Parser (for MatchServices)
@@ -143,7 +174,12 @@ class Container(containers.DeclarativeContainer):
     # R5: enricher wired here so scan_handler never imports MetadataEnricher directly
     # Phase 2: logger and plan_engine ports injected so OrganizeUseCase is core-free
     scan_use_case = providers.Factory(ScanUseCase, enricher=metadata_enricher)
-    match_use_case = providers.Factory(MatchUseCase, services=match_services)
+    match_use_case = providers.Factory(
+        MatchUseCase,
+        services=match_services,
+        match_state_file=providers.Callable(lambda: get_project_root() / FileSystem.CACHE_DIRECTORY / FileSystem.MATCH_STATE_FILE),
+        scan_cache_file=providers.Callable(lambda: get_project_root() / FileSystem.CACHE_DIRECTORY / FileSystem.MATCH_SCAN_CACHE_FILE),
+    )
     organize_use_case = providers.Factory(
         OrganizeUseCase,
         logger=organize_logger_adapter,
@@ -161,3 +197,6 @@ class Container(containers.DeclarativeContainer):
 
     # Verify use case (Phase R4B) — TMDB connectivity check in app layer
     verify_use_case = providers.Factory(VerifyUseCase, tmdb_client=tmdb_client)
+
+    # Match decision cache inspection/maintenance (match-cache command)
+    match_cache_use_case = providers.Factory(MatchCacheUseCase, cache_db=sqlite_cache_db)
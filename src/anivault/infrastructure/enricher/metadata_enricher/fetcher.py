@@ -8,6 +8,7 @@ matching logic.
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterable
 
 from anivault.infrastructure.tmdb import TMDBClient, TMDBMediaDetails, TMDBSearchResult
 from anivault.shared.constants import LogContextKeys, LogOperationNames
@@ -256,5 +257,35 @@ class TMDBFetcher:
             )
             return None
 
+    async def prefetch_details(
+        self,
+        items: Iterable[tuple[int, str]],
+    ) -> dict[tuple[int, str], TMDBMediaDetails | None]:
+        """Prefetch details for all matched media of a run in one concurrent batch.
+
+        Fills the client's details cache so later fetch_details() calls for the
+        same ids return without a network round-trip.
+
+        Args:
+            items: (tmdb_id, media_type) pairs
+
+        Returns:
+            Mapping of (tmdb_id, media_type) to details (None when unavailable)
+
+        Example:
+            >>> fetched = await fetcher.prefetch_details([(1429, "tv"), (129, "movie")])
+            >>> details = await fetcher.fetch_details(1429, "tv")  # served from cache
+        """
+        try:
+            return await self.tmdb_client.prefetch_media_details(items)
+        except AniVaultError as e:
+            log_operation_error(
+                logger=logger,
+                operation=LogOperationNames.GET_MEDIA_DETAILS,
+                error=e,
+                additional_context={"operation_mode": "prefetch"},
+            )
+            return {}
+
 
 __all__ = ["TMDBFetcher"]
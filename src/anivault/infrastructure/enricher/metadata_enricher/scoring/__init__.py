@@ -40,9 +40,9 @@ def create_default_scoring_engine(
     # Load weights if not provided
     if weights is None:
         try:
-            from anivault.config import load_settings
+            from anivault.config import get_settings_snapshot
 
-            settings = load_settings()
+            settings = get_settings_snapshot().settings
             weights = settings.matching_weights
         except (ImportError, AttributeError):
             weights = MatchingWeights()
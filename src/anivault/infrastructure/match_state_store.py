@@ -0,0 +1,225 @@
+"""Persistent per-file match state for incremental matching.
+
+Stores, per matched file, the file identity (path, size, mtime), the parsed
+title and the chosen TMDB id together with the resulting FileMetadata, in a
+JSON state file (same approach as IndexStateManager). An incremental match
+run re-matches only files that are new, modified or previously unmatched and
+reuses the stored result for the rest.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+from anivault.domain.entities.metadata import FileMetadata
+from anivault.shared.constants import Encoding
+
+logger = logging.getLogger(__name__)
+
+_STATE_VERSION = 1
+
+
+@dataclass
+class FileMatchState:
+    """Match state of a single file.
+
+    Attributes:
+        path: Absolute path to the file
+        size: File size in bytes at match time
+        mtime: Modification time (timestamp) at match time
+        parsed_title: Title parsed from the filename
+        tmdb_id: Chosen TMDB id (None if the file was not matched)
+        metadata: Serialized FileMetadata result (without file_path)
+    """
+
+    path: str
+    size: int
+    mtime: float
+    parsed_title: str
+    tmdb_id: int | None
+    metadata: dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> FileMatchState:
+        """Create FileMatchState from dictionary."""
+        return cls(
+            path=data["path"],
+            size=data["size"],
+            mtime=data["mtime"],
+            parsed_title=data.get("parsed_title", ""),
+            tmdb_id=data.get("tmdb_id"),
+            metadata=data.get("metadata", {}),
+        )
+
+    def to_file_metadata(self, file_path: Path | None = None) -> FileMetadata:
+        """Rebuild the stored FileMetadata result.
+
+        Args:
+            file_path: Path to put on the result (default: the stored path)
+        """
+        return FileMetadata(**self.metadata, file_path=file_path or Path(self.path))
+
+
+def _stat_key(path: Path) -> tuple[int, float] | None:
+    """(size, mtime) of a file, or None if it cannot be stat'ed."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime
+
+
+class MatchStateStore:
+    """JSON-backed store of per-file match state.
+
+    Entries are keyed by absolute file path. Nothing is written until
+    ``save`` is called.
+
+    Attributes:
+        state_file: Path to the JSON state file
+
+    Example:
+        >>> store = MatchStateStore(Path("cache/match_state.json"))
+        >>> previous = store.lookup(Path("/anime/show - 01.mkv"))  # None -> re-match
+        >>> store.update(new_results, parsed_titles)
+        >>> store.save()
+    """
+
+    def __init__(self, state_file: Path) -> None:
+        """Initialize and load existing state.
+
+        Args:
+            state_file: Path to the JSON state file (created on first save)
+        """
+        self.state_file = Path(state_file)
+        self._states: dict[str, FileMatchState] = {}
+        self._load()
+
+    def __len__(self) -> int:
+        """Number of files with stored state."""
+        return len(self._states)
+
+    def _load(self) -> None:
+        """Load state from the state file (empty state if missing or invalid)."""
+        if not self.state_file.exists():
+            logger.debug("Match state file does not exist, starting with empty state: %s", self.state_file)
+            return
+
+        try:
+            with self.state_file.open("r", encoding=Encoding.DEFAULT) as f:
+                data = json.load(f)
+            if data.get("version") != _STATE_VERSION:
+                logger.info("Ignoring match state file with unsupported version: %s", self.state_file)
+                return
+            for file_data in data.get("files", []):
+                state = FileMatchState.from_dict(file_data)
+                self._states[state.path] = state
+            logger.debug("Loaded match state for %d files from %s", len(self._states), self.state_file)
+        except (OSError, KeyError, TypeError, ValueError) as e:
+            logger.warning("Failed to load match state file %s, starting with empty state: %s", self.state_file, e)
+            self._states = {}
+
+    def get(self, path: Path) -> FileMatchState | None:
+        """Stored state for a file path (None if unknown)."""
+        return self._states.get(str(Path(path).resolve()))
+
+    def lookup(self, path: Path) -> FileMetadata | None:
+        """Return the stored result if it is still valid for the file.
+
+        A stored result is reused only if the file's size and mtime are
+        unchanged and the file was matched (has a TMDB id).
+
+        Args:
+            path: File path
+
+        Returns:
+            Stored FileMetadata (with the given path), or None if the file must be re-matched
+        """
+        state = self.get(path)
+        if state is None or state.tmdb_id is None:
+            return None
+        if _stat_key(Path(path)) != (state.size, state.mtime):
+            return None
+        try:
+            return state.to_file_metadata(Path(path))
+        except (TypeError, ValueError):
+            logger.debug("Discarding invalid stored match state for %s", path)
+            return None
+
+    def update(self, results: list[FileMetadata], parsed_titles: dict[Path, str] | None = None) -> None:
+        """Record match results.
+
+        Args:
+            results: Match results (one FileMetadata per matched or unmatched file)
+            parsed_titles: Parsed title per file path (default: the result title
+                for unmatched files, the file stem for matched ones)
+        """
+        parsed_titles = parsed_titles or {}
+        for fm in results:
+            stat_key = _stat_key(fm.file_path)
+            if stat_key is None:
+                continue
+            metadata = asdict(fm)
+            metadata.pop("file_path")
+            parsed_title = parsed_titles.get(fm.file_path)
+            if not parsed_title:
+                parsed_title = fm.title if fm.tmdb_id is None else fm.file_path.stem
+            path = str(fm.file_path.resolve())
+            self._states[path] = FileMatchState(
+                path=path,
+                size=stat_key[0],
+                mtime=stat_key[1],
+                parsed_title=parsed_title,
+                tmdb_id=fm.tmdb_id,
+                metadata=metadata,
+            )
+
+    def prune(self, root: Path, keep: set[Path]) -> int:
+        """Drop state of files under ``root`` that are no longer present.
+
+        Args:
+            root: Directory that was scanned
+            keep: Files found in the current scan
+
+        Returns:
+            Number of removed entries
+        """
+        prefix = str(Path(root).resolve()) + os.sep
+        keep_paths = {str(Path(p).resolve()) for p in keep}
+        stale = [path for path in self._states if path.startswith(prefix) and path not in keep_paths]
+        for path in stale:
+            del self._states[path]
+        return len(stale)
+
+    def save(self) -> None:
+        """Write the state file (atomically via a temporary file)."""
+        self.state_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.state_file.with_suffix(self.state_file.suffix + ".tmp")
+        data = {
+            "version": _STATE_VERSION,
+            "files": [asdict(state) for state in self._states.values()],
+        }
+        try:
+            with tmp_file.open("w", encoding=Encoding.DEFAULT) as f:
+                json.dump(data, f, ensure_ascii=False)
+            tmp_file.replace(self.state_file)
+        except OSError:
+            logger.exception("Failed to save match state file %s", self.state_file)
+            raise
+        logger.info("Saved match state for %d files to %s", len(self._states), self.state_file)
+
+    def clear(self) -> None:
+        """Remove all stored state (and the state file)."""
+        self._states = {}
+        try:
+            self.state_file.unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning("Failed to delete match state file %s: %s", self.state_file, e)
+
+
+__all__ = ["FileMatchState", "MatchStateStore"]
@@ -135,7 +135,7 @@ class TokenBucketRateLimiter:
             )
             raise error from e
 
-    def try_acquire(self, tokens: int = 1) -> bool:
+    def try_acquire(self, tokens: int = 1, reserve: float = 0.0) -> bool:
         """Try to acquire tokens from the bucket.
 
         This method attempts to acquire the specified number of tokens
@@ -144,6 +144,9 @@ class TokenBucketRateLimiter:
 
         Args:
             tokens: Number of tokens to acquire (default: 1)
+            reserve: Tokens that must remain in the bucket after acquiring
+                (default: 0). Lower-priority callers pass a reserve so that
+                higher-priority callers always find headroom.
 
         Returns:
             True if tokens were successfully acquired, False otherwise
@@ -155,6 +158,7 @@ class TokenBucketRateLimiter:
             operation="rate_limiter_acquire",
             additional_data={
                 "requested_tokens": tokens,
+                "reserve": reserve,
                 "current_tokens": self.tokens,
                 "capacity": self.capacity,
             },
@@ -178,7 +182,7 @@ class TokenBucketRateLimiter:
             with self._lock:
                 self._refill()
 
-                if self.tokens >= tokens:
+                if self.tokens - tokens >= reserve:
                     self.tokens -= tokens
                     log_operation_success(
                         logger=logger,
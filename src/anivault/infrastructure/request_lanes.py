@@ -0,0 +1,230 @@
+"""Priority lanes for TMDB requests.
+
+This module provides a scheduler that admits requests into the shared
+concurrency (SemaphoreManager) and rate (TokenBucketRateLimiter) budget by
+priority lane, so interactive requests (e.g. the GUI manual search dialog)
+are not stuck behind hundreds of queued bulk matching requests.
+
+Policy:
+- Interactive requests may use every concurrency slot and every token.
+- Bulk requests leave a few concurrency slots and a share of the token
+  bucket untouched, and do not take a freed slot while an interactive
+  request is waiting for one. Under sustained load bulk still gets the
+  full refill rate; only its burst headroom is reduced.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+from anivault.infrastructure.rate_limiter import TokenBucketRateLimiter
+from anivault.infrastructure.semaphore_manager import SemaphoreManager
+from anivault.shared.constants import RequestPriority, TMDBConfig
+from anivault.shared.errors import ApplicationError, ErrorCode, ErrorContext
+
+
+class _LaneStats:
+    """Mutable per-lane counters (guarded by the scheduler lock)."""
+
+    __slots__ = ("active", "max_wait", "requests", "total_wait", "waiting")
+
+    def __init__(self) -> None:
+        self.waiting = 0
+        self.active = 0
+        self.requests = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+
+class RequestLaneScheduler:
+    """Priority-aware admission into the shared TMDB request budget.
+
+    Thread-safe and event-loop agnostic: the GUI runs the manual search and
+    bulk matching in different threads, each with its own event loop, so
+    waiting is done by polling (like the token bucket wait in TMDBClient)
+    instead of loop-bound primitives.
+
+    Args:
+        semaphore_manager: Shared concurrency limiter
+        rate_limiter: Shared token bucket
+        interactive_reserved_slots: Concurrency slots bulk requests never take
+        interactive_token_share: Share of bucket capacity bulk requests leave untouched
+        poll_interval: Admission polling interval in seconds
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self,
+        semaphore_manager: SemaphoreManager,
+        rate_limiter: TokenBucketRateLimiter,
+        interactive_reserved_slots: int = TMDBConfig.INTERACTIVE_RESERVED_SLOTS,
+        interactive_token_share: float = TMDBConfig.INTERACTIVE_TOKEN_SHARE,
+        poll_interval: float = TMDBConfig.LANE_POLL_INTERVAL,
+    ):
+        """Initialize the scheduler.
+
+        Args:
+            semaphore_manager: Shared concurrency limiter
+            rate_limiter: Shared token bucket
+            interactive_reserved_slots: Concurrency slots bulk requests never take
+            interactive_token_share: Share of bucket capacity bulk requests leave untouched
+            poll_interval: Admission polling interval in seconds
+
+        Raises:
+            ApplicationError: If the reservation parameters are invalid
+        """
+        if interactive_reserved_slots < 0 or not 0.0 <= interactive_token_share < 1.0:
+            raise ApplicationError(
+                code=ErrorCode.VALIDATION_ERROR,
+                message="Invalid request lane reservation parameters",
+                context=ErrorContext(
+                    operation="request_lane_scheduler_init",
+                    additional_data={
+                        "interactive_reserved_slots": interactive_reserved_slots,
+                        "interactive_token_share": interactive_token_share,
+                    },
+                ),
+            )
+
+        self.semaphore_manager = semaphore_manager
+        self.rate_limiter = rate_limiter
+        self.poll_interval = poll_interval
+        # Bulk always keeps at least one slot
+        self.interactive_reserved_slots = min(
+            interactive_reserved_slots,
+            max(0, semaphore_manager.concurrency_limit - 1),
+        )
+        self.interactive_token_reserve = rate_limiter.capacity * interactive_token_share
+
+        self._lock = threading.Lock()
+        self._lanes = {lane: _LaneStats() for lane in RequestPriority.all_values()}
+
+    @asynccontextmanager
+    async def lane(self, priority: str) -> AsyncIterator[float]:
+        """Hold a request slot and a rate token for the given lane.
+
+        Args:
+            priority: RequestPriority.INTERACTIVE or RequestPriority.BULK
+
+        Yields:
+            Seconds spent waiting for admission
+        """
+        wait = await self.acquire(priority)
+        try:
+            yield wait
+        finally:
+            self.release(priority)
+
+    async def acquire(self, priority: str) -> float:
+        """Wait until the lane may start a request, then take a slot and a token.
+
+        Args:
+            priority: RequestPriority.INTERACTIVE or RequestPriority.BULK
+
+        Returns:
+            Seconds spent waiting for admission
+
+        Raises:
+            ApplicationError: If priority is not a known lane
+        """
+        stats = self._get_lane(priority)
+        token_reserve = 0.0 if priority == RequestPriority.INTERACTIVE else self.interactive_token_reserve
+        start = time.monotonic()
+
+        with self._lock:
+            stats.waiting += 1
+        try:
+            while not self._try_take_slot(priority):
+                await asyncio.sleep(self.poll_interval)
+            try:
+                while not self.rate_limiter.try_acquire(reserve=token_reserve):
+                    await asyncio.sleep(self.poll_interval)
+            except BaseException:
+                self.release(priority)
+                raise
+        finally:
+            with self._lock:
+                stats.waiting -= 1
+
+        wait = time.monotonic() - start
+        with self._lock:
+            stats.requests += 1
+            stats.total_wait += wait
+            stats.max_wait = max(stats.max_wait, wait)
+        return wait
+
+    def release(self, priority: str) -> None:
+        """Release the concurrency slot held by a request of the given lane.
+
+        Args:
+            priority: Lane the slot was acquired for
+        """
+        stats = self._get_lane(priority)
+        with self._lock:
+            stats.active = max(0, stats.active - 1)
+        self.semaphore_manager.release()
+
+    def _try_take_slot(self, priority: str) -> bool:
+        """Take a concurrency slot if the lane policy allows it right now."""
+        with self._lock:
+            available = self.semaphore_manager.get_available_count()
+            if priority == RequestPriority.BULK:
+                if self._lanes[RequestPriority.INTERACTIVE].waiting > 0:
+                    return False
+                if available <= self.interactive_reserved_slots:
+                    return False
+            elif available <= 0:
+                return False
+
+            if not self.semaphore_manager.acquire(timeout=0):
+                return False
+            self._lanes[priority].active += 1
+            return True
+
+    def _get_lane(self, priority: str) -> _LaneStats:
+        """Return the stats record for a lane, validating the name."""
+        try:
+            return self._lanes[priority]
+        except KeyError:
+            raise ApplicationError(
+                code=ErrorCode.VALIDATION_ERROR,
+                message=f"Unknown request priority: {priority}",
+                context=ErrorContext(
+                    operation="request_lane_acquire",
+                    additional_data={"priority": str(priority)},
+                ),
+            ) from None
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get per-lane queue and wait statistics.
+
+        Returns:
+            Dictionary keyed by lane with queued/active counts and wait times (ms)
+        """
+        with self._lock:
+            return {
+                lane: {
+                    "queued": stats.waiting,
+                    "active": stats.active,
+                    "requests": stats.requests,
+                    "avg_wait_ms": (stats.total_wait / stats.requests * 1000) if stats.requests else 0.0,
+                    "max_wait_ms": stats.max_wait * 1000,
+                    "total_wait_ms": stats.total_wait * 1000,
+                }
+                for lane, stats in self._lanes.items()
+            }
+
+    def reset_stats(self) -> None:
+        """Reset wait-time counters (queued/active counts are kept)."""
+        with self._lock:
+            for stats in self._lanes.values():
+                stats.requests = 0
+                stats.total_wait = 0.0
+                stats.max_wait = 0.0
+
+
+__all__ = ["RequestLaneScheduler"]
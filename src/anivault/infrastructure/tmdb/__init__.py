@@ -12,6 +12,7 @@ from anivault.shared.models.api.tmdb import (
     TMDBMediaDetails,
     TMDBSearchResponse,
     TMDBSearchResult,
+    TMDBSeason,
 )
 
 from .tmdb_client import TMDBClient
@@ -20,10 +21,20 @@ from .tmdb_strategies import (
     SearchStrategy,
     TvSearchStrategy,
 )
+from .tmdb_transport import (
+    LiveTMDBTransport,
+    RecordingTransport,
+    ReplayTransport,
+    TMDBTransport,
+    TransportMediaAPI,
+)
 from .tmdb_utils import generate_shortened_titles, generate_title_prefixes
 
 __all__ = [
+    "LiveTMDBTransport",
     "MovieSearchStrategy",
+    "RecordingTransport",
+    "ReplayTransport",
     "ScoredSearchResult",
     "SearchStrategy",
     "TMDBCandidate",
@@ -33,6 +44,9 @@ __all__ = [
     "TMDBMediaDetails",
     "TMDBSearchResponse",
     "TMDBSearchResult",
+    "TMDBSeason",
+    "TMDBTransport",
+    "TransportMediaAPI",
     "TvSearchStrategy",
     "generate_shortened_titles",
     "generate_title_prefixes",
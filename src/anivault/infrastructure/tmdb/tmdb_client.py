@@ -8,17 +8,29 @@ integrated rate limiting, concurrency control, and error handling.
 from __future__ import annotations
 
 import asyncio
+import contextvars
 import logging
-from typing import Any, Callable, cast
+from collections import OrderedDict
+from collections.abc import Hashable, Iterable, Iterator, Sequence
+from contextlib import contextmanager
+from typing import Any, Callable, TypeVar, cast
 
 from tmdbv3api import TV, Movie, TMDb
 from tmdbv3api.exceptions import TMDbException
 
 from anivault.config import get_config
 from anivault.infrastructure.rate_limiter import TokenBucketRateLimiter
+from anivault.infrastructure.request_lanes import RequestLaneScheduler
 from anivault.infrastructure.semaphore_manager import SemaphoreManager
 from anivault.infrastructure.state_machine import RateLimitState, RateLimitStateMachine
-from anivault.shared.constants import HTTPStatusCodes, LogContextKeys, MediaType
+from anivault.shared.constants import (
+    HTTPStatusCodes,
+    LogContextKeys,
+    MediaType,
+    PrefixFallbackMode,
+    RequestPriority,
+    TMDBConfig,
+)
 from anivault.shared.constants.tmdb_messages import TMDBErrorMessages
 from anivault.shared.errors import (
     AniVaultError,
@@ -34,10 +46,33 @@ from anivault.shared.models.api.tmdb import (
 )
 
 from .tmdb_strategies import MovieSearchStrategy, SearchStrategy, TvSearchStrategy
+from .tmdb_transport import TMDBTransport, TransportMediaAPI
 from .tmdb_utils import generate_title_prefixes
 
 logger = logging.getLogger(__name__)
 
+_CacheValueT = TypeVar("_CacheValueT")
+
+# Priority lane for requests made in the current context (task / thread).
+# Set via TMDBClient.request_priority(); copied into tasks and to_thread calls.
+_request_priority: contextvars.ContextVar[str] = contextvars.ContextVar(
+    "tmdb_request_priority",
+    default=RequestPriority.BULK,
+)
+
+
+def _lru_put(
+    cache: OrderedDict[Any, _CacheValueT],
+    key: Hashable,
+    value: _CacheValueT,
+    max_size: int,
+) -> None:
+    """Insert into an OrderedDict used as LRU cache, evicting the oldest entries."""
+    cache[key] = value
+    cache.move_to_end(key)
+    while len(cache) > max_size:
+        cache.popitem(last=False)
+
 
 class TMDBClient:
     """TMDB API client with integrated rate limiting and error handling.
@@ -50,6 +85,9 @@ class TMDBClient:
         rate_limiter: Token bucket rate limiter instance
         semaphore_manager: Semaphore manager for concurrency control
         state_machine: Rate limiting state machine
+        lane_scheduler: Priority lane scheduler (interactive vs bulk requests)
+        transport: Optional request transport replacing tmdbv3api's TV/Movie
+            objects (e.g. ReplayTransport for offline benchmarks)
     """
 
     def __init__(  # pylint: disable=too-many-arguments,too-many-positional-arguments
@@ -59,6 +97,8 @@ class TMDBClient:
         state_machine: RateLimitStateMachine | None = None,
         language: str = "ko-KR",
         region: str = "KR",
+        lane_scheduler: RequestLaneScheduler | None = None,
+        transport: TMDBTransport | None = None,
     ):
         """Initialize the TMDB client.
 
@@ -68,6 +108,10 @@ class TMDBClient:
             state_machine: Rate limiting state machine
             language: Language code for TMDB API requests (default: ko-KR for Korean)
             region: Region code for TMDB API requests (default: KR)
+            lane_scheduler: Priority lane scheduler; share one instance between
+                clients that share the rate limiter and semaphore manager
+            transport: Optional request transport replacing tmdbv3api's TV/Movie
+                objects (RecordingTransport / ReplayTransport)
         """
         self.config = get_config()
 
@@ -82,6 +126,14 @@ class TMDBClient:
             concurrency_limit=self.config.api.tmdb.concurrent_requests,
         )
         self.state_machine = state_machine or RateLimitStateMachine()
+        if lane_scheduler is not None:
+            # The scheduler owns admission, so it must gate the same budget
+            self.rate_limiter = lane_scheduler.rate_limiter
+            self.semaphore_manager = lane_scheduler.semaphore_manager
+        self.lane_scheduler = lane_scheduler or RequestLaneScheduler(
+            semaphore_manager=self.semaphore_manager,
+            rate_limiter=self.rate_limiter,
+        )
 
         # Initialize TMDB API client - MUST be configured before creating TV/Movie objects
         self._tmdb = TMDb()
@@ -97,8 +149,15 @@ class TMDBClient:
 
         # Initialize API objects AFTER TMDb configuration
         # TV and Movie objects will inherit TMDb configuration
-        self._tv = TV()
-        self._movie = Movie()
+        self.transport = transport
+        self._tv: Any
+        self._movie: Any
+        if transport is None:
+            self._tv = TV()
+            self._movie = Movie()
+        else:
+            self._tv = TransportMediaAPI(transport, MediaType.TV)
+            self._movie = TransportMediaAPI(transport, MediaType.MOVIE)
 
         # Initialize search strategies
         self._tv_strategy = TvSearchStrategy(
@@ -110,6 +169,14 @@ class TMDBClient:
             request_executor=self._make_request,
         )
 
+        # LRU cache of title prefix query results (prefix fallback in search_media).
+        # Prefixes like "명탐정" recur across many unknown series, so keep them per client.
+        self._prefix_cache: OrderedDict[str, list[TMDBSearchResult]] = OrderedDict()
+
+        # LRU cache of media details keyed by (media_type, media_id, append_to_response).
+        # Filled by get_media_details and by prefetch_media_details for a whole run.
+        self._details_cache: OrderedDict[tuple[str, int, str], TMDBMediaDetails] = OrderedDict()
+
         # Verify configuration is applied
         logger.info(
             "TMDB Client initialized with language: %s, region: %s",
@@ -139,18 +206,38 @@ class TMDBClient:
         Returns:
             Combined list of search results from all strategies
         """
+        results, _ = await self._search_with_strategies_status(title, strategies)
+        return results
+
+    async def _search_with_strategies_status(
+        self,
+        title: str,
+        strategies: list[SearchStrategy] | None = None,
+    ) -> tuple[list[TMDBSearchResult], bool]:
+        """Execute search using all strategies; report whether every strategy succeeded.
+
+        Args:
+            title: Title to search for
+            strategies: List of strategies to use (defaults to all strategies)
+
+        Returns:
+            Tuple of (combined results, True if every strategy's API call succeeded)
+        """
         if strategies is None:
             strategies = self._get_strategies()
 
         all_results: list[TMDBSearchResult] = []
+        complete = True
 
         for strategy in strategies:
             try:
-                results = await strategy.search(title)
+                results, succeeded = await strategy.search_with_status(title)
                 all_results.extend(results)
+                complete = complete and succeeded
             except Exception as e:  # noqa: BLE001  # pylint: disable=broad-exception-caught
                 # Strategies already log their own errors
                 # Just continue with next strategy
+                complete = False
                 logger.debug(
                     "Strategy %s failed for '%s': %s",
                     strategy.__class__.__name__,
@@ -159,7 +246,7 @@ class TMDBClient:
                 )
                 continue
 
-        return all_results
+        return all_results, complete
 
     async def search_media(self, title: str) -> TMDBSearchResponse:
         """Search for media (TV shows and movies) by title.
@@ -171,7 +258,9 @@ class TMDBClient:
         This method implements the Template Method pattern:
         1. Try primary search with full title
         2. If no results, try title prefixes (first word, then first two, ...);
-           stop at first 0-result prefix and use the previous successful one
+           stop at first 0-result prefix and use the previous successful one.
+           How prefixes are issued depends on ``prefix_fallback_mode``
+           (sequential, parallel speculative window, or binary search).
         3. Return combined results or raise error
 
         Args:
@@ -194,19 +283,9 @@ class TMDBClient:
         # 2. Fallback: extend prefix from the front; when a prefix returns 0 results,
         #    use the last prefix that had results (most specific successful query).
         if not results:
-            prefixes = generate_title_prefixes(title)
-            last_success_query: str | None = None
-            last_success_results: list[TMDBSearchResult] | None = None
-            for query in prefixes:
-                logger.debug("Trying title prefix: %s", query)
-                candidate = await self._search_with_strategies(query)
-                if candidate:
-                    last_success_query = query
-                    last_success_results = candidate
-                else:
-                    break  # 0 results: stop and use last successful query
-            if last_success_results is not None and last_success_query is not None:
-                results = last_success_results
+            prefix_match = await self._search_title_prefixes(generate_title_prefixes(title))
+            if prefix_match is not None:
+                last_success_query, results = prefix_match
                 logger.debug(
                     "Found results with title prefix '%s' for original '%s'",
                     last_success_query,
@@ -243,18 +322,165 @@ class TMDBClient:
             results=results,
         )
 
+    async def _search_title_prefixes(
+        self,
+        prefixes: list[str],
+    ) -> tuple[str, list[TMDBSearchResult]] | None:
+        """Find the most specific title prefix that still returns results.
+
+        The answer is the last prefix of the leading run of prefixes with
+        results (i.e. the prefix just before the first 0-result prefix).
+
+        Args:
+            prefixes: Title prefixes from shortest to longest
+
+        Returns:
+            Tuple of (prefix query, results) or None if no prefix had results
+        """
+        if not prefixes:
+            return None
+
+        mode = self.config.api.tmdb.prefix_fallback_mode
+        if mode == PrefixFallbackMode.BINARY:
+            return await self._search_prefixes_binary(prefixes)
+        if mode == PrefixFallbackMode.PARALLEL:
+            return await self._search_prefixes_parallel(prefixes)
+        return await self._search_prefixes_sequential(prefixes)
+
+    async def _search_prefixes_sequential(
+        self,
+        prefixes: list[str],
+    ) -> tuple[str, list[TMDBSearchResult]] | None:
+        """Query prefixes one at a time, stopping at the first 0-result prefix.
+
+        Args:
+            prefixes: Title prefixes from shortest to longest
+
+        Returns:
+            Tuple of (prefix query, results) or None if no prefix had results
+        """
+        last_success: tuple[str, list[TMDBSearchResult]] | None = None
+        for query in prefixes:
+            candidate = await self._search_prefix(query)
+            if not candidate:
+                break  # 0 results: stop and use last successful query
+            last_success = (query, candidate)
+        return last_success
+
+    async def _search_prefixes_parallel(
+        self,
+        prefixes: list[str],
+    ) -> tuple[str, list[TMDBSearchResult]] | None:
+        """Query prefixes speculatively, keeping a window of requests in flight.
+
+        Results are consumed in prefix order so the answer is identical to the
+        sequential mode. Once a 0-result prefix is seen, the speculative queries
+        for longer prefixes are cancelled. All requests still go through
+        _make_request, so the semaphore and token bucket bound the real load.
+
+        Args:
+            prefixes: Title prefixes from shortest to longest
+
+        Returns:
+            Tuple of (prefix query, results) or None if no prefix had results
+        """
+        window = self.config.api.tmdb.prefix_fallback_concurrency
+        pending: dict[int, asyncio.Task[list[TMDBSearchResult]]] = {}
+        next_index = 0
+        last_success: tuple[str, list[TMDBSearchResult]] | None = None
+
+        try:
+            for index, query in enumerate(prefixes):
+                # Keep up to `window` prefix queries in flight ahead of the current one
+                while next_index < len(prefixes) and next_index < index + window:
+                    pending[next_index] = asyncio.ensure_future(self._search_prefix(prefixes[next_index]))
+                    next_index += 1
+
+                candidate = await pending.pop(index)
+                if not candidate:
+                    break  # 0 results: longer prefixes are redundant
+                last_success = (query, candidate)
+        finally:
+            # Cancel redundant speculative queries (finished ones are already cached)
+            for task in pending.values():
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending.values(), return_exceptions=True)
+                logger.debug("Cancelled %d redundant title prefix queries", len(pending))
+
+        return last_success
+
+    async def _search_prefixes_binary(
+        self,
+        prefixes: list[str],
+    ) -> tuple[str, list[TMDBSearchResult]] | None:
+        """Binary-search the longest prefix that returns results.
+
+        Uses O(log n) queries instead of O(n). Assumes that adding words never
+        turns a 0-result query into one with results, which holds for TMDB
+        title search in practice.
+
+        Args:
+            prefixes: Title prefixes from shortest to longest
+
+        Returns:
+            Tuple of (prefix query, results) or None if no prefix had results
+        """
+        low, high = 0, len(prefixes) - 1
+        best: tuple[str, list[TMDBSearchResult]] | None = None
+        while low <= high:
+            mid = (low + high) // 2
+            candidate = await self._search_prefix(prefixes[mid])
+            if candidate:
+                best = (prefixes[mid], candidate)
+                low = mid + 1
+            else:
+                high = mid - 1
+        return best
+
+    async def _search_prefix(self, query: str) -> list[TMDBSearchResult]:
+        """Search a single title prefix, using the in-memory prefix cache.
+
+        Args:
+            query: Prefix query to search for
+
+        Returns:
+            Combined results from all strategies (may be empty). Only searches
+            in which every strategy succeeded are cached.
+        """
+        cache_key = query.casefold()
+        cached = self._prefix_cache.get(cache_key)
+        if cached is not None:
+            self._prefix_cache.move_to_end(cache_key)
+            logger.debug("Prefix cache hit: %s", query)
+            return cached
+
+        logger.debug("Trying title prefix: %s", query)
+        results, complete = await self._search_with_strategies_status(query)
+
+        # A failed strategy (rate limit, network error) must not pin a partial or empty result
+        if complete:
+            _lru_put(self._prefix_cache, cache_key, results, TMDBConfig.PREFIX_CACHE_MAX_SIZE)
+        return results
+
     async def get_media_details(
         self,
         media_id: int,
         media_type: str,
+        append_to_response: Sequence[str] | None = None,
     ) -> TMDBMediaDetails | None:
         """Get detailed information for a specific media item.
 
         Uses Strategy pattern to delegate to media-type-specific implementation.
+        Related sub-resources (alternative titles, external IDs) are requested in
+        the same call via ``append_to_response``; TV seasons are part of the
+        base TV details. Results are kept in an in-memory details cache.
 
         Args:
             media_id: TMDB ID of the media item
             media_type: Type of media ('tv' or 'movie')
+            append_to_response: Sub-resources to append (default:
+                TMDBConfig.TV_DETAILS_APPEND_TO_RESPONSE / MOVIE_DETAILS_APPEND_TO_RESPONSE)
 
         Returns:
             TMDBMediaDetails or None if not found
@@ -286,21 +512,33 @@ class TMDBClient:
         if media_type == MediaType.TV:
             api = self._tv
             strategy: SearchStrategy = self._tv_strategy
+            default_append: Sequence[str] = TMDBConfig.TV_DETAILS_APPEND_TO_RESPONSE
         elif media_type == MediaType.MOVIE:
             api = self._movie
             strategy = cast("SearchStrategy", self._movie_strategy)
+            default_append = TMDBConfig.MOVIE_DETAILS_APPEND_TO_RESPONSE
         else:
             error_msg = f"Unsupported media type: {media_type}"
             raise TypeError(error_msg)
 
+        append = ",".join(append_to_response if append_to_response is not None else default_append)
+        cache_key = (media_type, media_id, append)
+        cached = self._details_cache.get(cache_key)
+        if cached is not None:
+            self._details_cache.move_to_end(cache_key)
+            return cached
+
         try:
-            # Call TMDB API directly (TV.details or Movie.details)
-            raw_details = await self._make_request(lambda: api.details(media_id))
+            # Call TMDB API directly (TV.details or Movie.details), sub-resources in one request
+            raw_details = await self._make_request(
+                lambda: api.details(media_id, append_to_response=append),
+            )
 
             # Convert raw result to TMDBMediaDetails using strategy's conversion method
             details: TMDBMediaDetails | None = strategy._to_details_model(raw_details)
 
             if details:
+                _lru_put(self._details_cache, cache_key, details, TMDBConfig.DETAILS_CACHE_MAX_SIZE)
                 log_operation_success(
                     logger=logger,
                     operation="get_media_details",
@@ -328,14 +566,90 @@ class TMDBClient:
             )
             raise error from e
 
-    async def _make_request(self, api_call: Callable[[], Any]) -> Any:
+    async def prefetch_media_details(
+        self,
+        items: Iterable[tuple[int, str]],
+        append_to_response: Sequence[str] | None = None,
+    ) -> dict[tuple[int, str], TMDBMediaDetails | None]:
+        """Fetch details for many matched media items concurrently.
+
+        Intended to run once per match run with all matched TMDB ids, so the
+        details cache is warm before metadata enrichment or organizing needs
+        them. Duplicate ids are fetched once; concurrency and rate are still
+        bounded by _make_request (semaphore + token bucket). Failures are
+        logged and reported as None rather than raised.
+
+        Args:
+            items: (media_id, media_type) pairs, e.g. from FileMetadata results
+            append_to_response: Sub-resources to append (see get_media_details)
+
+        Returns:
+            Mapping of (media_id, media_type) to details (None when unavailable)
+        """
+        unique_items = list(
+            dict.fromkeys((int(media_id), media_type) for media_id, media_type in items if media_type in (MediaType.TV, MediaType.MOVIE)),
+        )
+        if not unique_items:
+            return {}
+
+        results = await asyncio.gather(
+            *(self.get_media_details(media_id, media_type, append_to_response) for media_id, media_type in unique_items),
+            return_exceptions=True,
+        )
+
+        prefetched: dict[tuple[int, str], TMDBMediaDetails | None] = {}
+        failed = 0
+        for item, result in zip(unique_items, results):
+            if isinstance(result, BaseException):
+                failed += 1
+                logger.debug("Details prefetch failed for %s/%s: %s", item[1], item[0], result)
+                prefetched[item] = None
+            else:
+                prefetched[item] = result
+
+        logger.info(
+            "Prefetched TMDB details for %d media items (%d failed)",
+            len(unique_items) - failed,
+            failed,
+        )
+        return prefetched
+
+    @staticmethod
+    @contextmanager
+    def request_priority(priority: str) -> Iterator[None]:
+        """Run TMDB requests made inside this block in the given priority lane.
+
+        Interactive requests jump ahead of queued bulk requests; bulk requests
+        (the default) keep most of the shared budget. The lane applies to all
+        requests awaited in the current context, including tasks it spawns.
+
+        Args:
+            priority: RequestPriority.INTERACTIVE or RequestPriority.BULK
+
+        Example:
+            >>> with TMDBClient.request_priority(RequestPriority.INTERACTIVE):
+            ...     response = await client.search_media("진격의 거인")
+        """
+        token = _request_priority.set(priority)
+        try:
+            yield
+        finally:
+            _request_priority.reset(token)
+
+    async def _make_request(
+        self,
+        api_call: Callable[[], Any],
+        priority: str | None = None,
+    ) -> Any:
         """Make a rate-limited and concurrency-controlled API request.
 
         This method orchestrates the API request process by coordinating
-        state machine checks, concurrency control, rate limiting, and retry logic.
+        state machine checks, priority-lane admission (concurrency control and
+        rate limiting), and retry logic.
 
         Args:
             api_call: Function that makes the actual API call
+            priority: Request lane (default: lane set by request_priority(), else bulk)
 
         Returns:
             API response data
@@ -343,19 +657,20 @@ class TMDBClient:
         Raises:
             InfrastructureError: If API request fails after all retries
         """
+        lane = priority or _request_priority.get()
         context = ErrorContext(
             operation="make_tmdb_request",
-            additional_data={"retry_attempts": self.config.api.tmdb.retry_attempts},
+            additional_data={
+                "retry_attempts": self.config.api.tmdb.retry_attempts,
+                "priority": lane,
+            },
         )
 
         # Check if we should make the request based on state machine
         await self._check_request_permissibility(context)
 
-        # Use semaphore for concurrency control
-        async with self.semaphore_manager:
-            # Apply rate limiting
-            await self._apply_rate_limiting()
-
+        # Take a concurrency slot and a rate token in the request's priority lane
+        async with self.lane_scheduler.lane(lane):
             # Make the API call with retry logic
             return await self._execute_with_retry(api_call, context)
 
@@ -388,14 +703,6 @@ class TMDBClient:
             if retry_delay > 0:
                 await asyncio.sleep(retry_delay)
 
-    async def _apply_rate_limiting(self) -> None:
-        """Apply rate limiting by waiting for token availability.
-
-        This method blocks until a token is available from the rate limiter.
-        """
-        while not self.rate_limiter.try_acquire():
-            await asyncio.sleep(0.1)  # Wait for token availability
-
     async def _execute_with_retry(
         self,
         api_call: Callable[[], Any],
@@ -635,7 +942,7 @@ class TMDBClient:
         Returns:
             Dictionary containing client statistics
         """
-        return {
+        stats: dict[str, Any] = {
             "rate_limiter": {
                 "tokens_available": self.rate_limiter.get_tokens_available(),
                 "capacity": self.rate_limiter.capacity,
@@ -647,14 +954,32 @@ class TMDBClient:
                 "concurrency_limit": self.semaphore_manager.concurrency_limit,
             },
             "state_machine": self.state_machine.get_stats(),
+            "request_lanes": self.lane_scheduler.get_stats(),
+            "prefix_cache": {
+                "size": len(self._prefix_cache),
+                "max_size": TMDBConfig.PREFIX_CACHE_MAX_SIZE,
+                "fallback_mode": self.config.api.tmdb.prefix_fallback_mode,
+            },
+            "details_cache": {
+                "size": len(self._details_cache),
+                "max_size": TMDBConfig.DETAILS_CACHE_MAX_SIZE,
+            },
         }
+        transport_stats = getattr(self.transport, "get_stats", None)
+        if callable(transport_stats):
+            stats["transport"] = transport_stats()
+        return stats
 
     def reset(self) -> None:
         """Reset all client components to initial state.
 
         This method resets the rate limiter, semaphore manager, and state machine
-        to their initial states, useful for testing or recovery scenarios.
+        to their initial states and clears the prefix and details caches, useful
+        for testing or recovery scenarios.
         """
         self.rate_limiter.reset()
         self.state_machine.reset()
+        self.lane_scheduler.reset_stats()
+        self._prefix_cache.clear()
+        self._details_cache.clear()
         # Note: SemaphoreManager doesn't have a reset method as it's stateless
@@ -33,6 +33,34 @@ from anivault.shared.utils.dataclass_serialization import from_dict
 logger = logging.getLogger(__name__)
 
 
+def _flatten_appended_resources(data: dict[str, Any]) -> None:
+    """Flatten append_to_response sub-resources into TMDBMediaDetails fields (in place).
+
+    TMDB nests appended resources differently per media type:
+    - alternative_titles: ``{"results": [...]}`` for TV, ``{"titles": [...]}`` for movies
+    - external_ids: ``{"imdb_id": "tt..", "tvdb_id": 123, ...}``
+
+    Args:
+        data: Raw details dict (modified in place)
+    """
+    alternative_titles = data.get("alternative_titles")
+    if isinstance(alternative_titles, dict):
+        entries = alternative_titles.get("results") or alternative_titles.get("titles") or []
+        titles = [entry.get("title") for entry in entries if isinstance(entry, dict)]
+        data["alternative_titles"] = list(dict.fromkeys(t for t in titles if t))
+    elif not isinstance(alternative_titles, list):
+        data.pop("alternative_titles", None)
+
+    external_ids = data.get("external_ids")
+    if isinstance(external_ids, dict):
+        data["external_ids"] = {key: str(value) for key, value in external_ids.items() if value not in (None, "")}
+    else:
+        data.pop("external_ids", None)
+
+    if not isinstance(data.get("seasons"), list):
+        data.pop("seasons", None)
+
+
 class SearchStrategy(ABC):
     """Abstract base class for TMDB search strategies.
 
@@ -60,6 +88,20 @@ class SearchStrategy(ABC):
             List of search results
         """
 
+    async def search_with_status(self, title: str) -> tuple[list[TMDBSearchResult], bool]:
+        """Search like ``search`` and report whether the API call succeeded.
+
+        ``search`` returns ``[]`` both for "no results" and for a failed call
+        (rate limit, timeout); callers caching results need to tell them apart.
+
+        Args:
+            title: Title to search for
+
+        Returns:
+            Tuple of (search results, False if the search failed)
+        """
+        return await self.search(title), True
+
     def _to_search_result(self, raw_result: Any) -> TMDBSearchResult:
         """Convert raw API result to TMDBSearchResult model.
 
@@ -117,9 +159,13 @@ class SearchStrategy(ABC):
             TMDBMediaDetails dataclass or None if validation fails
         """
         try:
-            # Convert to dict if needed
+            # Convert to dict if needed (prefer the raw JSON kept by tmdbv3api AsObj,
+            # so nested sub-resources stay plain dicts/lists)
+            raw_json = getattr(raw_result, "_json", None)
             if isinstance(raw_result, dict):
-                data = raw_result
+                data = dict(raw_result)
+            elif isinstance(raw_json, dict):
+                data = dict(raw_json)
             elif hasattr(raw_result, "__dict__"):
                 data = {k: v for k, v in raw_result.__dict__.items() if not k.startswith("_")}
             elif hasattr(raw_result, "get"):
@@ -131,6 +177,8 @@ class SearchStrategy(ABC):
                 )
                 return None
 
+            _flatten_appended_resources(data)
+
             # Convert to dataclass using from_dict
             return cast("TMDBMediaDetails", from_dict(TMDBMediaDetails, data))
 
@@ -166,15 +214,20 @@ class TvSearchStrategy(SearchStrategy):
             title: TV show title to search for
 
         Returns:
-            List of TV show search results
+            List of TV show search results (empty on error)
         """
+        results, _ = await self.search_with_status(title)
+        return results
+
+    async def search_with_status(self, title: str) -> tuple[list[TMDBSearchResult], bool]:
+        """Search for TV shows; report whether the API call succeeded (see SearchStrategy)."""
         try:
             # Call TMDB TV search API
             raw_results = await self._request_executor(lambda: self._tv_api.search(title))
 
             if not raw_results or not hasattr(raw_results, "results"):
                 logger.debug("No TV results found for '%s'", title)
-                return []
+                return [], True
 
             # Convert each result to TMDBSearchResult
             results = []
@@ -187,7 +240,7 @@ class TvSearchStrategy(SearchStrategy):
                     continue
 
             logger.debug("TV search for '%s' returned %d results", title, len(results))
-            return results
+            return results, True
 
         except (ConnectionError, TimeoutError) as e:
             context = ErrorContextModel(
@@ -209,7 +262,7 @@ class TvSearchStrategy(SearchStrategy):
                     original_error=e,
                 )
             logger.exception("TV search failed for '%s'", title)
-            return []
+            return [], False
         # pylint: disable-next=broad-exception-caught
 
         # pylint: disable-next=broad-exception-caught
@@ -221,7 +274,7 @@ class TvSearchStrategy(SearchStrategy):
                 additional_data={"title": title, "error_type": type(e).__name__},
             )
             logger.exception("TV search failed for '%s'", title)
-            return []
+            return [], False
 
 
 class MovieSearchStrategy(SearchStrategy):
@@ -248,15 +301,20 @@ class MovieSearchStrategy(SearchStrategy):
             title: Movie title to search for
 
         Returns:
-            List of movie search results
+            List of movie search results (empty on error)
         """
+        results, _ = await self.search_with_status(title)
+        return results
+
+    async def search_with_status(self, title: str) -> tuple[list[TMDBSearchResult], bool]:
+        """Search for movies; report whether the API call succeeded (see SearchStrategy)."""
         try:
             # Call TMDB Movie search API
             raw_results = await self._request_executor(lambda: self._movie_api.search(title))
 
             if not raw_results or not hasattr(raw_results, "results"):
                 logger.debug("No movie results found for '%s'", title)
-                return []
+                return [], True
 
             # Convert each result to TMDBSearchResult
             results = []
@@ -269,7 +327,7 @@ class MovieSearchStrategy(SearchStrategy):
                     continue
 
             logger.debug("Movie search for '%s' returned %d results", title, len(results))
-            return results
+            return results, True
 
         except (ConnectionError, TimeoutError) as e:
             context = ErrorContextModel(
@@ -291,7 +349,7 @@ class MovieSearchStrategy(SearchStrategy):
                     original_error=e,
                 )
             logger.exception("Movie search failed for '%s'", title)
-            return []
+            return [], False
         except Exception:  # pylint: disable=broad-exception-caught
             logger.exception("Movie search failed for '%s'", title)
-            return []
+            return [], False
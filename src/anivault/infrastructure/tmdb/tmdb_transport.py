@@ -0,0 +1,360 @@
+"""Record/replay transports for TMDB requests.
+
+TMDBClient normally talks to TMDB through tmdbv3api's ``TV``/``Movie``
+objects. A transport replaces that layer so matching benchmarks can run
+without network access:
+
+- ``RecordingTransport`` forwards calls to the live API and captures every
+  search/details response into a compact gzip JSON fixture.
+- ``ReplayTransport`` serves responses from such a fixture with configurable
+  synthetic latency, jitter and injected 429 responses, so throughput and
+  rate limiter / state machine behavior can be measured deterministically.
+
+Example:
+    >>> transport = ReplayTransport("fixtures/tmdb.json.gz", latency=0.05, rate_429=0.02)
+    >>> client = TMDBClient(transport=transport)
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import logging
+import random
+import threading
+import time
+from pathlib import Path
+from typing import Any, Protocol
+
+from tmdbv3api import TV, Movie
+from tmdbv3api.as_obj import AsObj
+from tmdbv3api.exceptions import TMDbException
+
+from anivault.shared.constants import Encoding, HTTPStatusCodes, MediaType
+from anivault.shared.errors import ErrorCode, ErrorContext, InfrastructureError
+
+logger = logging.getLogger(__name__)
+
+FIXTURE_FORMAT_VERSION = 1
+
+
+class TMDBTransport(Protocol):
+    """Low-level TMDB request layer used by TMDBClient.
+
+    Methods are synchronous and may block; TMDBClient runs them in a worker
+    thread and raises TMDbException-based errors through its retry logic.
+    """
+
+    def search(self, media_type: str, query: str) -> Any:
+        """Search TV shows or movies; returns an object with ``results``."""
+        ...  # pylint: disable=unnecessary-ellipsis
+
+    def details(self, media_type: str, media_id: int, append_to_response: str) -> Any:
+        """Get media details (with appended sub-resources)."""
+        ...  # pylint: disable=unnecessary-ellipsis
+
+
+class TransportMediaAPI:
+    """tmdbv3api-compatible ``TV``/``Movie`` facade backed by a transport.
+
+    Search strategies and TMDBClient call ``search(term)`` and
+    ``details(id, append_to_response=...)`` on this object exactly as they
+    would on tmdbv3api's ``TV``/``Movie``.
+
+    Args:
+        transport: Transport that executes the requests
+        media_type: MediaType.TV or MediaType.MOVIE
+    """
+
+    def __init__(self, transport: TMDBTransport, media_type: str):
+        """Initialize the facade.
+
+        Args:
+            transport: Transport that executes the requests
+            media_type: MediaType.TV or MediaType.MOVIE
+        """
+        self._transport = transport
+        self._media_type = media_type
+
+    def search(self, term: str) -> Any:
+        """Search for media of this facade's type."""
+        return self._transport.search(self._media_type, term)
+
+    def details(self, media_id: int, append_to_response: str = "") -> Any:
+        """Get details for a media id of this facade's type."""
+        return self._transport.details(self._media_type, media_id, append_to_response)
+
+
+class LiveTMDBTransport:
+    """Transport backed by tmdbv3api (real network requests).
+
+    ``TV``/``Movie`` objects are created lazily so that the TMDb
+    configuration (API key, language) set up by TMDBClient applies to them.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the live transport."""
+        self._apis: dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def _api(self, media_type: str) -> Any:
+        with self._lock:
+            if media_type not in self._apis:
+                self._apis[media_type] = TV() if media_type == MediaType.TV else Movie()
+            return self._apis[media_type]
+
+    def search(self, media_type: str, query: str) -> Any:
+        """Search TV shows or movies via tmdbv3api."""
+        return self._api(media_type).search(query)
+
+    def details(self, media_type: str, media_id: int, append_to_response: str) -> Any:
+        """Get media details via tmdbv3api."""
+        return self._api(media_type).details(media_id, append_to_response=append_to_response)
+
+
+def _search_key(media_type: str, query: str) -> str:
+    return f"search|{media_type}|{query}"
+
+
+def _details_key(media_type: str, media_id: int, append_to_response: str) -> str:
+    return f"details|{media_type}|{media_id}|{append_to_response}"
+
+
+def _raw_json(response: Any) -> Any:
+    """Extract the JSON payload from a tmdbv3api response object."""
+    payload = getattr(response, "_json", None)
+    if isinstance(payload, (dict, list)):
+        return payload
+    if isinstance(response, (dict, list)):
+        return response
+    return {}
+
+
+class RecordingTransport:
+    """Transport that forwards to another transport and records responses.
+
+    Errors are not recorded, so a replay reproduces only successful calls;
+    use ``ReplayTransport.rate_429`` to inject failures instead.
+
+    Args:
+        fixture_path: Where ``save()`` writes the fixture (``.json.gz``)
+        inner: Transport to forward to (defaults to LiveTMDBTransport)
+    """
+
+    def __init__(self, fixture_path: Path | str, inner: TMDBTransport | None = None):
+        """Initialize the recording transport.
+
+        Args:
+            fixture_path: Where ``save()`` writes the fixture (``.json.gz``)
+            inner: Transport to forward to (defaults to LiveTMDBTransport)
+        """
+        self.fixture_path = Path(fixture_path)
+        self.inner: TMDBTransport = inner or LiveTMDBTransport()
+        self._entries: dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def search(self, media_type: str, query: str) -> Any:
+        """Forward a search and record its response."""
+        response = self.inner.search(media_type, query)
+        self._record(_search_key(media_type, query), response)
+        return response
+
+    def details(self, media_type: str, media_id: int, append_to_response: str) -> Any:
+        """Forward a details request and record its response."""
+        response = self.inner.details(media_type, media_id, append_to_response)
+        self._record(_details_key(media_type, media_id, append_to_response), response)
+        return response
+
+    def _record(self, key: str, response: Any) -> None:
+        with self._lock:
+            self._entries[key] = _raw_json(response)
+
+    def __len__(self) -> int:
+        """Number of recorded responses."""
+        with self._lock:
+            return len(self._entries)
+
+    def save(self) -> Path:
+        """Write recorded responses to the fixture file.
+
+        Returns:
+            Path of the written fixture
+        """
+        with self._lock:
+            data = {"version": FIXTURE_FORMAT_VERSION, "entries": dict(self._entries)}
+
+        self.fixture_path.parent.mkdir(parents=True, exist_ok=True)
+        payload = json.dumps(data, ensure_ascii=False, separators=(",", ":"), sort_keys=True)
+        with gzip.open(self.fixture_path, "wt", encoding=Encoding.DEFAULT) as f:
+            f.write(payload)
+
+        logger.info("Saved %d TMDB responses to %s", len(self._entries), self.fixture_path)
+        return self.fixture_path
+
+
+class _SyntheticResponse:
+    """Minimal HTTP response attached to injected TMDbExceptions."""
+
+    def __init__(self, status_code: int, headers: dict[str, str]):
+        self.status_code = status_code
+        self.headers = headers
+
+
+class ReplayTransport:  # pylint: disable=too-many-instance-attributes
+    """Transport that serves recorded responses with synthetic network behavior.
+
+    Each call sleeps ``latency`` +/- ``jitter`` seconds (in the worker thread,
+    like real blocking I/O) and fails with a 429 response with probability
+    ``rate_429``. Randomness comes from a seeded generator, so the sequence
+    of delays and injected failures is reproducible for a given call order.
+
+    Searches missing from the fixture return an empty result list; missing
+    details raise TMDbException unless ``strict`` is set, in which case every
+    miss raises InfrastructureError so incomplete fixtures are caught early.
+
+    Args:
+        fixture_path: Fixture written by RecordingTransport
+        latency: Mean synthetic latency per call in seconds
+        jitter: Maximum deviation from the mean latency in seconds
+        rate_429: Probability (0-1) of answering a call with HTTP 429
+        retry_after: Retry-After header value sent with injected 429s
+        seed: Seed for the latency/429 random generator
+        strict: Raise on requests that are not in the fixture
+
+    Raises:
+        InfrastructureError: If the fixture cannot be read or parameters are invalid
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self,
+        fixture_path: Path | str,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        rate_429: float = 0.0,
+        retry_after: float | None = None,
+        seed: int = 0,
+        strict: bool = False,
+    ):
+        """Initialize the replay transport.
+
+        Args:
+            fixture_path: Fixture written by RecordingTransport
+            latency: Mean synthetic latency per call in seconds
+            jitter: Maximum deviation from the mean latency in seconds
+            rate_429: Probability (0-1) of answering a call with HTTP 429
+            retry_after: Retry-After header value sent with injected 429s
+            seed: Seed for the latency/429 random generator
+            strict: Raise on requests that are not in the fixture
+
+        Raises:
+            InfrastructureError: If the fixture cannot be read or parameters are invalid
+        """
+        if latency < 0 or jitter < 0 or not 0.0 <= rate_429 <= 1.0:
+            raise InfrastructureError(
+                code=ErrorCode.VALIDATION_ERROR,
+                message="Invalid replay transport parameters",
+                context=ErrorContext(
+                    operation="replay_transport_init",
+                    additional_data={"latency": latency, "jitter": jitter, "rate_429": rate_429},
+                ),
+            )
+
+        self.fixture_path = Path(fixture_path)
+        self.latency = latency
+        self.jitter = jitter
+        self.rate_429 = rate_429
+        self.retry_after = retry_after
+        self.strict = strict
+        self._entries = self._load(self.fixture_path)
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._stats = {"requests": 0, "hits": 0, "misses": 0, "injected_429": 0, "sleep_seconds": 0.0}
+
+    @staticmethod
+    def _load(fixture_path: Path) -> dict[str, Any]:
+        try:
+            with gzip.open(fixture_path, "rt", encoding=Encoding.DEFAULT) as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            raise InfrastructureError(
+                code=ErrorCode.FILE_READ_ERROR,
+                message=f"Failed to read TMDB replay fixture: {fixture_path}",
+                context=ErrorContext(
+                    operation="replay_transport_load",
+                    additional_data={"fixture_path": str(fixture_path)},
+                ),
+                original_error=e,
+            ) from e
+
+        if not isinstance(data, dict) or data.get("version") != FIXTURE_FORMAT_VERSION:
+            raise InfrastructureError(
+                code=ErrorCode.VALIDATION_ERROR,
+                message=f"Unsupported TMDB replay fixture format: {fixture_path}",
+                context=ErrorContext(
+                    operation="replay_transport_load",
+                    additional_data={"fixture_path": str(fixture_path)},
+                ),
+            )
+        return dict(data.get("entries", {}))
+
+    def search(self, media_type: str, query: str) -> Any:
+        """Replay a recorded search response."""
+        payload = self._replay(_search_key(media_type, query))
+        if payload is None:
+            payload = {"page": 1, "results": [], "total_pages": 0, "total_results": 0}
+        return AsObj(payload, key="results")
+
+    def details(self, media_type: str, media_id: int, append_to_response: str) -> Any:
+        """Replay a recorded details response."""
+        payload = self._replay(_details_key(media_type, media_id, append_to_response))
+        if payload is None:
+            # Same shape as tmdbv3api's error for unknown ids
+            raise TMDbException("The resource you requested could not be found.")
+        return AsObj(payload)
+
+    def _replay(self, key: str) -> Any:
+        with self._lock:
+            delay = self.latency + self._random.uniform(-self.jitter, self.jitter) if self.jitter else self.latency
+            inject_429 = self.rate_429 > 0 and self._random.random() < self.rate_429
+            self._stats["requests"] += 1
+            self._stats["sleep_seconds"] += max(0.0, delay)
+
+        if delay > 0:
+            time.sleep(delay)
+
+        if inject_429:
+            with self._lock:
+                self._stats["injected_429"] += 1
+            headers = {} if self.retry_after is None else {"Retry-After": str(self.retry_after)}
+            error = TMDbException("Rate limit reached (injected by ReplayTransport)")
+            error.response = _SyntheticResponse(HTTPStatusCodes.TOO_MANY_REQUESTS, headers)
+            raise error
+
+        payload = self._entries.get(key)
+        with self._lock:
+            self._stats["hits" if payload is not None else "misses"] += 1
+
+        if payload is None and self.strict:
+            raise InfrastructureError(
+                code=ErrorCode.TMDB_API_REQUEST_FAILED,
+                message=f"Request not found in replay fixture: {key}",
+                context=ErrorContext(
+                    operation="replay_transport_request",
+                    additional_data={"key": key, "fixture_path": str(self.fixture_path)},
+                ),
+            )
+        return payload
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get replay counters (requests, hits, misses, injected 429s, slept seconds)."""
+        with self._lock:
+            return dict(self._stats)
+
+
+__all__ = [
+    "LiveTMDBTransport",
+    "RecordingTransport",
+    "ReplayTransport",
+    "TMDBTransport",
+    "TransportMediaAPI",
+]
@@ -0,0 +1,152 @@
+"""Match-cache command handler for AniVault CLI.
+
+Orchestration entry point: Container → MatchCacheUseCase → console/JSON output.
+"""
+
+from __future__ import annotations
+
+import logging
+import sys
+from typing import Any
+
+import typer
+from dependency_injector.wiring import Provide, inject
+from rich.console import Console
+from rich.table import Table
+
+from anivault.application.use_cases.match_cache_use_case import MatchCacheUseCase
+from anivault.infrastructure.composition import Container
+from anivault.presentation.cli.common.context import get_cli_context
+from anivault.presentation.cli.common.error_decorator import handle_cli_errors
+from anivault.presentation.cli.common.setup_decorator import setup_handler
+from anivault.presentation.cli.json_formatter import format_json_output
+from anivault.shared.constants import CLI, CLICommands, CLIDefaults, MatchCacheCommands
+from anivault.shared.types.cli import MatchCacheOptions
+
+logger = logging.getLogger(__name__)
+
+
+@inject
+def _run_match_cache(
+    options: MatchCacheOptions,
+    *,
+    use_case: MatchCacheUseCase = Provide[Container.match_cache_use_case],
+) -> dict[str, Any]:
+    """Execute the requested match-cache command via MatchCacheUseCase."""
+    if options.cache_command == MatchCacheCommands.LIST:
+        return {"current_version": use_case.current_version, "entries": use_case.list_entries(options.limit)}
+    if options.cache_command == MatchCacheCommands.CLEAR:
+        return {"current_version": use_case.current_version, "removed": use_case.clear()}
+    if options.cache_command == MatchCacheCommands.PURGE:
+        return {"current_version": use_case.current_version, "removed": use_case.purge_stale()}
+    return use_case.info()
+
+
+def _print_info(console: Console, info: dict[str, Any]) -> None:
+    """Render cache summary."""
+    console.print(f"[bold]Match decision cache[/bold] ({info['database_path']})")
+    console.print(f"  Current version: {info['current_version']}")
+    console.print(f"  Entries: {info['total_entries']} (current: {info['current_entries']}, stale: {info['stale_entries']})")
+    if info["stale_entries"]:
+        console.print(f"  [yellow]Run 'anivault {CLICommands.MATCH_CACHE} {MatchCacheCommands.PURGE}' to remove stale entries[/yellow]")
+
+
+def _print_entries(console: Console, entries: list[dict[str, Any]]) -> None:
+    """Render cached decisions as a table."""
+    if not entries:
+        console.print("[yellow]No cached match decisions[/yellow]")
+        return
+
+    table = Table(title="Cached Match Decisions")
+    table.add_column("Query", style="cyan")
+    table.add_column("Year")
+    table.add_column("TMDB ID", justify="right")
+    table.add_column("Title", style="green")
+    table.add_column("Confidence", justify="right")
+    table.add_column("Version")
+    for entry in entries:
+        version = entry["decision_version"]
+        table.add_row(
+            entry["query_title"],
+            str(entry["query_year"] or ""),
+            f"{entry['media_type']}/{entry['tmdb_id']}",
+            entry["title"],
+            f"{entry['confidence_score']:.3f}",
+            f"[dim]{version} (stale)[/dim]" if entry["stale"] else version,
+        )
+    console.print(table)
+
+
+@setup_handler(supports_json=True)
+@handle_cli_errors(operation="handle_match_cache", command_name=CLICommands.MATCH_CACHE)
+def handle_match_cache_command(options: MatchCacheOptions, **kwargs: Any) -> int:
+    """Handle the match-cache command.
+
+    Args:
+        options: Validated match-cache command options
+        **kwargs: Injected by decorators (console, logger_adapter)
+
+    Returns:
+        Exit code (0 for success, non-zero for error)
+    """
+    console: Console = kwargs.get("console") or Console()
+    logger_adapter = kwargs.get("logger_adapter", logger)
+
+    logger_adapter.info(CLI.INFO_COMMAND_STARTED.format(command=CLICommands.MATCH_CACHE))
+
+    payload = _run_match_cache(options)
+
+    context = get_cli_context()
+    if context and context.is_json_output_enabled():
+        output = format_json_output(success=True, command=CLICommands.MATCH_CACHE, data=payload)
+        sys.stdout.buffer.write(output)
+        sys.stdout.buffer.write(b"\n")
+        sys.stdout.buffer.flush()
+    elif options.cache_command == MatchCacheCommands.LIST:
+        _print_entries(console, payload["entries"])
+    elif options.cache_command in (MatchCacheCommands.CLEAR, MatchCacheCommands.PURGE):
+        console.print(f"[green]Removed {payload['removed']} cached match decisions[/green]")
+    else:
+        _print_info(console, payload)
+
+    logger_adapter.info(CLI.INFO_COMMAND_COMPLETED.format(command=CLICommands.MATCH_CACHE))
+    return CLIDefaults.EXIT_SUCCESS
+
+
+def match_cache_command(
+    command: str = typer.Argument(
+        MatchCacheCommands.INFO,
+        help="Match cache command to execute (info, list, clear, purge)",
+    ),
+    limit: int = typer.Option(
+        20,
+        "--limit",
+        help="Maximum number of entries to list",
+    ),
+) -> None:
+    """Inspect or clear cached match decisions.
+
+    Examples:
+        # Show entry counts per decision version
+        anivault match-cache info
+
+        # List the 50 most recent decisions
+        anivault match-cache list --limit 50
+
+        # Remove decisions made under outdated weights/strategies
+        anivault match-cache purge
+
+        # Remove all cached decisions
+        anivault match-cache clear
+    """
+    try:
+        options = MatchCacheOptions(cache_command=command, limit=limit)
+
+        exit_code = handle_match_cache_command(options)
+
+        if exit_code != CLIDefaults.EXIT_SUCCESS:
+            raise typer.Exit(exit_code)
+
+    except ValueError as e:
+        typer.echo(f"Error: {e}", err=True)
+        raise typer.Exit(CLIDefaults.EXIT_ERROR) from e
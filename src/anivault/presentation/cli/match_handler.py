@@ -72,6 +72,7 @@ async def _execute_match(
             directory,
             extensions=tuple(FileSystem.CLI_VIDEO_EXTENSIONS),
             concurrency=4,
+            incremental=options.incremental,
         )
 
 
@@ -176,6 +177,11 @@ def match_command(  # pylint: disable=too-many-arguments,too-many-positional-arg
         "--json",
         help="Output results in JSON format",
     ),
+    incremental: bool = typer.Option(
+        False,
+        "--incremental",
+        help="Only match new, modified or previously unmatched files",
+    ),
 ) -> None:
     """Match anime files against TMDB database.
 
@@ -187,6 +193,7 @@ def match_command(  # pylint: disable=too-many-arguments,too-many-positional-arg
         anivault match .
         anivault match /path/to/anime --recursive --output match_results.json
         anivault match /path/to/anime --json
+        anivault match /path/to/anime --incremental
     """
     try:
         context = get_cli_context()
@@ -198,6 +205,7 @@ def match_command(  # pylint: disable=too-many-arguments,too-many-positional-arg
             include_metadata=include_metadata,
             output=output_file,
             json_output=json_output,
+            incremental=incremental,
             verbose=bool(context.verbose) if context else False,
         )
 
@@ -63,6 +63,7 @@ def _build_run_data(options: RunOptions, directory: Path) -> dict[str, Any]:
             "skip_scan": options.skip_scan,
             "skip_match": options.skip_match,
             "skip_organize": options.skip_organize,
+            "incremental": options.incremental,
             "max_workers": options.max_workers,
             "batch_size": options.batch_size,
         },
@@ -272,6 +273,11 @@ def run_command(  # pylint: disable=too-many-arguments,too-many-positional-argum
         "--json",
         help="Output results in JSON format",
     ),
+    incremental: bool = typer.Option(
+        False,
+        "--incremental",
+        help="Only match new, modified or previously unmatched files",
+    ),
 ) -> None:
     """Run the complete anime organization workflow (scan, match, organize).
 
@@ -311,6 +317,9 @@ def run_command(  # pylint: disable=too-many-arguments,too-many-positional-argum
 
         # Run and output results in JSON format
         anivault run /path/to/anime --json
+
+        # Re-run after adding files: only new/changed/unmatched files are matched
+        anivault run /path/to/anime --incremental
     """
     try:
         context = get_cli_context()
@@ -323,6 +332,7 @@ def run_command(  # pylint: disable=too-many-arguments,too-many-positional-argum
             dry_run=dry_run,
             yes=yes,
             json_output=bool(json),
+            incremental=incremental,
             verbose=context.verbose if context else 0,
             output=output_file,
         )
@@ -26,6 +26,7 @@ from anivault.presentation.cli.common.options import (
 )
 from anivault.presentation.cli.common.validation import create_validator
 from anivault.presentation.cli.log_handler import log_command
+from anivault.presentation.cli.match_cache_handler import match_cache_command
 from anivault.presentation.cli.match_handler import match_command
 from anivault.presentation.cli.organize_handler import organize_command
 from anivault.presentation.cli.run_handler import run_command
@@ -64,6 +65,7 @@ def get_container() -> Container:
             modules=[
                 "anivault.presentation.cli.scan_handler",
                 "anivault.presentation.cli.match_handler",
+                "anivault.presentation.cli.match_cache_handler",
                 "anivault.presentation.cli.organize_handler",
             ]
         )
@@ -277,6 +279,11 @@ def match_command_typer(  # pylint: disable=too-many-arguments,too-many-position
         CLIOptions.JSON,
         help="Output results in JSON format",
     ),
+    incremental: bool = typer.Option(
+        False,
+        CLIOptions.INCREMENTAL,
+        help=CLIHelp.MATCH_INCREMENTAL_HELP,
+    ),
 ) -> None:
     """
     Match anime files against TMDB database.
@@ -312,6 +319,9 @@ def match_command_typer(  # pylint: disable=too-many-arguments,too-many-position
 
         # Match and output results in JSON format
         anivault match /path/to/anime --json
+
+        # Re-match only new, modified or previously unmatched files
+        anivault match /path/to/anime --incremental
     """
     # Call the match command
     match_command(
@@ -321,6 +331,7 @@ def match_command_typer(  # pylint: disable=too-many-arguments,too-many-position
         include_metadata,
         output_file,
         json_output,
+        incremental=incremental,
     )
 
 
@@ -430,6 +441,11 @@ def run_command_typer(  # pylint: disable=too-many-arguments,too-many-positional
         CLIOptions.JSON,
         help=CLIHelp.RUN_JSON_HELP,
     ),
+    incremental: bool = typer.Option(
+        False,
+        CLIOptions.INCREMENTAL,
+        help=CLIHelp.RUN_INCREMENTAL_HELP,
+    ),
 ) -> None:
     """
     Run the complete anime organization workflow (scan, match, organize).
@@ -470,6 +486,9 @@ def run_command_typer(  # pylint: disable=too-many-arguments,too-many-positional
 
         # Run and output results in JSON format
         anivault run /path/to/anime --json
+
+        # Re-run after adding files: only new/changed/unmatched files are matched
+        anivault run /path/to/anime --incremental
     """
     # Call the run command
     run_command(
@@ -480,6 +499,7 @@ def run_command_typer(  # pylint: disable=too-many-arguments,too-many-positional
         output_file,
         dry_run,
         yes,
+        incremental=incremental,
     )
 
 
@@ -522,6 +542,42 @@ def log_command_typer(
     log_command(command, log_dir)
 
 
+@app.command(CLICommands.MATCH_CACHE)
+def match_cache_command_typer(
+    command: str = typer.Argument(
+        "info",
+        help=CLIHelp.MATCH_CACHE_COMMAND_HELP,
+    ),
+    limit: int = typer.Option(
+        20,
+        CLIOptions.LIMIT,
+        help=CLIHelp.MATCH_CACHE_LIMIT_HELP,
+    ),
+) -> None:
+    """
+    Inspect or clear cached match decisions.
+
+    Final match decisions are cached per normalized title/year. Entries are
+    keyed by a version of the matching weights and fallback strategies, so a
+    configuration change makes old entries stale (never read); 'purge'
+    removes them.
+
+    Examples:
+        # Show entry counts (current vs. stale)
+        anivault match-cache info
+
+        # List the 50 most recent decisions
+        anivault match-cache list --limit 50
+
+        # Remove decisions made under outdated weights/strategies
+        anivault match-cache purge
+
+        # Remove all cached decisions
+        anivault match-cache clear
+    """
+    match_cache_command(command, limit)
+
+
 @app.command(CLICommands.VERIFY)
 def verify_command_typer(
     tmdb: bool = typer.Option(
@@ -24,6 +24,7 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from anivault.shared.constants import RequestPriority
 from anivault.shared.models.api.tmdb import TMDBSearchResult
 from anivault.domain.entities.metadata import FileMetadata
 
@@ -48,12 +49,20 @@ class TmdbSearchWorker(QThread):
             return
 
         try:
-            response = asyncio.run(self._tmdb_client.search_media(self._query))
+            response = asyncio.run(self._search())
             self.finished.emit(response.results if response else [])
         except Exception as exc:
             logger.exception("TMDB search failed for '%s'", self._query)
             self.error.emit(str(exc))
 
+    async def _search(self) -> object:
+        """Search in the interactive lane so it is not queued behind bulk matching."""
+        request_priority = getattr(self._tmdb_client, "request_priority", None)
+        if request_priority is None:
+            return await self._tmdb_client.search_media(self._query)
+        with request_priority(RequestPriority.INTERACTIVE):
+            return await self._tmdb_client.search_media(self._query)
+
 
 class TmdbManualSearchDialog(QDialog):
     """Dialog for manual TMDB search and selection."""
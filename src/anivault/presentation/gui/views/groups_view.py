@@ -10,7 +10,7 @@ from PySide6.QtCore import QThread, Signal
 from PySide6.QtWidgets import QGridLayout, QScrollArea, QWidget
 
 if TYPE_CHECKING:
-    from anivault.application.use_cases.build_groups_use_case import BuildGroupsUseCase
+    from anivault.application.use_cases.build_groups_use_case import BuildGroupsUseCase, GroupsBuildState
 
 from anivault.presentation.gui.views.base_view import BaseView
 from anivault.presentation.gui.widgets.group_card import GroupCard
@@ -38,6 +38,8 @@ class GroupsView(BaseView):
         super().__init__(parent)
         self._build_groups_use_case_factory = build_groups_use_case_factory
         self._groups: list[dict] = []
+        # State of the last completed build (lets the next build re-group only changed files)
+        self._groups_build_state: GroupsBuildState | None = None
         self._groups_build_thread: QThread | None = None
         self._groups_build_worker: GroupsBuildWorker | None = None
         self._setup_ui()
@@ -98,6 +100,7 @@ class GroupsView(BaseView):
         )
         if not files:
             logger.warning("Empty file list received, clearing groups")
+            self._groups_build_state = None
             self.set_groups([])
             return
 
@@ -114,8 +117,8 @@ class GroupsView(BaseView):
         # Disconnect and cleanup previous worker if any
         self._cleanup_groups_build_worker()
 
-        # Full rebuild: run grouping off main thread to prevent UI freeze
-        worker = GroupsBuildWorker(files, uc)
+        # Rebuild (incremental against the last build): run grouping off main thread to prevent UI freeze
+        worker = GroupsBuildWorker(files, uc, self._groups_build_state)
         thread = QThread()
         worker.moveToThread(thread)
         thread.started.connect(worker.run)
@@ -150,6 +153,8 @@ class GroupsView(BaseView):
     def _on_groups_built(self, groups: list[dict]) -> None:
         """Handle groups build completion (runs on main thread via Qt signal)."""
         logger.info("Received %d groups from worker", len(groups))
+        if self._groups_build_worker is not None:
+            self._groups_build_state = self._groups_build_worker.build_state
         self.set_groups(groups)
         self.groups_build_finished.emit()
         # Do NOT clear _groups_build_worker/thread here - wait for thread.finished
@@ -157,6 +162,7 @@ class GroupsView(BaseView):
     def _on_groups_build_error(self, error: object) -> None:
         """Handle groups build error (runs on main thread via Qt signal)."""
         logger.warning("Groups build failed: %s", error)
+        self._groups_build_state = None
         self.set_groups([])
         self.groups_build_finished.emit()
         # Do NOT clear here - wait for thread.finished (thread.quit was connected)
@@ -1,6 +1,7 @@
 """Groups build worker for GUI v2.
 
-Runs group build off the main thread via BuildGroupsUseCase.
+Runs group build off the main thread via BuildGroupsUseCase (incremental:
+only files changed since the previous build are re-grouped).
 Worker only relays progress/finished/error; all grouping logic lives in the use case.
 """
 
@@ -10,7 +11,7 @@ import logging
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from anivault.application.use_cases.build_groups_use_case import BuildGroupsUseCase
+    from anivault.application.use_cases.build_groups_use_case import BuildGroupsUseCase, GroupsBuildState
 
 from anivault.presentation.gui.models import OperationError, OperationProgress
 from anivault.presentation.gui.workers.base_worker import BaseWorker
@@ -20,16 +21,22 @@ logger = logging.getLogger(__name__)
 
 
 class GroupsBuildWorker(BaseWorker):
-    """Worker that builds group display data from FileMetadata (off main thread)."""
+    """Worker that builds group display data from FileMetadata (off main thread).
+
+    After ``finished``, ``build_state`` holds the state to pass to the next build.
+    """
 
     def __init__(
         self,
         files: list[FileMetadata],
         build_groups_use_case: BuildGroupsUseCase,
+        previous_state: GroupsBuildState | None = None,
     ) -> None:
         super().__init__()
         self._files = files
         self._build_groups_use_case = build_groups_use_case
+        self._previous_state = previous_state
+        self.build_state: GroupsBuildState | None = None
 
     def run(self) -> None:
         """Build groups from FileMetadata and emit finished(groups)."""
@@ -64,8 +71,9 @@ class GroupsBuildWorker(BaseWorker):
         )
 
         try:
-            groups = self._build_groups_use_case.execute(
+            groups, self.build_state = self._build_groups_use_case.execute_incremental(
                 self._files,
+                self._previous_state,
                 progress_callback=on_progress,
             )
             logger.info(
@@ -15,7 +15,7 @@ Recommended imports (domain-specific, reduces load):
 """
 
 # Import all constant classes for direct access
-from .api import APIConfig, CacheValidationConstants, TMDBConfig
+from .api import APIConfig, CacheValidationConstants, PrefixFallbackMode, RequestPriority, TMDBConfig
 from .api_fields import APIFields
 from .cache import (
     APICacheConfig,
@@ -37,6 +37,7 @@ from .cli import (
     DateFormats,
     LogCommands,
     LogJsonKeys,
+    MatchCacheCommands,
     QueueConfig,
     RunDefaults,
     WorkerConfig,
@@ -73,6 +74,7 @@ from .matching import (
     DefaultLanguage,
     FallbackStrategy,
     GenreConfig,
+    LocalTitleIndexConfig,
     MatchingAlgorithm,
     MatchingFieldNames,
     TitleNormalization,
@@ -162,6 +164,7 @@ __all__ = [
     "HTTPStatusCodes",
     "JsonKeys",
     "Language",
+    "LocalTitleIndexConfig",
     "LogCommands",
     "LogContextKeys",
     "LogFieldNames",
@@ -172,6 +175,7 @@ __all__ = [
     "LogPaths",
     "Logging",
     "LoggingConfig",
+    "MatchCacheCommands",
     "MatchingAlgorithm",
     "MatchingCacheConfig",
     "MatchingFieldNames",
@@ -184,10 +188,12 @@ __all__ = [
     "PerformanceLogging",
     "Pipeline",
     "PlaceholderTexts",
+    "PrefixFallbackMode",
     "Process",
     "ProcessingConfig",
     "ProgressMessages",
     "QueueConfig",
+    "RequestPriority",
     "RunDefaults",
     "ScanQueueMessageKind",
     "Status",
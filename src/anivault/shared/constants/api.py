@@ -5,7 +5,7 @@ This module contains all constants related to API configuration,
 rate limiting, and external service interactions.
 """
 
-from typing import ClassVar
+from typing import ClassVar, Final
 
 from .system import BASE_SECOND
 
@@ -61,6 +61,57 @@ class TMDBConfig(APIConfig):
     DEFAULT_PAGE = 1
     DEFAULT_INCLUDE_ADULT = False
 
+    # Title prefix fallback (search_media when the full title has no results)
+    PREFIX_FALLBACK_CONCURRENCY = 3  # prefix queries in flight at once (parallel mode)
+    PREFIX_CACHE_MAX_SIZE = 512  # in-memory LRU entries for prefix query results
+
+    # Details sub-resources fetched in the same request (append_to_response).
+    # Replaces tmdbv3api's heavy default (videos, images, credits, translations, ...).
+    # TV details already include "seasons" without appending.
+    TV_DETAILS_APPEND_TO_RESPONSE = ("alternative_titles", "external_ids")
+    MOVIE_DETAILS_APPEND_TO_RESPONSE = ("alternative_titles", "external_ids")
+    DETAILS_CACHE_MAX_SIZE = 2048  # in-memory LRU entries for media details
+
+    # Series groups matched concurrently by MatchUseCase (requests still go through the client limits)
+    MATCH_GROUP_CONCURRENCY = 8
+
+    # Request priority lanes (interactive GUI requests vs bulk matching)
+    INTERACTIVE_RESERVED_SLOTS = 1  # concurrency slots bulk requests never take
+    INTERACTIVE_TOKEN_SHARE = 0.2  # share of token bucket capacity bulk requests leave untouched
+    LANE_POLL_INTERVAL = 0.02 * BASE_SECOND  # admission polling interval in seconds
+
+
+class PrefixFallbackMode:
+    """Title prefix fallback modes for TMDBClient.search_media (single source of truth).
+
+    Used by infrastructure/tmdb/tmdb_client and config/models/api_settings.
+    """
+
+    # Final: typed as Literals, assignable to TMDBSettings.prefix_fallback_mode
+    SEQUENTIAL: Final = "sequential"  # one prefix at a time, stop at first 0-result prefix
+    PARALLEL: Final = "parallel"  # speculative window of prefixes, same result as sequential
+    BINARY: Final = "binary"  # binary search on prefix length (assumes results shrink monotonically)
+
+    @classmethod
+    def all_values(cls) -> tuple[str, ...]:
+        """Return all valid mode values for validation."""
+        return (cls.SEQUENTIAL, cls.PARALLEL, cls.BINARY)
+
+
+class RequestPriority:
+    """TMDB request priority lanes (single source of truth).
+
+    Used by infrastructure/request_lanes, infrastructure/tmdb/tmdb_client and the GUI.
+    """
+
+    INTERACTIVE = "interactive"  # user is waiting (manual search dialog)
+    BULK = "bulk"  # background matching / enrichment runs
+
+    @classmethod
+    def all_values(cls) -> tuple[str, ...]:
+        """Return all valid lane values for validation."""
+        return (cls.INTERACTIVE, cls.BULK)
+
 
 class CacheValidationConstants:
     """Validation constants for cache entry models."""
@@ -78,6 +78,9 @@ class NormalizationConfig:
         r"\([^)]*\)",
     ]
 
+    # Shared normalization memo (core.normalization.NormalizationCache)
+    CACHE_MAX_SIZE = 65536  # Entries across all stages (~10-20 MB worst case)
+
     # Compiled patterns cache (lazy initialization)
     _compiled_patterns: ClassVar[list[re.Pattern[str]] | None] = None
 
@@ -29,6 +29,7 @@ class BaseCacheConfig:
     TYPE_SEARCH = "search"
     TYPE_DETAILS = "details"
     TYPE_PARSER = "parser"
+    TYPE_MATCH = "match"
 
 
 class APICacheConfig(BaseCacheConfig):
@@ -85,11 +86,13 @@ class MatchingCacheConfig(BaseCacheConfig):
     SEARCH_CACHE_TTL = 7 * BASE_DAY  # 7 days
     DETAILS_CACHE_TTL = 30 * BASE_DAY  # 30 days
     PARSER_CACHE_TTL = BASE_DAY  # 24 hours (same as CoreCacheConfig.PARSER_CACHE_TTL)
+    MATCH_DECISION_TTL = 30 * BASE_DAY  # 30 days (same as details)
 
     # TTL in seconds (for SQLite cache operations)
     SEARCH_CACHE_TTL_SECONDS = int(SEARCH_CACHE_TTL)
     DETAILS_CACHE_TTL_SECONDS = int(DETAILS_CACHE_TTL)
     PARSER_CACHE_TTL_SECONDS = int(PARSER_CACHE_TTL)
+    MATCH_DECISION_TTL_SECONDS = int(MATCH_DECISION_TTL)
 
     # Matching-specific size limits
     MATCHING_CACHE_SIZE = 3000
@@ -98,6 +101,10 @@ class MatchingCacheConfig(BaseCacheConfig):
     CACHE_TYPE_SEARCH = "search"
     CACHE_TYPE_DETAILS = "details"
     CACHE_TYPE_PARTIAL_MATCH = "partial_match"
+    CACHE_TYPE_MATCH_DECISION = "match"
+
+    # Bump when the decision logic changes in a way weights/strategies don't capture
+    MATCH_DECISION_LOGIC_VERSION = 3
 
 
 class CacheValidationConstants:
@@ -14,6 +14,7 @@ from .config import (
     LogCommands,
     LogConfig,
     LogJsonKeys,
+    MatchCacheCommands,
     QueueConfig,
     RunDefaults,
     WorkerConfig,
@@ -34,6 +35,7 @@ __all__ = [
     "LogCommands",
     "LogConfig",
     "LogJsonKeys",
+    "MatchCacheCommands",
     "QueueConfig",
     "RunDefaults",
     "WorkerConfig",
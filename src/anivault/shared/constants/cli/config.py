@@ -66,6 +66,8 @@ class CLIOptions:
     FOLLOW = "--follow"
     TMDB = "--tmdb"
     ALL = "--all"
+    LIMIT = "--limit"
+    INCREMENTAL = "--incremental"
 
 
 class CLICommands:
@@ -76,6 +78,7 @@ class CLICommands:
     ORGANIZE = "organize"
     RUN = "run"
     LOG = "log"
+    MATCH_CACHE = "match-cache"
     VERIFY = "verify"
     INIT = "init"
 
@@ -109,6 +112,7 @@ class CLIHelp:
     MATCH_INCLUDE_METADATA_HELP = "Include metadata files in matching"
     MATCH_OUTPUT_HELP = "Output file for match results (JSON format)"
     MATCH_JSON_HELP = JSON_OUTPUT_HELP
+    MATCH_INCREMENTAL_HELP = "Only match new, modified or previously unmatched files; reuse stored results for the rest"
     ORGANIZE_HELP = "Organize anime files into structured directories"
     ORGANIZE_DIRECTORY_HELP = "Directory containing scanned and matched anime files to organize"
     ORGANIZE_DRY_RUN_HELP = "Show what would be organized without actually moving files"
@@ -141,8 +145,12 @@ class CLIHelp:
     RUN_DRY_RUN_HELP = "Show what would be processed without actually processing files"
     RUN_YES_HELP = "Skip confirmation prompts and proceed with processing"
     RUN_JSON_HELP = JSON_OUTPUT_HELP
+    RUN_INCREMENTAL_HELP = MATCH_INCREMENTAL_HELP
     LOG_HELP = "Manage operation logs"
     LOG_DIR_HELP = "Directory containing log files"
+    MATCH_CACHE_HELP = "Inspect or clear cached match decisions"
+    MATCH_CACHE_COMMAND_HELP = "Match cache command to execute (info, list, clear, purge)"
+    MATCH_CACHE_LIMIT_HELP = "Maximum number of entries to list"
     VERIFY_HELP = "Verify system components and connectivity"
     VERIFY_TMDB_HELP = "Verify TMDB API connectivity"
     VERIFY_ALL_HELP = "Verify all components"
@@ -218,6 +226,20 @@ class LogCommands:
     SHOW = "show"
 
 
+class MatchCacheCommands:
+    """Match-cache command subcommands."""
+
+    INFO = "info"
+    LIST = "list"
+    CLEAR = "clear"
+    PURGE = "purge"  # Remove decisions made under outdated weights/strategies
+
+    @classmethod
+    def all_values(cls) -> tuple[str, ...]:
+        """Return all subcommand names."""
+        return (cls.INFO, cls.LIST, cls.CLEAR, cls.PURGE)
+
+
 class DateFormats:
     """Date and time format constants."""
 
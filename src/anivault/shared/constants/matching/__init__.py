@@ -50,6 +50,7 @@ class DefaultLanguage:
 class ConfidenceThresholds:
     """Confidence threshold constants for matching."""
 
+    EXACT_MATCH = 1.0
     HIGH = 0.8
     MEDIUM = 0.5
     LOW = 0.2
@@ -100,6 +101,26 @@ class FallbackStrategy:
 
     TIMEOUT = 5.0 * BASE_SECOND
     MAX_ATTEMPTS = 3
+    # Strategies only re-score the best candidates of the ranked list
+    TOP_K = 5
+    # Declared relative cost per strategy (cheaper strategies run first)
+    DEFAULT_COST = 100
+    COST_GENRE_BOOST = 10
+    COST_PARTIAL_MATCH = 50
+
+
+class LocalTitleIndexConfig:
+    """Offline title index (TMDB daily ID export) configuration."""
+
+    NGRAM_SIZE = 3
+    # Candidates kept after n-gram overlap counting, before rapidfuzz scoring
+    CANDIDATE_POOL = 200
+    # n-grams shared by more titles than this are skipped when rarer ones exist
+    MAX_POSTING_LENGTH = 20000
+    MIN_SCORE = 90.0
+    MAX_CANDIDATES = 3
+    TV_EXPORT_PATTERN = "tv_series_ids_*.json.gz"
+    MOVIE_EXPORT_PATTERN = "movie_ids_*.json.gz"
 
 
 class GenreConfig:
@@ -115,6 +136,7 @@ __all__ = [
     "DefaultLanguage",
     "FallbackStrategy",
     "GenreConfig",
+    "LocalTitleIndexConfig",
     "MatchingAlgorithm",
     "MatchingFieldNames",
     "TitleNormalization",
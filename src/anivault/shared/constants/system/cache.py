@@ -9,6 +9,7 @@ class Cache:
     TYPE_SEARCH = "search"
     TYPE_DETAILS = "details"
     TYPE_PARSER = "parser"
+    TYPE_MATCH = "match"
 
     # Cache TTL values (in seconds)
     DEFAULT_TTL = 3600  # 1 hour
@@ -24,6 +24,9 @@ class FileSystem:
     CACHE_BACKEND = "memory"
     HOME_DIR = ".anivault"
     CACHE_DIRECTORY = "cache"
+    MATCH_STATE_FILE = "match_state.json"
+    MATCH_SCAN_CACHE_FILE = "match_scan_cache.json"
+    TITLE_SIGNATURE_CACHE_FILE = "title_minhash_signatures.npz"
     OUTPUT_DIRECTORY = "output"
     RESULTS_DIRECTORY = "results"
 
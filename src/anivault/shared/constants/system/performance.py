@@ -59,5 +59,12 @@ class Performance:
     SAMPLE_RATE = 0.1  # 10% sampling
     REPORT_INTERVAL = 60  # 60 seconds
 
+    # Streaming latency histograms (StatisticsCollector)
+    HISTOGRAM_MIN_SECONDS = 1e-6  # Values below share the first bucket
+    HISTOGRAM_MAX_SECONDS = 3600.0  # Values above share the last bucket
+    HISTOGRAM_RELATIVE_ERROR = 0.01  # Percentile accuracy (1%)
+    MAX_ACTIVE_TIMINGS = 64  # Open start_timing() calls kept per context
+    MAX_FILE_METRICS = 1000  # Most recent per-file match records kept
+
 
 __all__ = ["Batch", "Memory", "Performance", "Process", "Timeout"]
@@ -13,6 +13,7 @@ from .tmdb_models import (
     TMDBMediaDetails,
     TMDBSearchResponse,
     TMDBSearchResult,
+    TMDBSeason,
 )
 
 __all__ = [
@@ -24,4 +25,5 @@ __all__ = [
     "TMDBMediaDetails",
     "TMDBSearchResponse",
     "TMDBSearchResult",
+    "TMDBSeason",
 ]
@@ -8,6 +8,7 @@ from .tmdb import (
     TMDBMediaDetails,
     TMDBSearchResponse,
     TMDBSearchResult,
+    TMDBSeason,
 )
 
 __all__ = [
@@ -18,4 +19,5 @@ __all__ = [
     "TMDBMediaDetails",
     "TMDBSearchResponse",
     "TMDBSearchResult",
+    "TMDBSeason",
 ]
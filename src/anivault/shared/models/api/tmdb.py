@@ -101,6 +101,18 @@ class TMDBEpisode(BaseDataclass):
     still_path: str | None = None
 
 
+@dataclass
+class TMDBSeason(BaseDataclass):
+    """TMDB TV season summary (from TV details ``seasons``)."""
+
+    id: int
+    season_number: int
+    name: str = ""
+    episode_count: int = 0
+    air_date: str | None = None
+    poster_path: str | None = None
+
+
 @dataclass
 class TMDBMediaDetails(BaseDataclass):
     """TMDB media details (movie or TV show)."""
@@ -123,6 +135,10 @@ class TMDBMediaDetails(BaseDataclass):
     number_of_episodes: int | None = None
     number_of_seasons: int | None = None
     last_episode_to_air: TMDBEpisode | None = None
+    seasons: list[TMDBSeason] = field(default_factory=list)
+    # Sub-resources requested via append_to_response (flattened by the search strategy)
+    alternative_titles: list[str] = field(default_factory=list)
+    external_ids: dict[str, str] = field(default_factory=dict)
 
     @property
     def display_title(self) -> str:
@@ -143,4 +159,5 @@ __all__ = [
     "TMDBMediaDetails",
     "TMDBSearchResponse",
     "TMDBSearchResult",
+    "TMDBSeason",
 ]
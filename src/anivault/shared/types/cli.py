@@ -17,7 +17,7 @@ from pathlib import Path
 
 from pydantic import BaseModel, Field, conint, field_validator
 
-from anivault.shared.constants import FileSystem, RunDefaults
+from anivault.shared.constants import FileSystem, MatchCacheCommands, RunDefaults
 
 # CLI option type aliases
 # Note: Using simple assignment instead of TypeAlias for Python 3.9 compatibility
@@ -127,6 +127,10 @@ class MatchOptions(BaseModel):
         default=False,
         description="Force re-matching of existing files",
     )
+    incremental: bool = Field(
+        default=False,
+        description="Only re-match new, modified or previously unmatched files",
+    )
     recursive: bool = Field(default=True, description="Recursive matching")
     include_subtitles: bool = Field(default=True, description="Include subtitles")
     include_metadata: bool = Field(default=True, description="Include metadata")
@@ -174,6 +178,26 @@ class LogOptions(BaseModel):
         return v
 
 
+class MatchCacheOptions(BaseModel):
+    """Match-cache command options validation model."""
+
+    cache_command: str = Field(
+        ...,
+        description="Match cache command to execute (info, list, clear, purge)",
+    )
+    limit: int = Field(default=20, gt=0, description="Maximum number of entries to list")
+
+    @field_validator("cache_command")
+    @classmethod
+    def validate_cache_command(cls, v: str) -> str:
+        """Validate match cache command."""
+        valid_commands = MatchCacheCommands.all_values()
+        if v not in valid_commands:
+            msg = f"Invalid match cache command '{v}'. Must be one of: {', '.join(valid_commands)}"
+            raise ValueError(msg)
+        return v
+
+
 class VerifyOptions(BaseModel):
     """Verify command options validation model."""
 
@@ -212,6 +236,10 @@ class RunOptions(BaseModel):
     skip_scan: bool = Field(default=False, description="Skip scanning step")
     skip_match: bool = Field(default=False, description="Skip matching step")
     skip_organize: bool = Field(default=False, description="Skip organization step")
+    incremental: bool = Field(
+        default=False,
+        description="Only re-match new, modified or previously unmatched files",
+    )
     max_workers: int = Field(
         default=RunDefaults.DEFAULT_MAX_WORKERS,
         description="Maximum number of worker threads",